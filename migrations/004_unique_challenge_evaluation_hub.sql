@@ -0,0 +1,9 @@
+-- Migration: Add UNIQUE index on challenge_evaluations(challenge_hub_id)
+-- Purpose: One evaluation per challenge; start_evaluation relies on the constraint instead of a pre-check
+-- Note: Fails if duplicate evaluations exist; list them with the query below and clean up first
+
+-- SELECT challenge_hub_id, COUNT(*) FROM challenge_evaluations
+-- GROUP BY challenge_hub_id HAVING COUNT(*) > 1;
+
+CREATE UNIQUE INDEX IF NOT EXISTS ux_challenge_evaluations_hub
+ON challenge_evaluations(challenge_hub_id);
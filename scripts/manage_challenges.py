@@ -8,7 +8,7 @@ import os
 import sys
 import argparse
 import sqlite3
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 # Add project root to path
@@ -34,6 +34,52 @@ from src.core.settings import get_settings
 
 console = Console()
 
+# Sık çalıştırılan sorgular: sabit metinler sayesinde sqlite3 statement cache'inden
+# (connect(cached_statements=...)) yeniden derlenmeden kullanılırlar.
+SQL_UPDATE_STATUS = "UPDATE challenge_hubs SET status = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?"
+SQL_DELETE_PARTICIPANTS = "DELETE FROM challenge_participants WHERE challenge_hub_id = ?"
+SQL_DELETE_SUBMISSIONS = "DELETE FROM challenge_submissions WHERE challenge_hub_id = ?"
+SQL_DELETE_EVALUATORS = """
+    DELETE FROM challenge_evaluators AS cev
+    WHERE cev.evaluation_id IN (SELECT e.id FROM challenge_evaluations AS e WHERE e.challenge_hub_id = ?)
+"""
+SQL_DELETE_EVALUATIONS = "DELETE FROM challenge_evaluations WHERE challenge_hub_id = ?"
+SQL_DELETE_HUB = "DELETE FROM challenge_hubs WHERE id = ?"
+SQL_USER_OPEN_CHALLENGES = """
+    SELECT ch.id, ch.status, 'participant' AS role FROM challenge_hubs ch
+    JOIN challenge_participants cp ON ch.id = cp.challenge_hub_id
+    WHERE cp.user_id = ? AND ch.status IN ('recruiting', 'active')
+    UNION ALL
+    SELECT id, status, 'creator' AS role FROM challenge_hubs
+    WHERE creator_id = ? AND status IN ('recruiting', 'active')
+"""
+SQL_REMOVE_USER_FROM_OPEN_CHALLENGES = """
+    DELETE FROM challenge_participants
+    WHERE user_id = ? AND challenge_hub_id IN (
+        SELECT id FROM challenge_hubs WHERE status IN ('recruiting', 'active')
+    )
+"""
+SQL_CANCEL_USER_CHALLENGES = """
+    UPDATE challenge_hubs SET status = 'cancelled'
+    WHERE creator_id = ? AND status IN ('recruiting', 'active')
+"""
+SCHEMA_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_challenge_evaluations_hub ON challenge_evaluations(challenge_hub_id)",
+    "CREATE INDEX IF NOT EXISTS idx_challenge_evaluators_evaluation ON challenge_evaluators(evaluation_id)",
+    "CREATE INDEX IF NOT EXISTS idx_challenge_participants_user ON challenge_participants(user_id)",
+    "CREATE INDEX IF NOT EXISTS idx_challenge_participants_hub ON challenge_participants(challenge_hub_id)",
+)
+
+# Liste görünümü için durum renkleri; hücre metinleri satır başına yeniden üretilmez.
+STATUS_STYLE = {
+    'active': 'bold green',
+    'recruiting': 'bold yellow',
+    'completed': 'bold blue',
+    'evaluating': 'bold purple',
+    'failed': 'red',
+}
+STATUS_CELL = {k: f"[{v}]{k.upper()}[/{v}]" for k, v in STATUS_STYLE.items()}
+
 class ChallengeManager:
     def __init__(self):
         self.settings = get_settings()
@@ -47,13 +93,30 @@ class ChallengeManager:
         self.slack_client = WebClient(token=self.settings.slack_bot_token)
         self.user_client = WebClient(token=self.settings.slack_user_token) if self.settings.slack_user_token else None
 
+        # Tüm işlemler için tek bir kalıcı bağlantı (her komutta yeniden açmak yerine)
+        self.conn = sqlite3.connect(self.db_path, cached_statements=256)
+        self.conn.row_factory = sqlite3.Row
+        # Bot checkpoint/yazma yaparken hata vermek yerine 5 sn'ye kadar bekle
+        self.conn.execute("PRAGMA busy_timeout=5000")
+        # WAL: CLI okumaları bot'u bloklamaz; NORMAL: commit başına tek fsync
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA wal_autocheckpoint=1000")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-64000")
+
         # Şema uyum kontrolü (kritik kolonlar eksikse otomatik ekle)
         self._ensure_schema()
 
     def get_connection(self):
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Paylaşılan kalıcı bağlantıyı döndürür."""
+        return self.conn
+
+    def close(self):
+        """Kalıcı bağlantıyı kapatır."""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
 
     def _ensure_schema(self):
         """
@@ -96,6 +159,12 @@ class ChallengeManager:
             if alter_statements:
                 conn.commit()
                 console.print("[green]✅ Veritabanı şeması otomatik olarak güncellendi.[/green]")
+
+            # CLI sorgularının (evaluator silme, reset-user, liste sayımı) index seek ile çalışması için gereken index'ler
+            # (init_db ile aynı isimler; bot hiç başlatılmamış eski DB'lerde de garanti olsun)
+            with conn:
+                for stmt in SCHEMA_INDEXES:
+                    cursor.execute(stmt)
             
             # Gereksiz kolon kontrolü (canvas_id - kodda kullanılmıyor)
             if "canvas_id" in cols:
@@ -103,34 +172,66 @@ class ChallengeManager:
                 console.print("[yellow]   Bu kolon __main__.py'deki ensure_database_schema() tarafından otomatik temizlenecektir.[/yellow]")
         except Exception as e:
             console.print(f"[bold red]⚠️ Şema kontrolü sırasında hata: {e}[/bold red]")
-        finally:
-            try:
-                conn.close()
-            except Exception:
-                pass
+
+    def _resolve_id(self, short: str) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Kısa (prefix) veya tam challenge ID'sini çözer ve (id, theme) döndürür.
+        Prefix araması LIKE yerine yarı açık aralık sorgusu ile yapılır (PK index'i kullanılır).
+        Bulunamazsa None döner, prefix birden fazla kayıtla eşleşirse ValueError fırlatır.
+        """
+        # ID'ler küçük harf hex; aralık karşılaştırması büyük-küçük harf duyarlı olduğundan normalize edilir
+        short = (short or "").strip().lower()
+        if not short:
+            return None
+
+        cursor = self.get_connection().cursor()
+        if len(short) >= 30:
+            cursor.execute("SELECT id, theme FROM challenge_hubs WHERE id = ?", (short,))
+        else:
+            upper = short[:-1] + chr(ord(short[-1]) + 1)
+            cursor.execute(
+                "SELECT id, theme FROM challenge_hubs WHERE id >= ? AND id < ? LIMIT 2",
+                (short, upper)
+            )
+        rows = cursor.fetchall()
+
+        if not rows:
+            return None
+        if len(rows) > 1:
+            raise ValueError(f"Ambiguous challenge ID prefix: {short}")
+        return rows[0]['id'], rows[0]['theme']
+
+    def _resolve_or_report(self, challenge_id: str) -> Optional[Tuple[str, Optional[str]]]:
+        """_resolve_id sonucunu döndürür; bulunamama/belirsizlik durumunu ekrana basar."""
+        try:
+            resolved = self._resolve_id(challenge_id)
+        except ValueError as e:
+            console.print(f"[bold red]❌ {e}[/bold red]")
+            return None
+        if not resolved:
+            console.print(f"[bold red]❌ Challenge not found: {challenge_id}[/bold red]")
+        return resolved
 
     def list_challenges(self, status: Optional[str] = None, limit: int = 20):
         """List challenges with optional status filter."""
         conn = self.get_connection()
         cursor = conn.cursor()
 
-        query = "SELECT * FROM challenge_hubs"
+        where = ""
         params = []
         
         if status and status.lower() != 'all':
-            query += " WHERE status = ?"
+            where = " WHERE ch.status = ?"
             params.append(status.lower())
-        
-        query += " ORDER BY created_at DESC LIMIT ?"
         params.append(limit)
 
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
-
-        if not rows:
-            console.print("[yellow]⚠️ No challenges found matches your criteria.[/yellow]")
-            return
+        # Katılımcı sayısı aynı sorguda LEFT JOIN + GROUP BY ile hesaplanır
+        # (ayrı sayım sorgusu ve Python tarafında dict birleştirme yok).
+        query = (
+            "SELECT ch.*, COUNT(cp.user_id) AS p_count FROM challenge_hubs ch "
+            "LEFT JOIN challenge_participants cp ON cp.challenge_hub_id = ch.id"
+            f"{where} GROUP BY ch.id ORDER BY ch.created_at DESC LIMIT ?"
+        )
 
         table = Table(title=f"🏆 Challenge List ({status if status else 'All'})")
         
@@ -141,34 +242,26 @@ class ChallengeManager:
         table.add_column("Team", justify="right")
         table.add_column("Created At", style="dim")
 
-        for row in rows:
-            # Format status color
-            status_style = "white"
+        # fetchall() ile listeye almadan cursor üzerinden satır satır işle
+        cursor.execute(query, params)
+        for row in cursor:
             s = row['status']
-            if s == 'active': status_style = "bold green"
-            elif s == 'recruiting': status_style = "bold yellow"
-            elif s == 'completed': status_style = "bold blue"
-            elif s == 'evaluating': status_style = "bold purple"
-            elif s == 'failed': status_style = "red"
-
-            # Count participants
-            conn2 = self.get_connection()
-            cur2 = conn2.cursor()
-            cur2.execute("SELECT COUNT(*) as count FROM challenge_participants WHERE challenge_hub_id = ?", (row['id'],))
-            p_count = cur2.fetchone()['count']
-            conn2.close()
-            
+            status_cell = STATUS_CELL.get(s) or f"[white]{s.upper()}[/white]"
             created_at = row['created_at'][:16] if row['created_at'] else "N/A"
 
             table.add_row(
                 row['id'][:8],
-                f"[{status_style}]{s.upper()}[/{status_style}]",
+                status_cell,
                 row['theme'] or "TBD",
                 row['creator_id'],
-                f"{p_count}/{row['team_size'] or 0}",
+                f"{row['p_count']}/{row['team_size'] or 0}",
                 created_at
             )
 
+        if not table.row_count:
+            console.print("[yellow]⚠️ No challenges found matches your criteria.[/yellow]")
+            return
+
         console.print(table)
 
     def get_challenge_info(self, challenge_id: str):
@@ -176,26 +269,18 @@ class ChallengeManager:
         conn = self.get_connection()
         cursor = conn.cursor()
 
-        # Try to find by short ID first (startswith)
-        if len(challenge_id) < 30:
-            cursor.execute("SELECT * FROM challenge_hubs WHERE id LIKE ?", (f"{challenge_id}%",))
-        else:
-            cursor.execute("SELECT * FROM challenge_hubs WHERE id = ?", (challenge_id,))
-            
-        challenge = cursor.fetchone()
-        
-        if not challenge:
-            console.print(f"[bold red]❌ Challenge not found: {challenge_id}[/bold red]")
-            conn.close()
+        resolved = self._resolve_or_report(challenge_id)
+        if not resolved:
             return
 
-        full_id = challenge['id']
+        full_id = resolved[0]
+        cursor.execute("SELECT * FROM challenge_hubs WHERE id = ?", (full_id,))
+        challenge = cursor.fetchone()
         
         # Get Participants
         cursor.execute("SELECT * FROM challenge_participants WHERE challenge_hub_id = ?", (full_id,))
         participants = cursor.fetchall()
         
-        conn.close()
 
         # Display
         console.print(Panel(f"[bold cyan]🔍 Challenge Details: {full_id}[/bold cyan]"))
@@ -223,26 +308,16 @@ class ChallengeManager:
         valid_statuses = ['recruiting', 'active', 'evaluating', 'completed', 'failed', 'cancelled']
         if new_status.lower() not in valid_statuses:
             console.print(f"[bold red]❌ Invalid status. Choose from: {', '.join(valid_statuses)}[/bold red]")
-            conn.close()
             return
 
         # Handle Short ID
-        target_id = challenge_id
-        if len(challenge_id) < 30:
-             cursor.execute("SELECT id FROM challenge_hubs WHERE id LIKE ?", (f"{challenge_id}%",))
-             row = cursor.fetchone()
-             if row:
-                 target_id = row['id']
-             else:
-                 console.print(f"[bold red]❌ Challenge not found: {challenge_id}[/bold red]")
-                 conn.close()
-                 return
+        resolved = self._resolve_or_report(challenge_id)
+        if not resolved:
+            return
+        target_id = resolved[0]
 
         try:
-            cursor.execute(
-                "UPDATE challenge_hubs SET status = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?", 
-                (new_status.lower(), target_id)
-            )
+            cursor.execute(SQL_UPDATE_STATUS, (new_status.lower(), target_id))
             conn.commit()
             
             if cursor.rowcount > 0:
@@ -251,9 +326,27 @@ class ChallengeManager:
                  console.print(f"[bold red]❌ Challenge not found or update failed.[/bold red]")
                  
         except Exception as e:
+            conn.rollback()
             console.print(f"[bold red]❌ Database error: {e}[/bold red]")
-        finally:
-            conn.close()
+
+    def _delete_challenge_rows(self, challenge_ids: List[str]):
+        """
+        Verilen challenge'ları ve tüm çocuk kayıtlarını tek transaction içinde siler.
+        Her tablo için tek executemany: sorgu bir kez hazırlanır, ID'ler yeniden bağlanır.
+        """
+        params = [(cid,) for cid in challenge_ids]
+        # Şema ON DELETE CASCADE tanımlı, ancak bu bağlantıda foreign_keys
+        # zorunlu olmadığından (import/restore akışları) çocuk tablolar açıkça silinir.
+        with self.conn:
+            cursor = self.conn.cursor()
+            # Delete children first
+            cursor.executemany(SQL_DELETE_PARTICIPANTS, params)
+            cursor.executemany(SQL_DELETE_SUBMISSIONS, params)
+            cursor.executemany(SQL_DELETE_EVALUATORS, params)
+            cursor.executemany(SQL_DELETE_EVALUATIONS, params)
+
+            # Delete parent
+            cursor.executemany(SQL_DELETE_HUB, params)
 
     def delete_challenge(self, challenge_id: str, confirm: bool = False):
         """Delete a challenge and all related data."""
@@ -261,30 +354,17 @@ class ChallengeManager:
         cursor = conn.cursor()
         
         # Handle Short ID
-        target_id = challenge_id
-        theme = "Unknown"
-        
-        if len(challenge_id) < 30:
-             cursor.execute("SELECT id, theme FROM challenge_hubs WHERE id LIKE ?", (f"{challenge_id}%",))
-             row = cursor.fetchone()
-             if row:
-                 target_id = row['id']
-                 theme = row['theme']
-             else:
-                 console.print(f"[bold red]❌ Challenge not found: {challenge_id}[/bold red]")
-                 conn.close()
-                 return
-        else:
-            cursor.execute("SELECT theme FROM challenge_hubs WHERE id = ?", (target_id,))
-            row = cursor.fetchone()
-            if row: theme = row['theme']
+        resolved = self._resolve_or_report(challenge_id)
+        if not resolved:
+            return
+        target_id, theme = resolved
+        theme = theme or "Unknown"
 
         if not confirm:
             console.print(f"[bold red]⚠️  WARNING: You are about to DELETE challenge {target_id[:8]} ({theme})[/bold red]")
             val = input("Type 'yes' to confirm: ")
             if val.lower() != 'yes':
                 print("Operation cancelled.")
-                conn.close()
                 return
 
         try:
@@ -306,21 +386,13 @@ class ChallengeManager:
                 with open(os.path.join(log_dir, "deleted_challenges.log"), "a", encoding="utf-8") as f:
                     f.write(json.dumps(backup_data, ensure_ascii=False) + "\n")
 
-            # Delete children first
-            cursor.execute("DELETE FROM challenge_participants WHERE challenge_hub_id = ?", (target_id,))
-            cursor.execute("DELETE FROM challenge_evaluators WHERE evaluation_id IN (SELECT id FROM challenge_evaluations WHERE challenge_hub_id = ?)", (target_id,))
-            cursor.execute("DELETE FROM challenge_evaluations WHERE challenge_hub_id = ?", (target_id,))
-            
-            # Delete parent
-            cursor.execute("DELETE FROM challenge_hubs WHERE id = ?", (target_id,))
-            conn.commit()
+            self._delete_challenge_rows([target_id])
             
             console.print(f"[bold green]✅ Challenge deleted successfully! (A safety backup was saved to logs/deleted_challenges.log)[/bold green]")
 
         except Exception as e:
+            conn.rollback()
             console.print(f"[bold red]❌ Error: {e}[/bold red]")
-        finally:
-            conn.close()
 
     def reset_user(self, user_id: str):
         """
@@ -332,38 +404,26 @@ class ChallengeManager:
         
         console.print(f"[yellow]🔍 Checking active challenges for user: {user_id}...[/yellow]")
         
-        # 1. As Participant
-        cursor.execute("""
-            SELECT ch.id, ch.status FROM challenge_hubs ch
-            JOIN challenge_participants cp ON ch.id = cp.challenge_hub_id
-            WHERE cp.user_id = ? AND ch.status IN ('recruiting', 'active')
-        """, (user_id,))
-        
-        rows = cursor.fetchall()
-        
-        if rows:
-            for row in rows:
+        # Katılımcı ve kurucu kayıtları tek UNION ALL sorgusu ile
+        has_participant = has_creator = False
+        cursor.execute(SQL_USER_OPEN_CHALLENGES, (user_id, user_id))
+        for row in cursor:
+            if row['role'] == 'participant':
+                has_participant = True
                 console.print(f"   found as participant in: {row['id'][:8]} ({row['status']})")
-                # Remove participant record
-                cursor.execute("DELETE FROM challenge_participants WHERE challenge_hub_id = ? AND user_id = ?", (row['id'], user_id))
-                console.print(f"   [green]Removed from participant list.[/green]")
-        
-        # 2. As Creator
-        cursor.execute("""
-            SELECT id, status FROM challenge_hubs 
-            WHERE creator_id = ? AND status IN ('recruiting', 'active')
-        """, (user_id,))
-        
-        rows = cursor.fetchall()
-        if rows:
-            for row in rows:
+            else:
+                has_creator = True
                 console.print(f"   found as creator of: {row['id'][:8]} ({row['status']})")
-                # Force status to cancelled
-                cursor.execute("UPDATE challenge_hubs SET status = 'cancelled' WHERE id = ?", (row['id'],))
-                console.print(f"   [green]Challenge cancelled.[/green]")
 
-        conn.commit()
-        conn.close()
+        # Satır satır yerine iki küme bazlı ifade, tek transaction (tek commit)
+        with conn:
+            if has_participant:
+                cursor.execute(SQL_REMOVE_USER_FROM_OPEN_CHALLENGES, (user_id,))
+                console.print(f"   [green]Removed from {cursor.rowcount} participant list(s).[/green]")
+            if has_creator:
+                cursor.execute(SQL_CANCEL_USER_CHALLENGES, (user_id,))
+                console.print(f"   [green]{cursor.rowcount} challenge(s) cancelled.[/green]")
+
         console.print(f"[bold green]✅ User {user_id} has been reset. They can now start/join new challenges.[/bold green]")
 
     def clear_all_challenges(self, skip_confirm=False):
@@ -414,7 +474,6 @@ class ChallengeManager:
             confirm = input("\n👉 Devam etmek için 'EVET' yazın: ")
             if confirm != "EVET":
                 console.print("[yellow]❌ İşlem iptal edildi.[/yellow]")
-                conn.close()
                 return
         
         try:
@@ -461,8 +520,6 @@ class ChallengeManager:
                 cursor.execute("PRAGMA foreign_keys = ON")
             except:
                 pass
-        finally:
-            conn.close()
 
     def check_stuck_users(self):
         """Find users who might be stuck in 'active' challenges for too long."""
@@ -485,7 +542,6 @@ class ChallengeManager:
         
         cursor.execute(query, (cutoff,))
         rows = cursor.fetchall()
-        conn.close()
         
         if not rows:
             console.print("[green]✅ No stuck users found. Everyone is within limits.[/green]")
@@ -556,7 +612,6 @@ class ChallengeManager:
             
             if not themes:
                 console.print("[red]❌ No themes found in database. Cannot create challenge.[/red]")
-                conn.close()
                 return
 
             console.print("\n[bold]Select Theme:[/bold]")
@@ -588,7 +643,6 @@ class ChallengeManager:
             confirm = input("\n🚀 Proceed with import? (y/n): ")
             if confirm.lower() != 'y':
                 console.print("[yellow]Import cancelled.[/yellow]")
-                conn.close()
                 return
 
             # 7. Insert Hub
@@ -619,12 +673,12 @@ class ChallengeManager:
                 """, (str(uuid.uuid4()), hub_id, m_id, 'member' if m_id != creator_id else 'lead'))
                 
             conn.commit()
-            conn.close()
             console.print(f"[bold green]✅ Success! Channel imported as challenge ID: {hub_id[:8]}[/bold green]")
             
         except SlackApiError as e:
             console.print(f"[bold red]❌ Slack API Error: {e.response['error']}[/bold red]")
         except Exception as e:
+            self.conn.rollback()
             console.print(f"[bold red]❌ Error: {e}[/bold red]")
 
     def manual_create_challenge(self):
@@ -687,11 +741,11 @@ class ChallengeManager:
                 """, (str(uuid.uuid4()), hub_id, m_id, 'member' if m_id != creator_id else 'lead'))
                 
             conn.commit()
-            conn.close()
             
             console.print(f"[bold green]✅ Success! Manual record created with Hub ID: {hub_id[:12]}...[/bold green]")
             
         except Exception as e:
+            self.conn.rollback()
             console.print(f"[bold red]❌ Error during manual creation: {e}[/bold red]")
 
     def export_challenge(self, challenge_id: str):
@@ -700,22 +754,16 @@ class ChallengeManager:
         cursor = conn.cursor()
         
         # Handle Short ID
-        target_id = challenge_id
-        if len(challenge_id) < 30:
-             cursor.execute("SELECT id FROM challenge_hubs WHERE id LIKE ?", (f"{challenge_id}%",))
-             row = cursor.fetchone()
-             if row: target_id = row['id']
-             else:
-                 console.print(f"[bold red]❌ Challenge not found: {challenge_id}[/bold red]")
-                 conn.close()
-                 return
+        resolved = self._resolve_or_report(challenge_id)
+        if not resolved:
+            return
+        target_id = resolved[0]
         
         # 1. Hub
         cursor.execute("SELECT * FROM challenge_hubs WHERE id = ?", (target_id,))
         hub_row = cursor.fetchone()
         if not hub_row:
              console.print(f"[bold red]❌ Challenge not found: {challenge_id}[/bold red]")
-             conn.close()
              return
         hub = dict(hub_row)
         
@@ -735,7 +783,6 @@ class ChallengeManager:
             cursor.execute(f"SELECT * FROM challenge_evaluators WHERE evaluation_id IN ({placeholders})", eval_ids)
             evaluators = [dict(row) for row in cursor.fetchall()]
             
-        conn.close()
         
         data = {
             "type": "challenge_backup",
@@ -815,8 +862,6 @@ class ChallengeManager:
             except Exception as e:
                 conn.rollback()
                 console.print(f"[bold red]❌ Restoration failed: {e}[/bold red]")
-            finally:
-                conn.close()
                 
         except json.JSONDecodeError as e:
             console.print(f"[bold red]❌ Error: Invalid JSON syntax. {e}[/bold red]")
@@ -827,7 +872,14 @@ class ChallengeManager:
 def interactive_menu():
     """Show interactive menu."""
     manager = ChallengeManager()
-    
+    try:
+        _menu_loop(manager)
+    finally:
+        manager.close()
+
+
+def _menu_loop(manager: "ChallengeManager"):
+    """Interaktif menü döngüsü."""
     while True:
         console.clear()
         console.print(Panel.fit("[bold cyan]🤖 Cemil Bot Challenge Manager v2.0[/bold cyan]", border_style="cyan"))
@@ -936,7 +988,8 @@ def interactive_menu():
             input("\nPress Enter to continue...")
 
 
-def main():
+def build_parser() -> argparse.ArgumentParser:
+    """CLI modu için argparse yapısını kurar (interaktif modda hiç oluşturulmaz)."""
     parser = argparse.ArgumentParser(description="Challenge Management Tool")
     subparsers = parser.add_subparsers(dest="command", help="Command to execute")
 
@@ -974,7 +1027,11 @@ def main():
     clear_parser = subparsers.add_parser("clear-all", help="Clear all challenge data (start fresh)")
     clear_parser.add_argument("--yes", action="store_true", help="Skip confirmation")
 
-    # Eğer argüman verilmemişse interaktif moda geç
+    return parser
+
+
+def main():
+    # Eğer argüman verilmemişse parser kurmadan doğrudan interaktif moda geç
     if len(sys.argv) == 1:
         try:
             interactive_menu()
@@ -982,10 +1039,18 @@ def main():
             console.print("\n[yellow]Exiting...[/yellow]")
         return
 
+    parser = build_parser()
     args = parser.parse_args()
     
     manager = ChallengeManager()
+    try:
+        run_command(manager, args, parser)
+    finally:
+        manager.close()
+
 
+def run_command(manager: ChallengeManager, args, parser):
+    """Argparse ile gelen alt komutu çalıştırır."""
     if args.command == "list":
         manager.list_challenges(args.status, args.limit)
     elif args.command == "info":
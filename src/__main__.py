@@ -3,10 +3,12 @@ import os
 import time
 import signal
 import atexit
+import threading
+from dataclasses import dataclass
 
 # Kullanıcıya anında geri bildirim ver
 print("\n[INIT] Cemil Bot başlatılıyor...")
-print("[INIT] Gerekli yapay zeka kütüphaneleri (Torch, SciPy, Transformers) yükleniyor. Bu işlem ilk seferde biraz zaman alabilir, lütfen bekleyin...\n")
+print("[INIT] Yapay zeka kütüphaneleri (Torch, Transformers) ilk ihtiyaç anında arka planda yüklenecek.\n")
 
 # Proje kök dizinini sys.path'e ekle
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -16,7 +18,117 @@ from slack_bolt.adapter.socket_mode import SocketModeHandler
 import asyncio
 from src.core.logger import logger
 from src.core.settings import get_settings
-from dotenv import load_dotenv
+from src.core.async_loop import stop_loop
+
+# Başlangıç mesajının statik blokları (modül yüklenirken bir kez oluşturulur)
+STARTUP_BLOCKS = [
+    {
+        "type": "header",
+        "text": {
+            "type": "plain_text",
+            "text": "👋 Merhabalar! Ben Cemil, Yapay Zeka Akademisi'nin yardımcı asistanıyım!",
+            "emoji": True
+        }
+    },
+    {
+        "type": "section",
+        "text": {
+            "type": "mrkdwn",
+            "text": "Topluluk etkileşimini artırmak, öğrenmeyi desteklemek ve işlerinizi kolaylaştırmak için buradayım. Aşağıda tüm özelliklerim ve nasıl kullanılacağı detaylıca açıklanmıştır."
+        }
+    },
+    {"type": "divider"},
+    {
+        "type": "header",
+        "text": {
+            "type": "plain_text",
+            "text": "🎯 Ana Özellikler",
+            "emoji": True
+        }
+    },
+    {
+        "type": "section",
+        "fields": [
+            {
+                "type": "mrkdwn",
+                "text": "*☕ Kahve Eşleşmesi*\n*Komut:* `/kahve`\n*Kullanım:* Komutu çalıştırın, başka biri de kahve isterse otomatik eşleşirsiniz."
+            },
+            {
+                "type": "mrkdwn",
+                "text": "*🆘 Yardım Sistemi*\n*Komut:* `/yardim-iste <konu> <açıklama>`\n*Kullanım:* Yardıma ihtiyacınız olduğunda komutu kullanın."
+            }
+        ]
+    },
+    {
+        "type": "section",
+        "fields": [
+            {
+                "type": "mrkdwn",
+                "text": "*🚀 Challenge Hub*\n*Komut:* `/challenge start <takım>`\n*Kullanım:* Challenge başlatın, diğerleri katılır."
+            },
+            {
+                "type": "mrkdwn",
+                "text": "*🧠 Bilgi Küpü (RAG)*\n*Komut:* `/sor <soru>`\n*Kullanım:* Akademi dökümanları hakkında soru sorun."
+            }
+        ]
+    },
+    {
+        "type": "section",
+        "fields": [
+            {
+                "type": "mrkdwn",
+                "text": "*🗳️ Oylama* (Admin)\n*Komut:* `/oylama <konu> <seçenekler>`\n*Kullanım:* Admin olarak anket başlatın."
+            },
+            {
+                "type": "mrkdwn",
+                "text": "*📝 Geri Bildirim*\n*Komut:* `/geri-bildirim <mesaj>`\n*Kullanım:* Anonim fikir/öneri gönderin."
+            }
+        ]
+    },
+    {
+        "type": "section",
+        "fields": [
+            {
+                "type": "mrkdwn",
+                "text": "*👤 Profil*\n*Komut:* `/profilim`\n*Kullanım:* Kayıtlı bilgilerinizi görüntüleyin."
+            },
+            {
+                "type": "mrkdwn",
+                "text": "*📊 Admin İstatistik*\n*Komut:* `/admin-istatistik` | `/admin-basarili-projeler`"
+            }
+        ]
+    },
+    {
+        "type": "section",
+        "fields": [
+            {
+                "type": "mrkdwn",
+                "text": "*📅 Günlük Pratik & Motivasyon*\n*Komut:* `/daily english` | `/daily motivasyon`\n*Kullanım:* İngilizce pratik veya motivasyon mesajı alırsınız."
+            },
+            {
+                "type": "mrkdwn",
+                "text": "*🏥 Bot Sağlık*\n*Komut:* `/cemil-health`\n*Kullanım:* Bot'un çalışma durumunu kontrol edin."
+            }
+        ]
+    },
+    {"type": "divider"},
+    {
+        "type": "section",
+        "text": {
+            "type": "mrkdwn",
+            "text": "*💡 İpuçları:*\n• Challenge'lar takım çalışması odaklıdır\n• Yardım ve kahve kanalları otomatik kapanır\n• Bilgi küpü sadece Türkçe cevap verir"
+        }
+    },
+    {
+        "type": "context",
+        "elements": [
+            {
+                "type": "mrkdwn",
+                "text": "Güzel bir gün dilerim! ✨ <!channel>"
+            }
+        ]
+    }
+]
 
 def ensure_database_schema():
     """
@@ -179,10 +291,16 @@ def graceful_shutdown(signum=None, frame=None):
         except Exception as e:
             logger.warning(f"[!] Zamanlayıcılar durdurulurken hata: {e}")
         
-        # 3. Veritabanı bağlantılarını kapat (SQLite otomatik kapanır ama yine de kontrol edelim)
+        # 3. Paylaşılan async loop'u durdur
+        stop_loop()
+
+        # 4. Veritabanı bağlantı havuzunu kapat
         logger.info("[>] Veritabanı bağlantıları kapatılıyor...")
-        # SQLite connection'lar context manager ile otomatik kapanır
-        logger.info("[+] Veritabanı bağlantıları temizlendi.")
+        try:
+            db_client.close_all()
+            logger.info("[+] Veritabanı bağlantıları temizlendi.")
+        except Exception as e:
+            logger.warning(f"[!] Veritabanı bağlantıları kapatılırken hata: {e}")
         
         logger.info("[+] Graceful shutdown tamamlandı. Görüşmek üzere! 👋")
         print("\n[+] Bot başarıyla kapatıldı. Görüşmek üzere! 👋\n")
@@ -193,12 +311,83 @@ def graceful_shutdown(signum=None, frame=None):
     finally:
         sys.exit(0)
 
+def start_knowledge_indexing(action: str) -> threading.Thread:
+    """Bilgi Küpü indekslemesini arka plan thread'inde başlatır."""
+    def _run():
+        logger.info("[>] Bilgi Küpü indeksleniyor (arka plan)...")
+        try:
+            settings = get_settings()
+            asyncio.run(knowledge_service.process_knowledge_base(
+                folder_path=settings.knowledge_base_path,
+                concurrency=settings.kb_read_concurrency
+            ))
+            logger.info(f"[+] Vektör veritabanı başarıyla {action}.")
+        except Exception as e:
+            logger.error(f"[X] Bilgi Küpü indeksleme hatası: {e}", exc_info=True)
+
+    thread = threading.Thread(target=_run, name="knowledge-indexer", daemon=True)
+    thread.start()
+    return thread
+
+CSV_PATH = "data/initial_users.csv"
+
+@dataclass(frozen=True)
+class BootstrapState:
+    """Açılışta bir kez hesaplanan dosya durumları."""
+    csv_exists: bool
+    vector_index_exists: bool
+
+def _preflight(settings) -> BootstrapState:
+    """Gerekli klasörleri oluşturur ve boot kararları için dosya kontrollerini tek seferde yapar."""
+    for directory in ("data", settings.knowledge_base_path, "logs"):
+        os.makedirs(directory, exist_ok=True)
+    return BootstrapState(
+        csv_exists=os.path.exists(CSV_PATH),
+        vector_index_exists=os.path.exists(settings.vector_store_path) and os.path.exists(settings.vector_store_pkl_path),
+    )
+
+def _create_users_csv_template():
+    """CSV yoksa örnek veriyle şablon oluşturur."""
+    print(f"\n[i] '{CSV_PATH}' dosyası bulunamadı. Şablon oluşturuluyor...")
+    try:
+        with open(CSV_PATH, 'w', encoding='utf-8') as f:
+            f.write("Slack ID,First Name,Surname,Full Name,Birthday,Cohort\n")
+            f.write("U12345,Ahmet,Yilmaz,Ahmet Yilmaz,01.01.1990,Yapay Zeka\n")
+        print(f"[+] Şablon oluşturuldu: {CSV_PATH}")
+        print("[i] Not: Şablon içinde örnek veri bulunmaktadır.")
+    except Exception as e:
+        logger.error(f"[X] Şablon oluşturma hatası: {e}")
+
+def _import_users_csv():
+    """CSV dosyası varsa her zaman otomatik içe aktarır."""
+    print(f"\n[?] '{CSV_PATH}' dosyası bulundu.")
+    print("[i] CSV verileri otomatik içe aktarılıyor...")
+    try:
+        count = user_repo.import_from_csv(CSV_PATH)
+        print(f"[+] Başarılı! {count} kullanıcı eklendi.")
+    except Exception as e:
+        logger.error(f"[X] Import hatası: {e}")
+        print("Hata oluştu, logları kontrol edin.")
+
+def _use_existing_vector_index(settings):
+    """Mevcut vektör indeksini kullanır ya da (Settings gereği) arka planda yeniden oluşturur."""
+    print(f"\n[?] Vektör veritabanı bulundu (mevcut veriler: {len(vector_client.documents) if vector_client.documents else 0} parça).")
+    if settings.kb_rebuild_index:
+        print("[i] Vektör veritabanı arka planda yeniden oluşturuluyor (Settings gereği)...")
+        start_knowledge_indexing("güncellendi")
+    else:
+        print("[i] Mevcut vektör veritabanı kullanılıyor.")
+        logger.info("[i] Mevcut vektör veritabanı yüklendi.")
+
+def _build_missing_vector_index():
+    """Vektör veritabanı yoksa arka planda oluşturur."""
+    print("\n[i] Vektör veritabanı bulunamadı. Arka planda oluşturuluyor...")
+    start_knowledge_indexing("oluşturuldu")
+
 def main():
     """Cemil Bot'u başlatan ana fonksiyon."""
     global handler
     
-    load_dotenv()
-    
     # Signal handler'ları kaydet
     signal.signal(signal.SIGINT, graceful_shutdown)
     signal.signal(signal.SIGTERM, graceful_shutdown)
@@ -206,15 +395,21 @@ def main():
     # Ayrıca atexit ile de kaydet (program normal sonlanırsa)
     atexit.register(graceful_shutdown)
     
-    # Settings kontrolü - .env dosyası yüklendikten sonra yeniden yükle
+    # Settings kontrolü - .env, src.bot import edilirken zaten yüklendi; önbellekteki settings kullanılır
     try:
-        # bot.py'de import edilirken settings oluşturulmuş olabilir, .env yüklendikten sonra yeniden yükle
-        settings = get_settings(reload=True)  # .env yüklendikten sonra yeniden yükle
+        settings = get_settings()
         logger.info(f"[i] Settings yüklendi - Startup Channel: {settings.startup_channel or 'Tanımlı değil'}")
     except Exception as e:
         logger.error(f"[X] Konfigürasyon yükleme hatası: {e}")
         logger.error("[X] Lütfen .env dosyasını kontrol edin!")
         return
+
+    # Boot akışındaki tüm kararlar (CSV, vektör indeksi, başlangıç mesajı) Settings'ten okunur.
+    # Non-interactive modda stdin bağlanmaz: gözden kaçmış bir prompt container'ı
+    # süresiz bekletmek yerine EOFError ile hemen düşer.
+    if NON_INTERACTIVE:
+        sys.stdin = open(os.devnull, "r")
+        logger.info("[i] Non-interactive mod: stdin devre dışı, tüm kararlar Settings'ten alınıyor.")
     
     print("\n" + "="*60)
     print("           CEMIL BOT - HIZLI BAŞLATMA (PROD)")
@@ -239,62 +434,25 @@ def main():
     else:
         logger.info("[i] Challenge tabloları temizlenmedi (Settings: False).")
     
-    # --- CSV Veri İçe Aktarma Kontrolü ---
-    # Klasörlerin varlığını kontrol et
-    os.makedirs("data", exist_ok=True)
-    os.makedirs(settings.knowledge_base_path, exist_ok=True)
-    os.makedirs("logs", exist_ok=True)
-    
-    CSV_PATH = "data/initial_users.csv"
-    
-    if not os.path.exists(CSV_PATH):
-        # Şablon dosya oluştur
-        print(f"\n[i] '{CSV_PATH}' dosyası bulunamadı. Şablon oluşturuluyor...")
-        try:
-            with open(CSV_PATH, 'w', encoding='utf-8') as f:
-                f.write("Slack ID,First Name,Surname,Full Name,Birthday,Cohort\n")
-                f.write("U12345,Ahmet,Yilmaz,Ahmet Yilmaz,01.01.1990,Yapay Zeka\n")
-            print(f"[+] Şablon oluşturuldu: {CSV_PATH}")
-            print(f"[i] Not: Şablon içinde örnek veri bulunmaktadır.")
-        except Exception as e:
-            logger.error(f"[X] Şablon oluşturma hatası: {e}")
-    else:
-        # Dosya var → her zaman otomatik içe aktar
-        print(f"\n[?] '{CSV_PATH}' dosyası bulundu.")
-        print("[i] CSV verileri otomatik içe aktarılıyor...")
-        try:
-            count = user_repo.import_from_csv(CSV_PATH)
-            print(f"[+] Başarılı! {count} kullanıcı eklendi.")
-        except Exception as e:
-            logger.error(f"[X] Import hatası: {e}")
-            print("Hata oluştu, logları kontrol edin.")
-    # -------------------------------------
+    # --- CSV ve Vektör İndeksi Hazırlığı ---
+    # Dosya kontrolleri tek seferde yapılır, ardından tablo üzerinden ilgili aksiyon çalışır.
+    # İndeksleme (embedding) CPU yoğun, Slack/cron açılışı ise I/O yoğun.
+    # Bu yüzden indeksleme arka plan thread'inde yürür; cron ve Slack beklemez.
+    # İndeks hazır olana kadar /sor sadece boş sonuç görür.
+    state = _preflight(settings)
+    bootstrap_steps = (
+        # (etiket, mevcut mu, mevcutsa, yoksa)
+        ("1. CSV", state.csv_exists, _import_users_csv, _create_users_csv_template),
+        ("2. Vektör", state.vector_index_exists, lambda: _use_existing_vector_index(settings), _build_missing_vector_index),
+    )
+    for label, exists, on_present, on_missing in bootstrap_steps:
+        logger.debug("[>] %s adımı (mevcut: %s)", label, exists)
+        (on_present if exists else on_missing)()
 
-    # 2. Cron
+    # 3. Cron (indeksleme ile paralel)
     logger.info("[>] Zamanlayıcılar başlatılıyor...")
     cron_client.start()
-
-    # 3. Vektör Veritabanı Kontrolü
-    vector_index_exists = os.path.exists(settings.vector_store_path) and os.path.exists(settings.vector_store_pkl_path)
-    
-    if vector_index_exists:
-        # Mevcut veriler var
-        print(f"\n[?] Vektör veritabanı bulundu (mevcut veriler: {len(vector_client.documents) if vector_client.documents else 0} parça).")
-        
-        if settings.kb_rebuild_index:
-            print("[i] Vektör veritabanı yeniden oluşturuluyor (Settings gereği)...")
-            logger.info("[>] Bilgi Küpü indeksleniyor...")
-            asyncio.run(knowledge_service.process_knowledge_base())
-            print("[+] Vektör veritabanı başarıyla güncellendi.")
-        else:
-            print("[i] Mevcut vektör veritabanı kullanılıyor.")
-            logger.info("[i] Mevcut vektör veritabanı yüklendi.")
-    else:
-        # Vektör veritabanı yok, oluştur
-        print(f"\n[i] Vektör veritabanı bulunamadı. Oluşturuluyor...")
-        logger.info("[>] Bilgi Küpü indeksleniyor...")
-        asyncio.run(knowledge_service.process_knowledge_base())
-        print("[+] Vektör veritabanı başarıyla oluşturuldu.")
+    logger.info("[+] %s zamanlanmış görev aktif.", cron_client.count_jobs())
 
     # 4. Slack
     if not settings.slack_app_token:
@@ -303,11 +461,8 @@ def main():
 
     logger.info("[>] Slack Bağlantısı kuruluyor...")
     
-    # Başlangıç Mesajı Kontrolü - Settings'i yeniden yükle (.env güncellenmiş olabilir)
-    # bot.py import edilirken settings oluşturulmuş olabilir, .env yüklendikten sonra yeniden yükle
-    settings = get_settings(reload=True)
+    # Başlangıç Mesajı Kontrolü
     startup_channel = settings.startup_channel
-    github_repo = settings.github_repo
     
     logger.info(f"[i] Startup channel kontrolü: {startup_channel or 'Tanımlı değil'}")
     
@@ -320,204 +475,10 @@ def main():
         if settings.slack_send_welcome_message:
             print(f"    [>] Başlangıç mesajı GÖNDERİLİYOR (Settings: True)...")
             try:
-                startup_text = (
-                    "👋 *Merhabalar! Ben Cemil, Yapay Zeka Akademisi'nin yardımcı asistanıyım!* ☀️\n\n"
-                    "Topluluk etkileşimini artırmak, öğrenmeyi desteklemek ve işlerinizi kolaylaştırmak için buradayım.\n\n"
-                    "🎯 *Ana Özelliklerim:*\n\n"
-                    
-                    "☕ *Kahve Eşleşmesi*\n"
-                    "• *Komut:* `/kahve`\n"
-                    "• *Nasıl Kullanılır:* Komutu çalıştırın, başka biri de kahve isterse otomatik eşleşirsiniz.\n"
-                    "• *Ne Olur:* Özel bir kanal açılır, 5 dakika sohbet edebilirsiniz. Sonra kanal kapanır ve sohbet özeti DM'inize gelir.\n\n"
-                    
-                    "🆘 *Yardım Sistemi*\n"
-                    "• *Komut:* `/yardim-iste <konu> <açıklama>`\n"
-                    "• *Nasıl Kullanılır:* Yardıma ihtiyacınız olduğunda komutu kullanın.\n"
-                    "• *Ne Olur:* Yeni bir yardım kanalı açılır, topluluk üyeleri 'Yardım Et' butonuna tıklayarak katılabilir. Kanal 10 dakika sonra otomatik kapanır ve özet gönderilir.\n\n"
-                    
-                    "🚀 *Challenge Hub (Mini Hackathon)*\n"
-                    "• *Nasıl Başlar?* `/challenge start <takım_büyüklüğü>` (örn: `/challenge start 4`) komutu ile bir challenge başlatırsın.\n"
-                    "  - Cemil senin adına #challenge-hub'da bir ilan açar ve \"Challenge'a Katıl\" butonu ekler.\n"
-                    "  - Diğer bursiyerler butona tıklayarak veya `/challenge join` yazarak takıma katılabilir.\n"
-                    "• *Takım Nasıl Oluşur?* Takım boyutu (sen + katılımcılar) dolduğunda:\n"
-                    "  - Uygun temadan rastgele bir proje seçilir.\n"
-                    "  - Sadece takım için özel bir *challenge kanalı* açılır.\n"
-                    "  - Proje açıklaması, görevler, teslim edilecekler ve süre bu kanala detaylı bir mesaj olarak gönderilir.\n"
-                    "• *Challenge Süreci:*\n"
-                    "  - Belirlenen süre boyunca bu kanalda birlikte çalışırsınız (min 72 saatlik süre uygulanır).\n"
-                    "  - Kanal kuralları ve ipuçları ilk mesajlarda detaylıca anlatılır.\n"
-                    "• *Challenge Nasıl Biter?*\n"
-                    "  - Süre dolunca Cemil challenge'ı otomatik tamamlar, kanal arşivlenir.\n"
-                    "  - İsterseniz daha erken bitirmek için challenge kanalında \"bitir / finish / done\" yazabilirsiniz.\n"
-                    "• *Değerlendirme (Voting) Nasıl Çalışır?*\n"
-                    "  - Challenge tamamlandığında challenge kanalına \"📊 Projeyi Değerlendir\" butonu gelir.\n"
-                    "  - Bu butona basan en fazla 3 kişi için ayrı bir *değerlendirme kanalı* açılır (48 saat açık kalır).\n"
-                    "  - Değerlendirme kanalında:\n"
-                    "    • `/challenge set True` → Proje başarılı\n"
-                    "    • `/challenge set False` → Proje başarısız\n"
-                    "    • `/challenge set github <link>` → Projenin GitHub reposu (public olmalı)\n"
-                    "  - Challenge'ın *başarılı* sayılması için:\n"
-                    "    • True oyları, False oylarından fazla olmalı ve\n"
-                    "    • 48 saat içinde public bir GitHub linki eklenmiş olmalı.\n"
-                    "• *Admin Komutları:*\n"
-                    "  - `/admin-basarili-projeler` → Başarılı challenge'ları, ekipleri ve GitHub linklerini listeler.\n"
-                    "  - `/admin-istatistik` → Genel kullanım ve challenge istatistiklerini gösterir.\n\n"
-                    
-                    "🧠 *Bilgi Küpü (RAG Sistemi)*\n"
-                    "• *Komut:* `/sor <soru>`\n"
-                    "• *Nasıl Kullanılır:* Akademi dökümanları hakkında soru sorun.\n"
-                    "• *Ne Olur:* Bilgi küpündeki PDF'lerden ilgili bilgiler bulunur ve Türkçe cevap verilir.\n\n"
-                    
-                    "🗳️ *Oylama Sistemi* (Admin)\n"
-                    "• *Komut:* `/oylama <konu> <seçenek1> <seçenek2> ...`\n"
-                    "• *Nasıl Kullanılır:* Admin olarak anket başlatın, herkes oy verir.\n"
-                    "• *Ne Olur:* Anket mesajı gönderilir, kullanıcılar butonlara tıklayarak oy verir. Sonuçlar otomatik hesaplanır.\n\n"
-                    
-                    "📝 *Geri Bildirim Sistemi*\n"
-                    "• *Komut:* `/geri-bildirim <mesaj>`\n"
-                    "• *Nasıl Kullanılır:* Anonim olarak fikir, öneri veya şikayet gönderin.\n"
-                    "• *Ne Olur:* Mesajınız admin kanalına anonim olarak iletilir.\n\n"
-                    
-                    "👤 *Profil Görüntüleme*\n"
-                    "• *Komut:* `/profilim`\n"
-                    "• *Nasıl Kullanılır:* Sistemdeki kayıtlı bilgilerinizi görüntüleyin.\n\n"
-                    
-                    "📊 *Admin İstatistikleri* (Admin)\n"
-                    "• *Komut:* `/admin-istatistik` - Genel bot kullanım istatistiklerini görüntüle\n"
-                    "• *Komut:* `/admin-basarili-projeler` - Başarılı challenge projelerini, ekipleri ve GitHub linklerini görüntüle\n\n"
-                    
-                    "🏥 *Bot Sağlık Kontrolü*\n"
-                    "• *Komut:* `/cemil-health`\n"
-                    "• *Nasıl Kullanılır:* Bot'un çalışma durumunu kontrol edin.\n\n"
-                    
-                    "💡 *İpuçları:*\n"
-                    "• Tüm komutlar için `/help` yazabilirsiniz (yakında)\n"
-                    "• Challenge'lar için takım çalışması ve öğrenme odaklıdır\n"
-                    "• Yardım ve kahve kanalları otomatik kapanır, özetler DM'inize gelir\n"
-                    "• Bilgi küpü sadece Türkçe cevap verir\n\n"
-                    
-                    "Güzel bir gün dilerim! ✨"
-                )
-                
-                if github_repo and "SİZİN_KULLANICI_ADINIZ" not in github_repo:
-                    startup_text += f"\n\n📚 *Kaynaklar:*\n"
-                    startup_text += f"• <{github_repo}/blob/main/README.md|Kullanım Kılavuzu>\n"
-                    startup_text += f"• <{github_repo}/blob/main/CHANGELOG.md|Neler Yeni?>\n"
-                    startup_text += f"• <{github_repo}/blob/main/CONTRIBUTING.md|Katkıda Bulun>"
-                
-                startup_blocks = [
-                                    {
-                                        "type": "header",
-                                        "text": {
-                                            "type": "plain_text",
-                                            "text": "👋 Merhabalar! Ben Cemil, Yapay Zeka Akademisi'nin yardımcı asistanıyım!",
-                                            "emoji": True
-                                        }
-                                    },
-                                    {
-                                        "type": "section",
-                                        "text": {
-                                            "type": "mrkdwn",
-                                            "text": "Topluluk etkileşimini artırmak, öğrenmeyi desteklemek ve işlerinizi kolaylaştırmak için buradayım. Aşağıda tüm özelliklerim ve nasıl kullanılacağı detaylıca açıklanmıştır."
-                                        }
-                                    },
-                                    {"type": "divider"},
-                                    {
-                                        "type": "header",
-                                        "text": {
-                                            "type": "plain_text",
-                                            "text": "🎯 Ana Özellikler",
-                                            "emoji": True
-                                        }
-                                    },
-                                    {
-                                        "type": "section",
-                                        "fields": [
-                                            {
-                                                "type": "mrkdwn",
-                                                "text": "*☕ Kahve Eşleşmesi*\n*Komut:* `/kahve`\n*Kullanım:* Komutu çalıştırın, başka biri de kahve isterse otomatik eşleşirsiniz."
-                                            },
-                                            {
-                                                "type": "mrkdwn",
-                                                "text": "*🆘 Yardım Sistemi*\n*Komut:* `/yardim-iste <konu> <açıklama>`\n*Kullanım:* Yardıma ihtiyacınız olduğunda komutu kullanın."
-                                            }
-                                        ]
-                                    },
-                                    {
-                                        "type": "section",
-                                        "fields": [
-                                            {
-                                                "type": "mrkdwn",
-                                                "text": "*🚀 Challenge Hub*\n*Komut:* `/challenge start <takım>`\n*Kullanım:* Challenge başlatın, diğerleri katılır."
-                                            },
-                                            {
-                                                "type": "mrkdwn",
-                                                "text": "*🧠 Bilgi Küpü (RAG)*\n*Komut:* `/sor <soru>`\n*Kullanım:* Akademi dökümanları hakkında soru sorun."
-                                            }
-                                        ]
-                                    },
-                                    {
-                                        "type": "section",
-                                        "fields": [
-                                            {
-                                                "type": "mrkdwn",
-                                                "text": "*🗳️ Oylama* (Admin)\n*Komut:* `/oylama <konu> <seçenekler>`\n*Kullanım:* Admin olarak anket başlatın."
-                                            },
-                                            {
-                                                "type": "mrkdwn",
-                                                "text": "*📝 Geri Bildirim*\n*Komut:* `/geri-bildirim <mesaj>`\n*Kullanım:* Anonim fikir/öneri gönderin."
-                                            }
-                                        ]
-                                    },
-                                    {
-                                        "type": "section",
-                                        "fields": [
-                                            {
-                                                "type": "mrkdwn",
-                                                "text": "*👤 Profil*\n*Komut:* `/profilim`\n*Kullanım:* Kayıtlı bilgilerinizi görüntüleyin."
-                                            },
-                                            {
-                                                "type": "mrkdwn",
-                                                "text": "*📊 Admin İstatistik*\n*Komut:* `/admin-istatistik` | `/admin-basarili-projeler`"
-                                            }
-                                        ]
-                                    },
-                                    {
-                                        "type": "section",
-                                        "fields": [
-                                            {
-                                                "type": "mrkdwn",
-                                                "text": "*📅 Günlük Pratik & Motivasyon*\n*Komut:* `/daily english` | `/daily motivasyon`\n*Kullanım:* İngilizce pratik veya motivasyon mesajı alırsınız."
-                                            },
-                                            {
-                                                "type": "mrkdwn",
-                                                "text": "*🏥 Bot Sağlık*\n*Komut:* `/cemil-health`\n*Kullanım:* Bot'un çalışma durumunu kontrol edin."
-                                            }
-                                        ]
-                                    },
-                                    {"type": "divider"},
-                                    {
-                                        "type": "section",
-                                        "text": {
-                                            "type": "mrkdwn",
-                                            "text": "*💡 İpuçları:*\n• Challenge'lar takım çalışması odaklıdır\n• Yardım ve kahve kanalları otomatik kapanır\n• Bilgi küpü sadece Türkçe cevap verir"
-                                        }
-                                    },
-                                    {
-                                        "type": "context",
-                                        "elements": [
-                                            {
-                                                "type": "mrkdwn",
-                                                "text": "Güzel bir gün dilerim! ✨ <!channel>"
-                                            }
-                                        ]
-                                    }
-                                ]
-
                 chat_manager.post_message(
                     channel=startup_channel,
                     text="👋 Merhabalar! Ben Cemil, Yapay Zeka Akademisi'nin yardımcı asistanıyım!",
-                    blocks=startup_blocks,
+                    blocks=STARTUP_BLOCKS,
                     unfurl_links=True,
                     unfurl_media=True
                 )
@@ -5,15 +5,19 @@ Ana bot dosyası: Tüm servislerin entegrasyonu ve slash komutları
 """
 
 import os
+import queue
 import asyncio
+import threading
 from dotenv import load_dotenv
 from slack_bolt import App
 from slack_bolt.adapter.socket_mode import SocketModeHandler
 from slack_sdk import WebClient
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
 
 # --- Core & Clients ---
 from src.core.logger import logger
 from src.core.settings import get_settings
+from src.core.lazy import Lazy
 from src.clients import (
     DatabaseClient,
     GroqClient,
@@ -92,12 +96,21 @@ if not settings.slack_bot_token:
 
 app = App(token=settings.slack_bot_token)
 
+# Slack 429 (rate limit) yanıtlarında Retry-After kadar bekleyip tekrar dene;
+# eşzamanlı finalize/duyuru patlamalarında mesajlar düşmez
+SLACK_RATE_LIMIT_MAX_RETRIES = 2
+app.client.retry_handlers.append(RateLimitErrorRetryHandler(max_retry_count=SLACK_RATE_LIMIT_MAX_RETRIES))
+
 # ============================================================================
 # CLIENT İLKLENDİRME (Singleton Pattern)
 # ============================================================================
 
 logger.info("[i] Client'lar ilklendiriliyor...")
-db_client = DatabaseClient(db_path=settings.database_path)
+db_client = DatabaseClient(
+    db_path=settings.database_path,
+    pool_size=settings.db_pool_size,
+    mmap_size=settings.db_mmap_size
+)
 groq_client = GroqClient()
 cron_client = CronClient()
 vector_client = VectorClient()
@@ -114,6 +127,7 @@ logger.info("[i] Command Manager'lar ilklendiriliyor...")
 user_client = None
 if settings.slack_user_token:
     user_client = WebClient(token=settings.slack_user_token)
+    user_client.retry_handlers.append(RateLimitErrorRetryHandler(max_retry_count=SLACK_RATE_LIMIT_MAX_RETRIES))
     logger.info("[i] User token bulundu - kanal oluşturma ve erişim işlemleri için kullanılacak")
 else:
     logger.warning("[!] User token bulunamadı - workspace kısıtlamaları kanal oluşturmayı engelleyebilir")
@@ -156,18 +170,19 @@ coffee_service = CoffeeMatchService(
 voting_service = VotingService(
     chat_manager, poll_repo, vote_repo, cron_client
 )
-feedback_service = FeedbackService(
+# Nadiren kullanılan servisler ilk erişimde oluşturulur (Lazy)
+feedback_service = Lazy(lambda: FeedbackService(
     chat_manager, smtp_client, feedback_repo
-)
-knowledge_service = KnowledgeService(
+))
+knowledge_service = Lazy(lambda: KnowledgeService(
     vector_client, groq_client
-)
+))
 help_service = HelpService(
     chat_manager, conv_manager, user_manager, help_repo, user_repo, groq_client, cron_client
 )
-statistics_service = StatisticsService(
+statistics_service = Lazy(lambda: StatisticsService(
     user_repo, match_repo, help_repo, feedback_repo, poll_repo, vote_repo
-)
+))
 challenge_enhancement_service = ChallengeEnhancementService(
     groq_client, knowledge_service
 )
@@ -202,7 +217,10 @@ setup_knowledge_handlers(app, knowledge_service, chat_manager, user_repo)
 setup_profile_handlers(app, chat_manager, user_repo)
 setup_health_handlers(app, chat_manager, db_client, groq_client, vector_client)
 setup_help_handlers(app, help_service, chat_manager, user_repo)
-setup_statistics_handlers(app, statistics_service, chat_manager, user_repo)
+setup_statistics_handlers(
+    app, statistics_service, chat_manager, user_repo,
+    challenge_evaluation_repo, challenge_hub_repo, challenge_participant_repo, challenge_project_repo
+)
 setup_challenge_handlers(app, challenge_hub_service, challenge_evaluation_service, chat_manager, user_repo)
 setup_challenge_evaluation_handlers(app, challenge_evaluation_service, challenge_hub_service, chat_manager, user_repo)
 logger.info("[+] Handler'lar kaydedildi.")
@@ -211,27 +229,40 @@ logger.info("[+] Handler'lar kaydedildi.")
 # PERİYODİK GÖREVLER (Challenge Kanalı Yetkisiz Kullanıcı Kontrolü)
 # ============================================================================
 
-# Challenge kanallarını periyodik olarak kontrol et (her 1 dakikada bir)
+# Challenge kanallarını periyodik olarak uzlaştır (her 5 dakikada bir)
+# Birincil yol member_joined_channel event'idir; cron sadece kaçan üyelikleri yakalar.
 try:
     cron_client.add_cron_job(
         func=challenge_hub_service.monitor_challenge_channels,
-        cron_expression={"minute": "*/1"},  # Her 1 dakikada bir
+        cron_expression={"minute": "*/5"},  # Her 5 dakikada bir
         job_id="monitor_challenge_channels"
     )
-    logger.info("[+] Challenge kanalları periyodik kontrolü başlatıldı (her 1 dakikada bir)")
+    logger.info("[+] Challenge kanalları periyodik kontrolü başlatıldı (her 5 dakikada bir)")
 except Exception as e:
-    logger.warning(f"[!] Challenge kanalları periyodik kontrolü başlatılamadı: {e}")
+    logger.warning("[!] Challenge kanalları periyodik kontrolü başlatılamadı: %s", e)
 
 # Değerlendirmeleri periyodik olarak kontrol et (her 1 saatte bir)
-def check_pending_evaluations():
+# Finalize normalde deadline anındaki tek seferlik job ile çalışır; bu tarama
+# yeniden başlatma sonrası kaybolan job'lar için güvenlik ağıdır.
+async def check_pending_evaluations():
     """Deadline'ı geçmiş değerlendirmeleri finalize et."""
-    import asyncio
     try:
-        pending = challenge_evaluation_repo.get_pending_evaluations()
-        for evaluation in pending:
-            asyncio.run(challenge_evaluation_service.finalize_evaluation(evaluation["id"]))
+        # Ucuz COUNT ön kontrolü: bekleyen yoksa tam sorguya gerek yok
+        if not challenge_evaluation_repo.count_pending_evaluations():
+            return
+        pending_ids = challenge_evaluation_repo.get_pending_evaluation_ids()
+        if not pending_ids:
+            return
+        # Tüm finalize işlemleri paylaşılan loop'ta birlikte beklenir
+        results = await asyncio.gather(
+            *(challenge_evaluation_service.finalize_evaluation(evaluation_id) for evaluation_id in pending_ids),
+            return_exceptions=True
+        )
+        for evaluation_id, result in zip(pending_ids, results):
+            if isinstance(result, Exception):
+                logger.error("[X] Değerlendirme finalize hatası: %s | %s", evaluation_id, result, exc_info=result)
     except Exception as e:
-        logger.error(f"[X] Pending evaluations kontrolü hatası: {e}", exc_info=True)
+        logger.error("[X] Pending evaluations kontrolü hatası: %s", e, exc_info=True)
 
 try:
     cron_client.add_cron_job(
@@ -241,7 +272,26 @@ try:
     )
     logger.info("[+] Değerlendirme kontrolü başlatıldı (her 1 saatte bir)")
 except Exception as e:
-    logger.warning(f"[!] Değerlendirme kontrolü başlatılamadı: {e}")
+    logger.warning("[!] Değerlendirme kontrolü başlatılamadı: %s", e)
+
+# SQLite planlayıcı istatistiklerini güncelle (her gün 04:00'te)
+# Havuzdaki bağlantılar uzun yaşadığından "kapanışta optimize" tek başına yetmez.
+try:
+    cron_client.add_cron_job(
+        func=db_client.optimize,
+        cron_expression={"hour": "4", "minute": "0"},
+        job_id="db_optimize"
+    )
+    logger.info("[+] Veritabanı optimize görevi başlatıldı (her gün 04:00)")
+except Exception as e:
+    logger.warning("[!] Veritabanı optimize görevi başlatılamadı: %s", e)
+
+# Yeniden başlatmada kaybolan tek seferlik finalize job'larını DB'den geri kur
+try:
+    restored = challenge_evaluation_service.reschedule_finalize_jobs()
+    logger.info("[+] %s değerlendirme finalize job'ı yeniden planlandı", restored)
+except Exception as e:
+    logger.warning("[!] Finalize job'ları yeniden planlanamadı: %s", e)
 
 # Takımı dolmayan challenge'ları periyodik olarak kontrol et (her gün 03:00'da)
 try:
@@ -252,53 +302,86 @@ try:
     )
     logger.info("[+] Challenge recruitment zaman aşımı kontrolü başlatıldı (her gün 03:00)")
 except Exception as e:
-    logger.warning(f"[!] Challenge recruitment zaman aşımı kontrolü başlatılamadı: {e}")
+    logger.warning("[!] Challenge recruitment zaman aşımı kontrolü başlatılamadı: %s", e)
 
 # ============================================================================
 # EVENT HANDLERS (Challenge Kanalı Yetkisiz Kullanıcı Kontrolü)
 # ============================================================================
 
+# Join event'leri Bolt dispatcher thread'inde işlenmez; sınırlı bir kuyruğa alınıp
+# sabit sayıda worker thread tarafından işlenir (DB + Slack API çağrıları dispatcher'ı bloklamaz).
+MEMBER_JOIN_QUEUE_SIZE = 1024
+MEMBER_JOIN_WORKERS = 8
+_join_queue: "queue.Queue[tuple]" = queue.Queue(maxsize=MEMBER_JOIN_QUEUE_SIZE)
+
+
+# Not: Bu sıcak yoldaki loglar %-stili yazılır; seviye filtrelenirse mesaj hiç biçimlendirilmez.
+def _process_member_joined(channel_id: str, user_id: str):
+    """Challenge kanalına katılan kullanıcının yetkisini kontrol eder, gerekirse çıkarır."""
+    result = challenge_hub_service.check_and_remove_unauthorized_user(channel_id, user_id)
+    
+    if result.get("is_challenge_channel") and not result.get("is_authorized"):
+        action = result.get('action')
+        logger.info("[!] Yetkisiz kullanıcı tespit edildi: %s | Kanal: %s | Aksiyon: %s", user_id, channel_id, action)
+        
+        if action == "removed":
+            logger.info("[+] Yetkisiz kullanıcı başarıyla çıkarıldı: %s", user_id)
+        elif action == "failed_to_remove":
+            logger.error("[X] Yetkisiz kullanıcı çıkarılamadı: %s | Kanal: %s", user_id, channel_id)
+        elif action == "error":
+            logger.error("[X] Yetkisiz kullanıcı çıkarma işleminde hata: %s", result.get('error'))
+    elif result.get("is_challenge_channel") and result.get("is_authorized"):
+        logger.debug("[i] Yetkili kullanıcı kanala katıldı: %s | Kanal: %s", user_id, channel_id)
+    else:
+        logger.debug("[i] Challenge kanalı değil, işlem yapılmadı: %s", channel_id)
+
+
+def _member_join_worker():
+    """Kuyruktaki join event'lerini sırayla işler."""
+    while True:
+        channel_id, user_id = _join_queue.get()
+        try:
+            _process_member_joined(channel_id, user_id)
+        except Exception as e:
+            logger.error("[X] member_joined_channel event handler hatası: %s", e, exc_info=True)
+        finally:
+            _join_queue.task_done()
+
+
+for _i in range(MEMBER_JOIN_WORKERS):
+    threading.Thread(target=_member_join_worker, name=f"member-join-{_i}", daemon=True).start()
+
+
 @app.event("member_joined_channel")
 def handle_member_joined_channel(event, client):
     """
     Bir kullanıcı kanala katıldığında çağrılır.
-    Challenge kanalları için yetkisiz kullanıcıları tespit edip çıkarır.
+    Challenge kanalları için yetkisiz kullanıcıları tespit edip çıkarır (worker havuzunda).
     """
     try:
         channel_id = event.get("channel")
         user_id = event.get("user")
         
-        logger.info(f"[>] member_joined_channel event tetiklendi | Kullanıcı: {user_id} | Kanal: {channel_id}")
+        logger.info("[>] member_joined_channel event tetiklendi | Kullanıcı: %s | Kanal: %s", user_id, channel_id)
         
         if not channel_id or not user_id:
-            logger.warning(f"[!] member_joined_channel event'inde eksik bilgi | channel_id: {channel_id} | user_id: {user_id}")
+            logger.warning("[!] member_joined_channel event'inde eksik bilgi | channel_id: %s | user_id: %s", channel_id, user_id)
             return
 
-        # Challenge kanalı kontrolü ve yetkisiz kullanıcı çıkarma
-        result = challenge_hub_service.check_and_remove_unauthorized_user(channel_id, user_id)
-        
-        if result.get("is_challenge_channel") and not result.get("is_authorized"):
-            action = result.get('action')
-            logger.info(f"[!] Yetkisiz kullanıcı tespit edildi: {user_id} | Kanal: {channel_id} | Aksiyon: {action}")
-            
-            if action == "removed":
-                logger.info(f"[+] Yetkisiz kullanıcı başarıyla çıkarıldı: {user_id}")
-            elif action == "failed_to_remove":
-                logger.error(f"[X] Yetkisiz kullanıcı çıkarılamadı: {user_id} | Kanal: {channel_id}")
-            elif action == "error":
-                logger.error(f"[X] Yetkisiz kullanıcı çıkarma işleminde hata: {result.get('error')}")
-        elif result.get("is_challenge_channel") and result.get("is_authorized"):
-            logger.debug(f"[i] Yetkili kullanıcı kanala katıldı: {user_id} | Kanal: {channel_id}")
-        else:
-            logger.debug(f"[i] Challenge kanalı değil, işlem yapılmadı: {channel_id}")
+        _join_queue.put_nowait((channel_id, user_id))
         
+    except queue.Full:
+        logger.warning("[!] member_joined_channel kuyruğu dolu, event atlandı | Kullanıcı: %s | Kanal: %s", user_id, channel_id)
     except Exception as e:
-        logger.error(f"[X] member_joined_channel event handler hatası: {e}", exc_info=True)
+        logger.error("[X] member_joined_channel event handler hatası: %s", e, exc_info=True)
 
 # ============================================================================
 # GLOBAL HATA YÖNETİMİ
 # ============================================================================
 
+# Beklenmedik hatalarda kullanıcıya gösterilen sabit mesaj
+GLOBAL_ERROR_TEXT = "Şu an küçük bir teknik aksaklık yaşıyorum, biraz başım döndü. 🤕 Lütfen birkaç dakika sonra tekrar dener misin?"
+
 @app.error
 def global_error_handler(error, body, logger):
     """Tüm beklenmedik hataları yakalar ve loglar."""
@@ -306,7 +389,7 @@ def global_error_handler(error, body, logger):
     channel_id = body.get("channel", {}).get("id") or body.get("channel_id")
     trigger = body.get("command") or body.get("action_id") or "N/A"
     
-    logger.error(f"[X] GLOBAL HATA - Kullanıcı: {user_id} - Tetikleyici: {trigger} - Hata: {error}", exc_info=True)
+    logger.error("[X] GLOBAL HATA - Kullanıcı: %s - Tetikleyici: %s - Hata: %s", user_id, trigger, error, exc_info=True)
     
     # Kullanıcıya bilgi ver (Eğer kanal bilgisi varsa)
     if channel_id and user_id != "Bilinmiyor":
@@ -314,7 +397,7 @@ def global_error_handler(error, body, logger):
             chat_manager.post_ephemeral(
                 channel=channel_id,
                 user=user_id,
-                text="Şu an küçük bir teknik aksaklık yaşıyorum, biraz başım döndü. 🤕 Lütfen birkaç dakika sonra tekrar dener misin?"
+                text=GLOBAL_ERROR_TEXT
             )
         except Exception:
             pass # Hata mesajı gönderirken hata oluşursa yut
@@ -1,29 +1,43 @@
 import logging
 import asyncio
 from datetime import datetime, timedelta
-from typing import Callable, List, Dict, Any, Optional
-from apscheduler.schedulers.background import BackgroundScheduler
+from typing import Callable, List, Dict, Any, Optional, Iterator
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from src.core.logger import logger
 from src.core.exceptions import CemilBotError
 from src.core.singleton import SingletonMeta
+from src.core.async_loop import get_loop
+
+# Async cron görevleri için üst süre sınırı (saniye)
+ASYNC_JOB_TIMEOUT_SECONDS = 300
+
+# Geç kalan bir tetiklemenin hâlâ çalıştırılacağı süre (saniye)
+MISFIRE_GRACE_SECONDS = 60
 
 class CronClient(metaclass=SingletonMeta):
     """
     Cemil Bot için merkezi zamanlanmış görev (Cron) yönetim sınıfı.
-    BackgroundScheduler kullanarak işleri ayrı thread'lerde yönetir.
-    Async fonksiyonları otomatik olarak sarmalar.
+    AsyncIOScheduler paylaşılan arka plan loop'una bağlıdır: async görevler doğrudan
+    loop üzerinde await edilir, senkron görevler loop'un thread havuzunda çalışır.
     """
 
     def __init__(self):
-        self.scheduler = BackgroundScheduler()
+        # coalesce: kesinti sonrası kaçırılan tetiklemeler tek sefer çalışır (art arda yığılma olmaz)
+        self.scheduler = AsyncIOScheduler(
+            event_loop=get_loop(),
+            job_defaults={
+                "coalesce": True,
+                "misfire_grace_time": MISFIRE_GRACE_SECONDS,
+                "max_instances": 1
+            }
+        )
         self._is_running = False
-
     def start(self):
         """Zamanlayıcıyı başlatır."""
         if not self._is_running:
             self.scheduler.start()
             self._is_running = True
-            logger.info("[i] CronClient (BackgroundScheduler) başlatıldı.")
+            logger.info("[i] CronClient (AsyncIOScheduler) başlatıldı.")
 
     def shutdown(self, wait: bool = True):
         """Zamanlayıcıyı kapatır."""
@@ -33,11 +47,14 @@ class CronClient(metaclass=SingletonMeta):
             logger.info("[i] CronClient (Zamanlayıcı) kapatıldı.")
 
     def _wrap_async(self, func: Callable, args: List):
-        """Async fonksiyonları senkron wrapper içine alır."""
+        """Async fonksiyonları hata loglayan bir coroutine ile sarar (loop üzerinde doğrudan await edilir)."""
         if asyncio.iscoroutinefunction(func):
-            def wrapper(*a, **k):
+            async def wrapper(*a, **k):
                 try:
-                    asyncio.run(func(*a, **k))
+                    # Takılan bir görev paylaşılan loop'ta süresiz yer tutmasın
+                    await asyncio.wait_for(func(*a, **k), timeout=ASYNC_JOB_TIMEOUT_SECONDS)
+                except asyncio.TimeoutError:
+                    logger.error(f"[X] Async cron görevi zaman aşımına uğradı ({ASYNC_JOB_TIMEOUT_SECONDS} sn): {getattr(func, '__name__', func)}")
                 except Exception as e:
                     logger.error(f"[X] Async cron görevi hatası: {e}")
             return wrapper, args
@@ -105,16 +122,22 @@ class CronClient(metaclass=SingletonMeta):
             logger.warning(f"[!] Görev kaldırılırken hata (belki zaten bitti/silindi): {job_id}")
             return False
 
-    def list_jobs(self) -> List[Dict[str, Any]]:
-        """Tüm aktif görevleri listeler."""
-        jobs = self.scheduler.get_jobs()
-        job_list = []
-        for job in jobs:
-            job_list.append({
+    def count_jobs(self) -> int:
+        """Aktif görev sayısını döndürür (görev sözlükleri oluşturulmaz)."""
+        return len(self.scheduler.get_jobs())
+
+    def iter_jobs(self) -> Iterator[Dict[str, Any]]:
+        """Aktif görevleri tek tek üretir."""
+        for job in self.scheduler.get_jobs():
+            yield {
                 "id": job.id,
                 "next_run_time": str(job.next_run_time),
                 # Wrapper yüzünden orijinal fonksiyon ismini alamayabiliriz
                 "func": str(job.func)
-            })
-        logger.info(f"[i] Toplam {len(job_list)} aktif görev listelendi.")
+            }
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        """Tüm aktif görevleri listeler."""
+        job_list = list(self.iter_jobs())
+        logger.debug("[i] Toplam %s aktif görev listelendi.", len(job_list))
         return job_list
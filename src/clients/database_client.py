@@ -1,29 +1,339 @@
+import atexit
+import json
 import sqlite3
 import uuid
 import os
-from typing import List, Dict, Any, Optional
+import queue
+import secrets
+import time
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Set
 from src.core.logger import logger
 from src.core.exceptions import DatabaseError
 from src.core.singleton import SingletonMeta
 
+# Her yeni bağlantıda uygulanan PRAGMA'lar (bunlar bağlantıya özeldir, dosyada saklanmaz)
+# NOT: locking_mode = EXCLUSIVE burada kullanılmaz. Havuzdaki bağlantılar aynı süreçte eşzamanlı
+# çalışır; kilidi ilk alan bağlantı bırakmadığı için diğerleri "database is locked" hatası alır.
+# WAL modunda okumalar zaten paylaşımlı bellek (-shm) üzerinden dosya kilidi almadan yürür.
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -20000",  # ~20 MB sayfa önbelleği
+)
+
+# Varsayılan memory-mapped I/O boyutu (256 MB)
+DEFAULT_MMAP_SIZE = 268435456
+
+# Bağlantı başına hazırlanmış (prepared) ifade önbelleği boyutu (sqlite3 varsayılanı 128)
+STATEMENT_CACHE_SIZE = 256
+
+# users tablosunun hedef kolonları (sıra, kopyalama migration'ında kullanılır)
+_USER_COLUMNS = ('id', 'slack_id', 'first_name', 'middle_name', 'surname', 'full_name', 'birthday', 'cohort', 'created_at', 'updated_at')
+_REQUIRED_USER_COLS = frozenset(_USER_COLUMNS)
+
+# init_db şema sürümü (PRAGMA user_version). Yeni migration eklerken artırılır ve migration adımı
+# kendi sürümüne bağlanır (schema_version < N); CURRENT_SCHEMA_VERSION'a bağlanan adım her artışta yeniden çalışır
+CURRENT_SCHEMA_VERSION = 4
+
+# v4: challenge başına tek değerlendirme (migrations/004_unique_challenge_evaluation_hub.sql)
+UNIQUE_EVALUATION_HUB_SCHEMA_VERSION = 4
+
+# Eski FK'lı tabloların yeniden kurulumu ve kolon migration'larının tamamlandığı sürüm (migrations/001-003)
+LEGACY_SCHEMA_VERSION = 3
+
+# init_db tarafından tek executescript çağrısıyla çalıştırılan idempotent tablo tanımları
+SCHEMA_DDL = """
+-- Kullanıcılar Tablosu (Users)
+CREATE TABLE IF NOT EXISTS users (
+    id TEXT PRIMARY KEY,
+    slack_id TEXT UNIQUE,
+    first_name TEXT,
+    middle_name TEXT,
+    surname TEXT,
+    full_name TEXT,
+    birthday TEXT,
+    cohort TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Eşleşme Takip Tablosu (Matches)
+CREATE TABLE IF NOT EXISTS matches (
+    id TEXT PRIMARY KEY,
+    channel_id TEXT,
+    coffee_channel_id TEXT,
+    user1_id TEXT,
+    user2_id TEXT,
+    status TEXT DEFAULT 'active',
+    summary TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user1_id) REFERENCES users(slack_id) ON DELETE SET NULL,
+    FOREIGN KEY (user2_id) REFERENCES users(slack_id) ON DELETE SET NULL
+);
+
+-- Oylama Başlıkları Tablosu (Polls)
+CREATE TABLE IF NOT EXISTS polls (
+    id TEXT PRIMARY KEY,
+    topic TEXT,
+    options TEXT, -- JSON formatında seçenekler
+    result_summary TEXT, -- Oylama bittiğinde LLM özeti veya ham sonuç
+    creator_id TEXT,
+    allow_multiple INTEGER DEFAULT 0, -- Çoklu oy opsiyonu
+    is_closed INTEGER DEFAULT 0,
+    expires_at TIMESTAMP,
+    message_ts TEXT, -- Oylama mesajının timestamp'i (güncelleme için)
+    message_channel TEXT, -- Oylama mesajının kanalı
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Oylar Tablosu (Votes) - User & Poll Ara Tablo
+CREATE TABLE IF NOT EXISTS votes (
+    id TEXT PRIMARY KEY,
+    poll_id TEXT,
+    user_id TEXT,
+    option_index INTEGER,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(poll_id, user_id, option_index),
+    FOREIGN KEY (poll_id) REFERENCES polls(id) ON DELETE CASCADE,
+    FOREIGN KEY (user_id) REFERENCES users(slack_id) ON DELETE CASCADE
+);
+
+-- Anonim Geri Bildirim Tablosu (Feedbacks)
+CREATE TABLE IF NOT EXISTS feedbacks (
+    id TEXT PRIMARY KEY,
+    content TEXT,
+    category TEXT DEFAULT 'general',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Yardım İstekleri Tablosu (Help Requests)
+CREATE TABLE IF NOT EXISTS help_requests (
+    id TEXT PRIMARY KEY,
+    requester_id TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    description TEXT NOT NULL,
+    status TEXT DEFAULT 'open',
+    helper_id TEXT,
+    channel_id TEXT,
+    help_channel_id TEXT,
+    message_ts TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    resolved_at TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (requester_id) REFERENCES users(slack_id) ON DELETE CASCADE,
+    FOREIGN KEY (helper_id) REFERENCES users(slack_id) ON DELETE SET NULL
+);
+
+-- Challenge Themes (Temalar)
+CREATE TABLE IF NOT EXISTS challenge_themes (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    description TEXT,
+    icon TEXT,
+    difficulty_range TEXT,
+    is_active INTEGER DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Challenge Projects (Proje Şablonları)
+CREATE TABLE IF NOT EXISTS challenge_projects (
+    id TEXT PRIMARY KEY,
+    theme TEXT NOT NULL,
+    name TEXT NOT NULL,
+    description TEXT,
+    objectives TEXT,
+    deliverables TEXT,
+    tasks TEXT,
+    difficulty_level TEXT DEFAULT 'intermediate',
+    estimated_hours INTEGER DEFAULT 48,
+    min_team_size INTEGER DEFAULT 2,
+    max_team_size INTEGER DEFAULT 6,
+    learning_objectives TEXT,
+    skills_required TEXT,
+    skills_developed TEXT,
+    resources TEXT,
+    knowledge_base_refs TEXT,
+    llm_customizable INTEGER DEFAULT 1,
+    llm_enhancement_prompt TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Challenge Hubs (Ana Challenge'lar)
+CREATE TABLE IF NOT EXISTS challenge_hubs (
+    id TEXT PRIMARY KEY,
+    creator_id TEXT NOT NULL,
+    theme TEXT NOT NULL,
+    team_size INTEGER NOT NULL,
+    status TEXT DEFAULT 'recruiting',
+    challenge_channel_id TEXT,
+    hub_channel_id TEXT,
+    selected_project_id TEXT,
+    llm_customizations TEXT,
+    deadline_hours INTEGER DEFAULT 48,
+    difficulty TEXT DEFAULT 'intermediate',
+    deadline TIMESTAMP,
+    started_at TIMESTAMP,
+    completed_at TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (creator_id) REFERENCES users(slack_id) ON DELETE CASCADE
+);
+
+-- Challenge Participants (Katılımcılar)
+CREATE TABLE IF NOT EXISTS challenge_participants (
+    id TEXT PRIMARY KEY,
+    challenge_hub_id TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    role TEXT,
+    joined_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    points_earned INTEGER DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(challenge_hub_id, user_id),
+    FOREIGN KEY (challenge_hub_id) REFERENCES challenge_hubs(id) ON DELETE CASCADE,
+    FOREIGN KEY (user_id) REFERENCES users(slack_id) ON DELETE CASCADE
+);
+
+-- Challenge Submissions (Takım Çıktıları)
+CREATE TABLE IF NOT EXISTS challenge_submissions (
+    id TEXT PRIMARY KEY,
+    challenge_hub_id TEXT NOT NULL,
+    team_name TEXT,
+    project_name TEXT,
+    solution_summary TEXT,
+    deliverables TEXT,
+    learning_outcomes TEXT,
+    llm_enhanced_features TEXT,
+    submitted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    points_awarded INTEGER DEFAULT 0,
+    creativity_score INTEGER DEFAULT 0,
+    teamwork_score INTEGER DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (challenge_hub_id) REFERENCES challenge_hubs(id) ON DELETE CASCADE
+);
+
+-- Challenge Evaluations (Değerlendirme Sistemi)
+CREATE TABLE IF NOT EXISTS challenge_evaluations (
+    id TEXT PRIMARY KEY,
+    challenge_hub_id TEXT NOT NULL,
+    evaluation_channel_id TEXT,
+    github_repo_url TEXT,
+    github_repo_public INTEGER DEFAULT 0,
+    status TEXT DEFAULT 'pending',
+    true_votes INTEGER DEFAULT 0,
+    false_votes INTEGER DEFAULT 0,
+    final_result TEXT,
+    admin_approval TEXT DEFAULT 'pending',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    deadline_at TIMESTAMP,
+    completed_at TIMESTAMP,
+    FOREIGN KEY (challenge_hub_id) REFERENCES challenge_hubs(id) ON DELETE CASCADE
+);
+
+-- Challenge Evaluators (Değerlendiriciler)
+CREATE TABLE IF NOT EXISTS challenge_evaluators (
+    id TEXT PRIMARY KEY,
+    evaluation_id TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    vote TEXT,
+    voted_at TIMESTAMP,
+    FOREIGN KEY (evaluation_id) REFERENCES challenge_evaluations(id) ON DELETE CASCADE,
+    FOREIGN KEY (user_id) REFERENCES users(slack_id) ON DELETE CASCADE
+);
+
+-- User Challenge Stats (Kullanıcı İstatistikleri)
+CREATE TABLE IF NOT EXISTS user_challenge_stats (
+    user_id TEXT PRIMARY KEY,
+    total_challenges INTEGER DEFAULT 0,
+    completed_challenges INTEGER DEFAULT 0,
+    total_points INTEGER DEFAULT 0,
+    creativity_points INTEGER DEFAULT 0,
+    teamwork_points INTEGER DEFAULT 0,
+    favorite_theme TEXT,
+    last_challenge_date DATE,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(slack_id) ON DELETE CASCADE
+);
+"""
+
+# Seed data ifadeleri (sabit metin, bağlantının ifade önbelleğinden tekrar kullanılır)
+_SQL_INSERT_THEME = (
+    "INSERT OR IGNORE INTO challenge_themes (id, name, description, icon, difficulty_range, is_active) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+_SQL_INSERT_PROJECT = (
+    "INSERT OR IGNORE INTO challenge_projects "
+    "(id, theme, name, description, objectives, deliverables, tasks, difficulty_level, estimated_hours, min_team_size, max_team_size) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+class PooledConnection:
+    """
+    Havuzdan alınan sqlite3 bağlantısı için ince sarmalayıcı.
+    'with' bloğu sqlite3 semantiğini korur (commit/rollback), ardından bağlantıyı havuza iade eder.
+    close() da bağlantıyı kapatmak yerine havuza iade eder.
+    """
+
+    __slots__ = ("_conn", "_client")
+
+    def __init__(self, conn: sqlite3.Connection, client: "DatabaseClient"):
+        self._conn = conn
+        self._client = client
+
+    def __getattr__(self, name: str):
+        conn = self._conn
+        if conn is None:
+            raise sqlite3.ProgrammingError("Cannot operate on a released connection.")
+        return getattr(conn, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            if self._conn is not None:
+                self._conn.__exit__(exc_type, exc_val, exc_tb)
+        finally:
+            self.close()
+        return False
+
+    def close(self):
+        """Bağlantıyı havuza iade eder (idempotent)."""
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            self._client._release_connection(conn)
+
+
 class DatabaseClient(metaclass=SingletonMeta):
     """
     Cemil Bot için merkezi veritabanı yönetim sınıfı.
     SQLite bağlantı yönetiminden sorumludur.
     """
 
-    def __init__(self, db_path: str = "data/cemil_bot.db"):
+    def __init__(self, db_path: str = "data/cemil_bot.db", pool_size: int = 8, mmap_size: int = DEFAULT_MMAP_SIZE):
         """
         db_path:
             - Normalde settings.database_path üzerinden gelir.
             - Bazı ortamlarda env değişkeni boş string gelebilir (""), bu durumda
               default "data/cemil_bot.db" kullanılmalıdır.
+        pool_size:
+            - Havuzda açık tutulacak en fazla bağlantı sayısı (settings.db_pool_size).
+        mmap_size:
+            - Memory-mapped okuma için eşlenecek en fazla byte (settings.db_mmap_size, 0 = kapalı).
         """
         # Boş veya sadece whitespace bir yol geldiyse güvenli default'a dön
         if not db_path or not str(db_path).strip():
             db_path = "data/cemil_bot.db"
 
         self.db_path = db_path
+        # Açık bağlantı havuzu (her çağrıda connect/teardown maliyetini önler)
+        self.pool_size = max(1, pool_size)
+        self._pool: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=self.pool_size)
+        self._wal_enabled = False
+        self.mmap_size = max(0, int(mmap_size))
+        # graceful_shutdown'a uğramayan çıkışlarda da havuz PRAGMA optimize ile kapanır (close_all idempotent)
+        atexit.register(self.close_all)
 
         # Klasör yoksa oluştur (sadece geçerli bir dizin adı varsa)
         dir_name = os.path.dirname(db_path)
@@ -32,122 +342,304 @@ class DatabaseClient(metaclass=SingletonMeta):
 
         self.init_db()
 
-    def get_connection(self):
-        """SQLite bağlantısı döndürür."""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row  # Dict benzeri erişim için
-            # FOREIGN KEY desteğini etkinleştir (her connection için zorunlu)
+    @staticmethod
+    def new_id() -> str:
+        """
+        Zaman sıralı kayıt ID'si üretir: 12 hex milisaniye zaman damgası + 12 hex rastgele.
+        ID'ler milisaniye çözünürlüğünde oluşturulma sırasına göre sıralanır; B-tree'ye eklemeler
+        rastgele sayfalara dağılmak yerine ağacın sağ ucuna yapılır.
+        """
+        return f"{int(time.time() * 1000):012x}{secrets.token_hex(6)}"
+
+    def _create_connection(self) -> sqlite3.Connection:
+        """Yeni bir SQLite bağlantısı açar ve bağlantı seviyesindeki ayarları uygular."""
+        # Havuzdaki bağlantılar farklı thread'lerde (Bolt, cron, worker) kullanılır
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE)
+        conn.row_factory = sqlite3.Row  # Dict benzeri erişim için
+        # FOREIGN KEY desteğini etkinleştir (her connection için zorunlu)
+        conn.execute("PRAGMA foreign_keys = ON")
+        # Foreign key'lerin açık olduğunu doğrula
+        result = conn.execute("PRAGMA foreign_keys").fetchone()
+        if result and result[0] == 0:
+            logger.warning("[!] Foreign key'ler açılamadı, tekrar deniyor...")
             conn.execute("PRAGMA foreign_keys = ON")
-            # Foreign key'lerin açık olduğunu doğrula
-            result = conn.execute("PRAGMA foreign_keys").fetchone()
-            if result and result[0] == 0:
-                logger.warning("[!] Foreign key'ler açılamadı, tekrar deniyor...")
-                conn.execute("PRAGMA foreign_keys = ON")
-            return conn
+        # Bağlantı seviyesindeki performans ayarları (WAL ile NORMAL güvenlidir; commit başına fsync azalır)
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        # Okumalar read() + kopya yerine doğrudan sayfa önbelleğinden yapılır
+        conn.execute(f"PRAGMA mmap_size = {self.mmap_size}")
+        return conn
+
+    def _enable_wal(self, conn):
+        """
+        WAL modunu açar (veritabanı dosyasında kalıcıdır, bir kez yapılması yeterli).
+        Okuyucular yazıcıların arkasında beklemez.
+        """
+        if self._wal_enabled:
+            return
+        mode = conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+        self._wal_enabled = True
+        if str(mode).lower() != "wal":
+            logger.warning(f"[!] WAL modu açılamadı, journal_mode: {mode}")
+        else:
+            logger.debug("[+] SQLite journal_mode: WAL")
+
+    def get_connection(self) -> "PooledConnection":
+        """
+        Havuzdan bir SQLite bağlantısı döndürür (havuz boşsa yenisi açılır).
+        'with' bloğu bitince (veya close() çağrılınca) bağlantı kapatılmaz, havuza iade edilir.
+        """
+        try:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                conn = self._create_connection()
+            return PooledConnection(conn, self)
         except sqlite3.Error as e:
             logger.error(f"[X] Veritabanı bağlantı hatası: {e}")
             raise DatabaseError(f"Veritabanına bağlanılamadı: {e}")
 
+    def _release_connection(self, conn: sqlite3.Connection):
+        """Bağlantıyı havuza iade eder; havuz doluysa kapatır."""
+        try:
+            if conn.in_transaction:
+                # Commit edilmemiş iş bir sonraki kullanıcıya sızmasın
+                conn.rollback()
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            self._close_connection(conn)
+        except sqlite3.Error as e:
+            logger.warning(f"[!] Bağlantı havuza iade edilemedi, kapatılıyor: {e}")
+            conn.close()
+
+    def _close_connection(self, conn: sqlite3.Connection):
+        """
+        Bağlantıyı kapatmadan önce PRAGMA optimize çalıştırır.
+        SQLite bu bağlantının kullandığı sorgulara göre gerekiyorsa ANALYZE yapar.
+        """
+        try:
+            conn.execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            logger.debug(f"[i] PRAGMA optimize çalıştırılamadı: {e}")
+        finally:
+            conn.close()
+
+    def optimize(self):
+        """
+        Planlayıcı istatistiklerini günceller (PRAGMA optimize).
+        Havuzdaki bağlantılar uzun yaşadığı için periyodik olarak çağrılır.
+        """
+        try:
+            with self.get_connection() as conn:
+                conn.execute("PRAGMA optimize")
+            logger.debug("[+] PRAGMA optimize çalıştırıldı.")
+        except Exception as e:
+            logger.warning(f"[!] PRAGMA optimize hatası: {e}")
+
+    def close_all(self):
+        """Havuzdaki tüm bağlantıları kapatır (shutdown için)."""
+        while True:
+            try:
+                self._close_connection(self._pool.get_nowait())
+            except queue.Empty:
+                break
+
     def init_db(self):
         """Temel tabloları hazırlar (Gerekirse)."""
         try:
             with self.get_connection() as conn:
+                self._enable_wal(conn)
                 cursor = conn.cursor()
+                # Şema/migration sorguları kolonlara sadece indeksle erişir; sqlite3.Row sarmalayıcısına gerek yok
+                cursor.row_factory = None
                 # Foreign key'leri aç (tüm tablolar için)
                 cursor.execute("PRAGMA foreign_keys = ON")
+
+                # Şema sürümü güncelse kolon kontrolleri ve tablo yeniden kurulumları atlanır
+                schema_version = cursor.execute("PRAGMA user_version").fetchone()[0]
+                needs_migration = schema_version < CURRENT_SCHEMA_VERSION
+                # Yıkıcı yeniden kurulum yalnızca eski sürümler içindir; sonraki sürüm artışları tetiklememelidir
+                needs_legacy_migration = schema_version < LEGACY_SCHEMA_VERSION
                 
-                # Kullanıcılar Tablosu (Users)
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS users (
-                        id TEXT PRIMARY KEY,
-                        slack_id TEXT UNIQUE,
-                        first_name TEXT,
-                        middle_name TEXT,
-                        surname TEXT,
-                        full_name TEXT,
-                        birthday TEXT,
-                        cohort TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                
+                # Eski şemada users(id)'ye bağlı FK'lar vardı; bu tablolar users(slack_id)'ye bağlı olarak yeniden kurulur
+                if needs_legacy_migration:
+                    cursor.execute("DROP TABLE IF EXISTS matches")
+                    cursor.execute("DROP TABLE IF EXISTS votes")
+                    cursor.execute("DROP TABLE IF EXISTS help_requests")
+
+                # Idempotent CREATE TABLE'lar tek çağrıda (executescript bekleyen işlemi önce commit eder)
+                conn.executescript(SCHEMA_DDL)
+
+                # Kolon migration'ları tek bir yazma transaction'ında yürür (DDL'ler tek tek autocommit olmaz);
+                # sürüm damgasıyla birlikte commit edilir, hata olursa tümü geri alınır
+                if needs_migration:
+                    cursor.execute("BEGIN IMMEDIATE")
+                    # Tüm tabloların kolonları tek sorguda okunur (tablo başına PRAGMA table_info yerine)
+                    table_columns = self._get_table_columns(cursor)
+
                 # Migration: Gereksiz kolonları kaldır ve sadece gerekli kolonları bırak
-                cursor.execute("PRAGMA table_info(users)")
-                columns = [column[1] for column in cursor.fetchall()]
+                if needs_legacy_migration:
+                    columns = set(table_columns.get("users", ()))
                 
-                required_columns = ['id', 'slack_id', 'first_name', 'middle_name', 'surname', 'full_name', 'birthday', 'cohort', 'created_at', 'updated_at']
-                has_unnecessary_columns = any(col not in required_columns for col in columns)
-                missing_cohort = 'cohort' not in columns
-                missing_middle_name = 'middle_name' not in columns
-                has_department = 'department' in columns
+                    has_unnecessary_columns = bool(columns - _REQUIRED_USER_COLS)
+                    missing_cohort = 'cohort' not in columns
+                    missing_middle_name = 'middle_name' not in columns
+                    has_department = 'department' in columns
                 
-                # Eğer middle_name kolonu yoksa ekle
-                if missing_middle_name:
-                    logger.info("[i] middle_name kolonu ekleniyor...")
-                    cursor.execute("ALTER TABLE users ADD COLUMN middle_name TEXT")
-                    logger.info("[+] middle_name kolonu eklendi.")
+                    # Eğer middle_name kolonu yoksa ekle
+                    if missing_middle_name:
+                        logger.info("[i] middle_name kolonu ekleniyor...")
+                        cursor.execute("ALTER TABLE users ADD COLUMN middle_name TEXT")
+                        logger.info("[+] middle_name kolonu eklendi.")
+                        columns.add('middle_name')
                 
-                if has_unnecessary_columns or missing_cohort or has_department or missing_middle_name:
-                    logger.info("[i] Veritabanı şeması güncelleniyor...")
-                    # Yeni temiz tablo oluştur
-                    cursor.execute("DROP TABLE IF EXISTS users_new")
-                    cursor.execute("""
-                        CREATE TABLE users_new (
-                            id TEXT PRIMARY KEY,
-                            slack_id TEXT UNIQUE,
-                            first_name TEXT,
-                            middle_name TEXT,
-                            surname TEXT,
-                            full_name TEXT,
-                            birthday TEXT,
-                            cohort TEXT,
-                            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                        )
-                    """)
-                    
-                    # Mevcut verileri kopyala (sadece mevcut kolonlar varsa)
-                    if 'id' in columns and 'slack_id' in columns:
-                        # Department varsa cohort'a çevir, yoksa boş bırak
-                        if has_department:
-                            cursor.execute("""
-                                INSERT INTO users_new (id, slack_id, first_name, middle_name, surname, full_name, birthday, cohort, created_at, updated_at)
-                                SELECT 
-                                    id, 
-                                    slack_id, 
-                                    COALESCE(first_name, '') as first_name,
-                                    COALESCE(middle_name, '') as middle_name,
-                                    COALESCE(surname, '') as surname,
-                                    COALESCE(full_name, '') as full_name,
-                                    birthday,
-                                    COALESCE(department, '') as cohort,
-                                    COALESCE(created_at, CURRENT_TIMESTAMP) as created_at,
-                                    COALESCE(updated_at, CURRENT_TIMESTAMP) as updated_at
-                                FROM users
-                            """)
-                        else:
+                    if has_unnecessary_columns or missing_cohort or has_department:
+                        logger.info("[i] Veritabanı şeması güncelleniyor...")
+                        # SQLite >= 3.35: Kolonlar kopyalama yapılmadan ALTER TABLE ile düzenlenir
+                        if not self._migrate_users_in_place(cursor, columns):
+                            # Yerinde güncelleme yapılamadı: Tabloyu yeniden kurarak kopyala
+                            cursor.execute("PRAGMA table_info(users)")
+                            columns = {column[1] for column in cursor.fetchall()}
+                            has_department = 'department' in columns
+
+                            # Yeni temiz tablo oluştur
+                            cursor.execute("DROP TABLE IF EXISTS users_new")
                             cursor.execute("""
-                                INSERT INTO users_new (id, slack_id, first_name, middle_name, surname, full_name, birthday, cohort, created_at, updated_at)
-                                SELECT 
-                                    id, 
-                                    slack_id, 
-                                    COALESCE(first_name, '') as first_name,
-                                    COALESCE(middle_name, '') as middle_name,
-                                    COALESCE(surname, '') as surname,
-                                    COALESCE(full_name, '') as full_name,
-                                    birthday,
-                                    COALESCE(cohort, '') as cohort,
-                                    COALESCE(created_at, CURRENT_TIMESTAMP) as created_at,
-                                    COALESCE(updated_at, CURRENT_TIMESTAMP) as updated_at
-                                FROM users
+                                CREATE TABLE users_new (
+                                    id TEXT PRIMARY KEY,
+                                    slack_id TEXT UNIQUE,
+                                    first_name TEXT,
+                                    middle_name TEXT,
+                                    surname TEXT,
+                                    full_name TEXT,
+                                    birthday TEXT,
+                                    cohort TEXT,
+                                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                                )
                             """)
                     
-                    # Eski tabloyu sil ve yenisini yeniden adlandır
-                    cursor.execute("DROP TABLE users")
-                    cursor.execute("ALTER TABLE users_new RENAME TO users")
-                    logger.info("[+] Veritabanı şeması temizlendi: Sadece gerekli kolonlar kaldı (id, slack_id, first_name, middle_name, surname, full_name, birthday, cohort).")
+                            # Mevcut verileri kopyala (sadece mevcut kolonlar varsa)
+                            if 'id' in columns and 'slack_id' in columns:
+                                # Department varsa cohort'a çevir, yoksa boş bırak
+                                if not has_department and _REQUIRED_USER_COLS <= columns:
+                                    # Gerekli kolonların hepsi mevcut (sadece fazlalık var): ifadesiz düz kopya,
+                                    # satır başına COALESCE değerlendirmesi yapılmaz
+                                    column_list = ", ".join(_USER_COLUMNS)
+                                    cursor.execute(f"INSERT INTO users_new ({column_list}) SELECT {column_list} FROM users")
+                                elif has_department:
+                                    cursor.execute("""
+                                        INSERT INTO users_new (id, slack_id, first_name, middle_name, surname, full_name, birthday, cohort, created_at, updated_at)
+                                        SELECT 
+                                            id, 
+                                            slack_id, 
+                                            COALESCE(first_name, '') as first_name,
+                                            COALESCE(middle_name, '') as middle_name,
+                                            COALESCE(surname, '') as surname,
+                                            COALESCE(full_name, '') as full_name,
+                                            birthday,
+                                            COALESCE(department, '') as cohort,
+                                            COALESCE(created_at, CURRENT_TIMESTAMP) as created_at,
+                                            COALESCE(updated_at, CURRENT_TIMESTAMP) as updated_at
+                                        FROM users
+                                    """)
+                                else:
+                                    cursor.execute("""
+                                        INSERT INTO users_new (id, slack_id, first_name, middle_name, surname, full_name, birthday, cohort, created_at, updated_at)
+                                        SELECT 
+                                            id, 
+                                            slack_id, 
+                                            COALESCE(first_name, '') as first_name,
+                                            COALESCE(middle_name, '') as middle_name,
+                                            COALESCE(surname, '') as surname,
+                                            COALESCE(full_name, '') as full_name,
+                                            birthday,
+                                            COALESCE(cohort, '') as cohort,
+                                            COALESCE(created_at, CURRENT_TIMESTAMP) as created_at,
+                                            COALESCE(updated_at, CURRENT_TIMESTAMP) as updated_at
+                                        FROM users
+                                    """)
+                    
+                            # Eski tabloyu sil ve yenisini yeniden adlandır
+                            cursor.execute("DROP TABLE users")
+                            cursor.execute("ALTER TABLE users_new RENAME TO users")
+                            cursor.execute("ANALYZE users")
+                            logger.info("[+] Veritabanı şeması temizlendi: Sadece gerekli kolonlar kaldı (id, slack_id, first_name, middle_name, surname, full_name, birthday, cohort).")
+
+                # Migration: Eğer message_ts ve message_channel kolonları yoksa ekle
+                if needs_legacy_migration:
+                    columns = table_columns.get("polls", set())
+                    if 'message_ts' not in columns:
+                        cursor.execute("ALTER TABLE polls ADD COLUMN message_ts TEXT")
+                        logger.info("[i] polls tablosuna message_ts kolonu eklendi.")
+                    if 'message_channel' not in columns:
+                        cursor.execute("ALTER TABLE polls ADD COLUMN message_channel TEXT")
+                        logger.info("[i] polls tablosuna message_channel kolonu eklendi.")
+
+                # Migration: updated_at kolonu yoksa ekle
+                if needs_legacy_migration:
+                    columns = table_columns.get("challenge_hubs", set())
+                    if 'updated_at' not in columns:
+                        logger.info("[i] challenge_hubs tablosuna updated_at kolonu ekleniyor...")
+                        # SQLite'da ALTER TABLE ile DEFAULT CURRENT_TIMESTAMP kullanılamaz, NULL ile ekle
+                        cursor.execute("ALTER TABLE challenge_hubs ADD COLUMN updated_at TIMESTAMP")
+                        logger.info("[+] challenge_hubs.updated_at kolonu eklendi.")
+
+                # Migration: updated_at kolonu yoksa ekle
+                if needs_legacy_migration:
+                    columns = table_columns.get("challenge_participants", set())
+                    if 'updated_at' not in columns:
+                        logger.info("[i] challenge_participants tablosuna updated_at kolonu ekleniyor...")
+                        # SQLite'da ALTER TABLE ile DEFAULT CURRENT_TIMESTAMP kullanılamaz, NULL ile ekle
+                        cursor.execute("ALTER TABLE challenge_participants ADD COLUMN updated_at TIMESTAMP")
+                        logger.info("[+] challenge_participants.updated_at kolonu eklendi.")
+
+                # Migration: updated_at kolonu yoksa ekle
+                if needs_legacy_migration:
+                    columns = table_columns.get("challenge_submissions", set())
+                    if 'updated_at' not in columns:
+                        logger.info("[i] challenge_submissions tablosuna updated_at kolonu ekleniyor...")
+                        # SQLite'da ALTER TABLE ile DEFAULT CURRENT_TIMESTAMP kullanılamaz, NULL ile ekle
+                        cursor.execute("ALTER TABLE challenge_submissions ADD COLUMN updated_at TIMESTAMP")
+                        logger.info("[+] challenge_submissions.updated_at kolonu eklendi.")
+
+                # Migration: admin_approval kolonu yoksa ekle
+                if needs_legacy_migration:
+                    columns = table_columns.get("challenge_evaluations", set())
+                    if 'admin_approval' not in columns:
+                        logger.info("[i] challenge_evaluations tablosuna admin_approval kolonu ekleniyor...")
+                        cursor.execute("ALTER TABLE challenge_evaluations ADD COLUMN admin_approval TEXT DEFAULT 'pending'")
+                        logger.info("[+] challenge_evaluations.admin_approval kolonu eklendi.")
+                
+                    # Migration: jury_status kolonu yoksa ekle
+                    if 'jury_status' not in columns:
+                        logger.info("[i] challenge_evaluations tablosuna jury_status kolonu ekleniyor...")
+                        cursor.execute("ALTER TABLE challenge_evaluations ADD COLUMN jury_status TEXT DEFAULT 'recruiting'")
+                        logger.info("[+] challenge_evaluations.jury_status kolonu eklendi.")
+
+                # Migration (v4): challenge başına tek değerlendirme (UNIQUE index)
+                # Mükerrer kayıt varsa veri silinmez; sürüm damgalanmaz ve index sonraki açılışta yeniden denenir
+                target_version = CURRENT_SCHEMA_VERSION
+                if schema_version < UNIQUE_EVALUATION_HUB_SCHEMA_VERSION:
+                    cursor.execute("""
+                        SELECT COUNT(*) FROM (
+                            SELECT challenge_hub_id FROM challenge_evaluations
+                            GROUP BY challenge_hub_id HAVING COUNT(*) > 1
+                        )
+                    """)
+                    duplicate_count = cursor.fetchone()[0]
+                    if duplicate_count:
+                        logger.warning(
+                            f"[!] {duplicate_count} challenge için birden fazla değerlendirme var, "
+                            "ux_challenge_evaluations_hub oluşturulmadı (mükerrer kayıtlar temizlenince eklenecek)."
+                        )
+                        target_version = max(schema_version, UNIQUE_EVALUATION_HUB_SCHEMA_VERSION - 1)
+                    else:
+                        cursor.execute(
+                            "CREATE UNIQUE INDEX IF NOT EXISTS ux_challenge_evaluations_hub "
+                            "ON challenge_evaluations(challenge_hub_id)"
+                        )
+                        logger.info("[+] challenge_evaluations.challenge_hub_id UNIQUE index'i eklendi.")
 
                 # Akademi admin kullanıcısını garanti altına al
                 try:
@@ -165,301 +657,13 @@ class DatabaseClient(metaclass=SingletonMeta):
                         logger.info(f"[+] Akademi admin kullanıcısı eklendi: {admin_slack_id} (ID: {admin_id})")
                     else:
                         logger.debug(f"[i] Akademi admin kullanıcısı zaten mevcut: {admin_slack_id}")
+
                 except Exception as admin_seed_error:
                     logger.warning(f"[!] Akademi admin kullanıcısı seed edilirken hata: {admin_seed_error}")
 
-                # Eşleşme Takip Tablosu (Matches)
-                # Mevcut şemada foreign key'ler users(id)'ye bağlıydı, ancak uygulama Slack ID kullanıyor.
-                # Foreign key hatalarını önlemek için tabloyu yeniden oluşturup users(slack_id)'ye bağlarız.
-                cursor.execute("DROP TABLE IF EXISTS matches")
-                cursor.execute("""
-                    CREATE TABLE matches (
-                        id TEXT PRIMARY KEY,
-                        channel_id TEXT,
-                        coffee_channel_id TEXT,
-                        user1_id TEXT,
-                        user2_id TEXT,
-                        status TEXT DEFAULT 'active',
-                        summary TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (user1_id) REFERENCES users(slack_id) ON DELETE SET NULL,
-                        FOREIGN KEY (user2_id) REFERENCES users(slack_id) ON DELETE SET NULL
-                    )
-                """)
-
-                # Oylama Başlıkları Tablosu (Polls)
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS polls (
-                        id TEXT PRIMARY KEY,
-                        topic TEXT,
-                        options TEXT, -- JSON formatında seçenekler
-                        result_summary TEXT, -- Oylama bittiğinde LLM özeti veya ham sonuç
-                        creator_id TEXT,
-                        allow_multiple INTEGER DEFAULT 0, -- Çoklu oy opsiyonu
-                        is_closed INTEGER DEFAULT 0,
-                        expires_at TIMESTAMP,
-                        message_ts TEXT, -- Oylama mesajının timestamp'i (güncelleme için)
-                        message_channel TEXT, -- Oylama mesajının kanalı
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                
-                # Migration: Eğer message_ts ve message_channel kolonları yoksa ekle
-                cursor.execute("PRAGMA table_info(polls)")
-                columns = [column[1] for column in cursor.fetchall()]
-                if 'message_ts' not in columns:
-                    cursor.execute("ALTER TABLE polls ADD COLUMN message_ts TEXT")
-                    logger.info("[i] polls tablosuna message_ts kolonu eklendi.")
-                if 'message_channel' not in columns:
-                    cursor.execute("ALTER TABLE polls ADD COLUMN message_channel TEXT")
-                    logger.info("[i] polls tablosuna message_channel kolonu eklendi.")
-
-                # Oylar Tablosu (Votes) - User & Poll Ara Tablo
-                # Mevcut şemada foreign key users(id)'ye bağlıydı, ancak uygulama Slack ID kullanıyor.
-                # Foreign key hatalarını önlemek için tabloyu yeniden oluşturup users(slack_id)'ye bağlarız.
-                cursor.execute("DROP TABLE IF EXISTS votes")
-                cursor.execute("""
-                    CREATE TABLE votes (
-                        id TEXT PRIMARY KEY,
-                        poll_id TEXT,
-                        user_id TEXT,
-                        option_index INTEGER,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        UNIQUE(poll_id, user_id, option_index),
-                        FOREIGN KEY (poll_id) REFERENCES polls(id) ON DELETE CASCADE,
-                        FOREIGN KEY (user_id) REFERENCES users(slack_id) ON DELETE CASCADE
-                    )
-                """)
-
-                # Anonim Geri Bildirim Tablosu (Feedbacks)
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS feedbacks (
-                        id TEXT PRIMARY KEY,
-                        content TEXT,
-                        category TEXT DEFAULT 'general',
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                
-                # Yardım İstekleri Tablosu (Help Requests)
-                # Mevcut şemada foreign key'ler users(id)'ye bağlıydı, ancak uygulama Slack ID kullanıyor.
-                # Foreign key hatalarını önlemek için tabloyu yeniden oluşturup users(slack_id)'ye bağlarız.
-                cursor.execute("DROP TABLE IF EXISTS help_requests")
-                cursor.execute("""
-                    CREATE TABLE help_requests (
-                        id TEXT PRIMARY KEY,
-                        requester_id TEXT NOT NULL,
-                        topic TEXT NOT NULL,
-                        description TEXT NOT NULL,
-                        status TEXT DEFAULT 'open',
-                        helper_id TEXT,
-                        channel_id TEXT,
-                        help_channel_id TEXT,
-                        message_ts TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        resolved_at TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (requester_id) REFERENCES users(slack_id) ON DELETE CASCADE,
-                        FOREIGN KEY (helper_id) REFERENCES users(slack_id) ON DELETE SET NULL
-                    )
-                """)
-                
-                # Challenge Hub Tabloları
-                # Foreign key'leri aç (challenge tabloları için)
-                cursor.execute("PRAGMA foreign_keys = ON")
-                
-                # NOT: Artık tabloları her açılışta DROP etmiyoruz (Veri kaybını önlemek için)
-                # Sadece eksik tablolar oluşturulur.
-                logger.debug("[i] Challenge tabloları kontrol ediliyor...")
-                
-                # Challenge Themes (Temalar)
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS challenge_themes (
-                        id TEXT PRIMARY KEY,
-                        name TEXT NOT NULL UNIQUE,
-                        description TEXT,
-                        icon TEXT,
-                        difficulty_range TEXT,
-                        is_active INTEGER DEFAULT 1,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                
-                # Challenge Projects (Proje Şablonları)
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS challenge_projects (
-                        id TEXT PRIMARY KEY,
-                        theme TEXT NOT NULL,
-                        name TEXT NOT NULL,
-                        description TEXT,
-                        objectives TEXT,
-                        deliverables TEXT,
-                        tasks TEXT,
-                        difficulty_level TEXT DEFAULT 'intermediate',
-                        estimated_hours INTEGER DEFAULT 48,
-                        min_team_size INTEGER DEFAULT 2,
-                        max_team_size INTEGER DEFAULT 6,
-                        learning_objectives TEXT,
-                        skills_required TEXT,
-                        skills_developed TEXT,
-                        resources TEXT,
-                        knowledge_base_refs TEXT,
-                        llm_customizable INTEGER DEFAULT 1,
-                        llm_enhancement_prompt TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                
-                # Challenge Hubs (Ana Challenge'lar)
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS challenge_hubs (
-                        id TEXT PRIMARY KEY,
-                        creator_id TEXT NOT NULL,
-                        theme TEXT NOT NULL,
-                        team_size INTEGER NOT NULL,
-                        status TEXT DEFAULT 'recruiting',
-                        challenge_channel_id TEXT,
-                        hub_channel_id TEXT,
-                        selected_project_id TEXT,
-                        llm_customizations TEXT,
-                        deadline_hours INTEGER DEFAULT 48,
-                        difficulty TEXT DEFAULT 'intermediate',
-                        deadline TIMESTAMP,
-                        started_at TIMESTAMP,
-                        completed_at TIMESTAMP,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (creator_id) REFERENCES users(slack_id) ON DELETE CASCADE
-                    )
-                """)
-                
-                # Migration: updated_at kolonu yoksa ekle
-                cursor.execute("PRAGMA table_info(challenge_hubs)")
-                columns = [column[1] for column in cursor.fetchall()]
-                if 'updated_at' not in columns:
-                    logger.info("[i] challenge_hubs tablosuna updated_at kolonu ekleniyor...")
-                    # SQLite'da ALTER TABLE ile DEFAULT CURRENT_TIMESTAMP kullanılamaz, NULL ile ekle
-                    cursor.execute("ALTER TABLE challenge_hubs ADD COLUMN updated_at TIMESTAMP")
-                    logger.info("[+] challenge_hubs.updated_at kolonu eklendi.")
-                
-                # Challenge Participants (Katılımcılar)
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS challenge_participants (
-                        id TEXT PRIMARY KEY,
-                        challenge_hub_id TEXT NOT NULL,
-                        user_id TEXT NOT NULL,
-                        role TEXT,
-                        joined_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        points_earned INTEGER DEFAULT 0,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        UNIQUE(challenge_hub_id, user_id),
-                        FOREIGN KEY (challenge_hub_id) REFERENCES challenge_hubs(id) ON DELETE CASCADE,
-                        FOREIGN KEY (user_id) REFERENCES users(slack_id) ON DELETE CASCADE
-                    )
-                """)
-                
-                # Migration: updated_at kolonu yoksa ekle
-                cursor.execute("PRAGMA table_info(challenge_participants)")
-                columns = [column[1] for column in cursor.fetchall()]
-                if 'updated_at' not in columns:
-                    logger.info("[i] challenge_participants tablosuna updated_at kolonu ekleniyor...")
-                    # SQLite'da ALTER TABLE ile DEFAULT CURRENT_TIMESTAMP kullanılamaz, NULL ile ekle
-                    cursor.execute("ALTER TABLE challenge_participants ADD COLUMN updated_at TIMESTAMP")
-                    logger.info("[+] challenge_participants.updated_at kolonu eklendi.")
-                
-                # Challenge Submissions (Takım Çıktıları)
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS challenge_submissions (
-                        id TEXT PRIMARY KEY,
-                        challenge_hub_id TEXT NOT NULL,
-                        team_name TEXT,
-                        project_name TEXT,
-                        solution_summary TEXT,
-                        deliverables TEXT,
-                        learning_outcomes TEXT,
-                        llm_enhanced_features TEXT,
-                        submitted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        points_awarded INTEGER DEFAULT 0,
-                        creativity_score INTEGER DEFAULT 0,
-                        teamwork_score INTEGER DEFAULT 0,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (challenge_hub_id) REFERENCES challenge_hubs(id) ON DELETE CASCADE
-                    )
-                """)
-                
-                # Migration: updated_at kolonu yoksa ekle
-                cursor.execute("PRAGMA table_info(challenge_submissions)")
-                columns = [column[1] for column in cursor.fetchall()]
-                if 'updated_at' not in columns:
-                    logger.info("[i] challenge_submissions tablosuna updated_at kolonu ekleniyor...")
-                    # SQLite'da ALTER TABLE ile DEFAULT CURRENT_TIMESTAMP kullanılamaz, NULL ile ekle
-                    cursor.execute("ALTER TABLE challenge_submissions ADD COLUMN updated_at TIMESTAMP")
-                    logger.info("[+] challenge_submissions.updated_at kolonu eklendi.")
-                
-                # Challenge Evaluations (Değerlendirme Sistemi)
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS challenge_evaluations (
-                        id TEXT PRIMARY KEY,
-                        challenge_hub_id TEXT NOT NULL,
-                        evaluation_channel_id TEXT,
-                        github_repo_url TEXT,
-                        github_repo_public INTEGER DEFAULT 0,
-                        status TEXT DEFAULT 'pending',
-                        true_votes INTEGER DEFAULT 0,
-                        false_votes INTEGER DEFAULT 0,
-                        final_result TEXT,
-                        admin_approval TEXT DEFAULT 'pending',
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        deadline_at TIMESTAMP,
-                        completed_at TIMESTAMP,
-                        FOREIGN KEY (challenge_hub_id) REFERENCES challenge_hubs(id) ON DELETE CASCADE
-                    )
-                """)
-                
-                # Migration: admin_approval kolonu yoksa ekle
-                cursor.execute("PRAGMA table_info(challenge_evaluations)")
-                columns = [column[1] for column in cursor.fetchall()]
-                if 'admin_approval' not in columns:
-                    logger.info("[i] challenge_evaluations tablosuna admin_approval kolonu ekleniyor...")
-                    cursor.execute("ALTER TABLE challenge_evaluations ADD COLUMN admin_approval TEXT DEFAULT 'pending'")
-                    logger.info("[+] challenge_evaluations.admin_approval kolonu eklendi.")
-                
-                # Migration: jury_status kolonu yoksa ekle
-                if 'jury_status' not in columns:
-                    logger.info("[i] challenge_evaluations tablosuna jury_status kolonu ekleniyor...")
-                    cursor.execute("ALTER TABLE challenge_evaluations ADD COLUMN jury_status TEXT DEFAULT 'recruiting'")
-                    logger.info("[+] challenge_evaluations.jury_status kolonu eklendi.")
-                
-                # Challenge Evaluators (Değerlendiriciler)
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS challenge_evaluators (
-                        id TEXT PRIMARY KEY,
-                        evaluation_id TEXT NOT NULL,
-                        user_id TEXT NOT NULL,
-                        vote TEXT,
-                        voted_at TIMESTAMP,
-                        FOREIGN KEY (evaluation_id) REFERENCES challenge_evaluations(id) ON DELETE CASCADE,
-                        FOREIGN KEY (user_id) REFERENCES users(slack_id) ON DELETE CASCADE
-                    )
-                """)
-                
-                # User Challenge Stats (Kullanıcı İstatistikleri)
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS user_challenge_stats (
-                        user_id TEXT PRIMARY KEY,
-                        total_challenges INTEGER DEFAULT 0,
-                        completed_challenges INTEGER DEFAULT 0,
-                        total_points INTEGER DEFAULT 0,
-                        creativity_points INTEGER DEFAULT 0,
-                        teamwork_points INTEGER DEFAULT 0,
-                        favorite_theme TEXT,
-                        last_challenge_date DATE,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (user_id) REFERENCES users(slack_id) ON DELETE CASCADE
-                    )
-                """)
-                
+                if target_version > schema_version:
+                    cursor.execute(f"PRAGMA user_version = {target_version}")
+                    logger.info(f"[+] Veritabanı şeması v{schema_version} -> v{target_version} güncellendi.")
                 conn.commit()
                 logger.debug("[i] Veritabanı tabloları kontrol edildi.")
                 
@@ -471,13 +675,66 @@ class DatabaseClient(metaclass=SingletonMeta):
                 self._seed_challenge_data(cursor)
                 conn.commit()
                 
+                # Migration'lar sonrası planlayıcı istatistiklerini güncelle
+                conn.execute("PRAGMA optimize")
+                
         except sqlite3.Error as e:
             logger.error(f"[X] Veritabanı ilklendirme hatası: {e}")
             raise DatabaseError(f"Tablolar oluşturulamadı: {e}")
     
+    def _get_table_columns(self, cursor) -> Dict[str, Set[str]]:
+        """Şemadaki tüm tabloların kolon adlarını tek sorguyla döndürür: {tablo: {kolon, ...}}."""
+        cursor.execute("""
+            SELECT m.name, p.name
+            FROM sqlite_master AS m
+            JOIN pragma_table_info(m.name) AS p
+            WHERE m.type = 'table'
+        """)
+        table_columns: Dict[str, Set[str]] = {}
+        for table_name, column_name in cursor.fetchall():
+            table_columns.setdefault(table_name, set()).add(column_name)
+        return table_columns
+
+    def _migrate_users_in_place(self, cursor, columns: Set[str]) -> bool:
+        """
+        users tablosunu kopyalamadan ALTER TABLE ile günceller (DROP COLUMN, SQLite >= 3.35).
+        Desteklenmiyorsa veya bir adım başarısız olursa False döner; çağıran kopyalama yoluna düşer.
+        """
+        if sqlite3.sqlite_version_info < (3, 35, 0):
+            return False
+
+        # DEFAULT CURRENT_TIMESTAMP'li kolonlar ALTER ile eklenemez; sadece cohort eksikliği yerinde çözülür
+        missing_columns = _REQUIRED_USER_COLS - columns
+        if missing_columns - {'cohort'}:
+            return False
+
+        try:
+            if 'cohort' in missing_columns:
+                cursor.execute("ALTER TABLE users ADD COLUMN cohort TEXT")
+            if 'department' in columns:
+                cursor.execute("UPDATE users SET cohort = COALESCE(department, '')")
+            for col in sorted(columns - _REQUIRED_USER_COLS):
+                cursor.execute(f'ALTER TABLE users DROP COLUMN "{col}"')
+        except sqlite3.OperationalError as e:
+            # Index/constraint içeren kolonlar DROP edilemez
+            logger.warning(f"[!] users tablosu yerinde güncellenemedi, kopyalama ile devam ediliyor: {e}")
+            return False
+
+        logger.info("[+] Veritabanı şeması yerinde güncellendi (kopyalama yapılmadı).")
+        return True
+
     def _seed_challenge_data(self, cursor):
         """Challenge temaları ve projeler için seed data ekler. Açılışta kontrol eder, yoksa ekler."""
         try:
+            # Hızlı yol: Kayıtlar birebir güncelse hiçbir yazma yapılmaz (açılışta write lock alınmaz)
+            cursor.execute("SELECT id FROM challenge_themes")
+            existing_theme_ids = {row[0] for row in cursor.fetchall()}
+            cursor.execute("SELECT id FROM challenge_projects")
+            existing_project_ids = {row[0] for row in cursor.fetchall()}
+            if existing_theme_ids == _SEED_THEME_IDS and existing_project_ids == _SEED_PROJECT_IDS:
+                logger.debug(f"[i] Challenge seed data güncel: {len(_SEED_THEMES)} tema, {len(_SEED_PROJECTS)} proje.")
+                return
+            
             # Mobile App temasını ve projelerini temizle (artık kullanılmıyor)
             cursor.execute("DELETE FROM challenge_projects WHERE theme = 'Mobile App'")
             deleted_projects = cursor.rowcount
@@ -488,39 +745,157 @@ class DatabaseClient(metaclass=SingletonMeta):
             if cursor.rowcount > 0:
                 logger.info("[i] Mobile App teması temizlendi.")
             
-            # Temalar
-            themes = [
-                ("theme_ai_chatbot", "AI Chatbot", "Yapay zeka destekli chatbot geliştirme", "🤖", "intermediate-advanced", 1),
-                ("theme_web_app", "Web App", "Modern web uygulaması geliştirme", "🌐", "intermediate-advanced", 1),
-                ("theme_data_analysis", "Data Analysis", "Veri analizi ve görselleştirme projeleri", "📊", "intermediate", 1),
-                # Mobile App teması kaldırıldı - sadece AI ve Web App kullanılıyor
-                # ("theme_mobile_app", "Mobile App", "Mobil uygulama geliştirme", "📱", "advanced", 0),
-                ("theme_automation", "Automation", "İş süreçlerini otomatikleştirme", "⚙️", "intermediate", 1),
-            ]
-            
-            themes_added = 0
-            for theme_id, name, desc, icon, diff_range, is_active in themes:
-                # Önce kontrol et
-                cursor.execute("SELECT id FROM challenge_themes WHERE id = ?", (theme_id,))
-                exists = cursor.fetchone()
-                
-                if not exists:
-                    cursor.execute("""
-                        INSERT INTO challenge_themes (id, name, description, icon, difficulty_range, is_active)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    """, (theme_id, name, desc, icon, diff_range, is_active))
-                    themes_added += 1
-                    logger.debug(f"[+] Tema eklendi: {name}")
+            # Eksik temalar tek executemany ile eklenir (mevcutlar atlanır)
+            missing_themes = [theme for theme in _SEED_THEMES if theme[0] not in existing_theme_ids]
+            cursor.executemany(_SQL_INSERT_THEME, missing_themes)
+            themes_added = len(missing_themes)
             
             if themes_added > 0:
                 logger.info(f"[+] {themes_added} yeni tema eklendi.")
             else:
                 logger.debug("[i] Tüm temalar zaten mevcut.")
             
-            # Projeler
-            import json
+            # Eksik projeler tek executemany ile eklenir (JSON alanları süreç başına bir kez serileştirilir)
+            project_rows = [
+                row for project_id, row in _seed_project_rows().items()
+                if project_id not in existing_project_ids
+            ]
+            cursor.executemany(_SQL_INSERT_PROJECT, project_rows)
+            projects_added = len(project_rows)
+            
+            if projects_added > 0:
+                logger.info(f"[+] {projects_added} yeni proje eklendi.")
+            else:
+                logger.debug("[i] Tüm projeler zaten mevcut.")
+            
+            # Toplam istatistik
+            cursor.execute("SELECT COUNT(*) FROM challenge_projects")
+            total_projects = cursor.fetchone()[0]
+            cursor.execute("SELECT COUNT(*) FROM challenge_themes WHERE is_active = 1")
+            total_themes = cursor.fetchone()[0]
+            
+            logger.info(f"[i] Challenge veritabanı durumu: {total_themes} tema, {total_projects} proje mevcut.")
+        except Exception as e:
+            logger.warning(f"[!] Challenge seed data eklenirken hata: {e}")
+    
+    def _create_indexes(self, cursor):
+        """Performans için index'leri oluşturur."""
+        try:
+            indexes = [
+                # Challenge indexes
+                ("idx_challenge_hubs_status", "challenge_hubs", "status"),
+                ("idx_challenge_hubs_creator", "challenge_hubs", "creator_id"),
+                ("idx_challenge_hubs_creator_status", "challenge_hubs", "creator_id, status"),
+                ("idx_challenge_hubs_channel", "challenge_hubs", "challenge_channel_id"),
+                ("idx_challenge_participants_hub", "challenge_participants", "challenge_hub_id"),
+                ("idx_challenge_participants_user", "challenge_participants", "user_id"),
+                ("idx_challenge_submissions_hub", "challenge_submissions", "challenge_hub_id"),
+                ("idx_challenge_evaluations_hub", "challenge_evaluations", "challenge_hub_id"),
+                ("idx_challenge_evaluations_status", "challenge_evaluations", "status"),
+                ("idx_challenge_evaluations_status_deadline", "challenge_evaluations", "status, deadline_at"),
+                ("idx_challenge_evaluations_channel", "challenge_evaluations", "evaluation_channel_id"),
+                ("idx_challenge_evaluators_evaluation", "challenge_evaluators", "evaluation_id"),
+                ("idx_challenge_evaluators_user", "challenge_evaluators", "user_id"),
+                
+                # Help indexes
+                ("idx_help_requests_status", "help_requests", "status"),
+                ("idx_help_requests_status_created", "help_requests", "status, created_at"),
+                ("idx_help_requests_requester", "help_requests", "requester_id"),
+                ("idx_help_requests_helper", "help_requests", "helper_id"),
+                
+                # Match indexes
+                ("idx_matches_status", "matches", "status"),
+                ("idx_matches_user1", "matches", "user1_id"),
+                ("idx_matches_user2", "matches", "user2_id"),
+                
+                # Poll indexes
+                ("idx_polls_is_closed", "polls", "is_closed"),
+                ("idx_polls_creator", "polls", "creator_id"),
+                ("idx_votes_poll", "votes", "poll_id"),
+                ("idx_votes_user", "votes", "user_id"),
+                
+                # User indexes
+                ("idx_users_slack_id", "users", "slack_id"),
+            ]
+            
+            for index_name, table_name, column_name in indexes:
+                try:
+                    cursor.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name}({column_name})")
+                    logger.debug(f"[+] Index oluşturuldu: {index_name}")
+                except sqlite3.Error as e:
+                    logger.warning(f"[!] Index oluşturulamadı ({index_name}): {e}")
+            
+            # Planlayıcı istatistikleri yoksa bir kez topla (index seçimi için)
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'")
+            if not cursor.fetchone():
+                cursor.execute("ANALYZE")
+                logger.debug("[+] ANALYZE çalıştırıldı (sqlite_stat1 oluşturuldu).")
             
-            all_projects = [
+            logger.info("[+] Veritabanı index'leri kontrol edildi.")
+        except Exception as e:
+            logger.warning(f"[!] Index oluşturulurken hata: {e}")
+    
+    def clean_challenge_tables(self):
+        """Challenge tablolarını temizler (startup için)."""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                # Foreign key constraint'leri geçici olarak devre dışı bırak
+                # (PRAGMA transaction içinde etkisizdir; bekleyen işlem yokken çalıştırılır)
+                cursor.execute("PRAGMA foreign_keys = OFF")
+                try:
+                    # Sırayla temizle (foreign key bağımlılıklarına göre)
+                    tables = [
+                        "challenge_evaluators",
+                        "challenge_evaluations",
+                        "challenge_submissions",
+                        "challenge_participants",
+                        "challenge_hubs",
+                        "user_challenge_stats"
+                    ]
+                    
+                    deleted_counts = {}
+                    for table in tables:
+                        cursor.execute(f"DELETE FROM {table}")
+                        deleted_counts[table] = cursor.rowcount
+                        logger.debug(f"[+] {table} temizlendi: {cursor.rowcount} kayıt silindi")
+                    
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+                finally:
+                    # Aynı bağlantıda (commit/rollback sonrası) tekrar etkinleştir;
+                    # havuza foreign key'leri kapalı bir bağlantı dönmez
+                    cursor.execute("PRAGMA foreign_keys = ON")
+                
+                total_deleted = sum(deleted_counts.values())
+                if total_deleted > 0:
+                    logger.info(f"[+] Challenge tabloları temizlendi: {total_deleted} kayıt silindi")
+                else:
+                    logger.info("[i] Challenge tabloları zaten temizdi.")
+                
+                return deleted_counts
+        except Exception as e:
+            logger.error(f"[X] Challenge tabloları temizlenirken hata: {e}", exc_info=True)
+            return {}
+
+
+# --- Challenge seed data ---
+
+# Temalar
+_SEED_THEMES = (
+    ("theme_ai_chatbot", "AI Chatbot", "Yapay zeka destekli chatbot geliştirme", "🤖", "intermediate-advanced", 1),
+    ("theme_web_app", "Web App", "Modern web uygulaması geliştirme", "🌐", "intermediate-advanced", 1),
+    ("theme_data_analysis", "Data Analysis", "Veri analizi ve görselleştirme projeleri", "📊", "intermediate", 1),
+    # Mobile App teması kaldırıldı - sadece AI ve Web App kullanılıyor
+    # ("theme_mobile_app", "Mobile App", "Mobil uygulama geliştirme", "📱", "advanced", 0),
+    ("theme_automation", "Automation", "İş süreçlerini otomatikleştirme", "⚙️", "intermediate", 1),
+)
+
+# Proje şablonları
+_SEED_PROJECTS = [
     {
         "id": "proj_sentiment_analyzer",
         "theme": "AI Chatbot",
@@ -1312,143 +1687,27 @@ class DatabaseClient(metaclass=SingletonMeta):
       "max_team_size": 4
     }
 ]
-            
-            projects_added = 0
-            for project in all_projects:
-                # Önce kontrol et - proje var mı?
-                cursor.execute("SELECT id FROM challenge_projects WHERE id = ?", (project["id"],))
-                exists = cursor.fetchone()
-                
-                if not exists:
-                    # objectives ve deliverables JSON formatına çevir
-                    objectives_json = json.dumps(project["objectives"], ensure_ascii=False)
-                    deliverables_json = json.dumps(project["deliverables"], ensure_ascii=False)
-                    tasks_json = json.dumps(project["tasks"], ensure_ascii=False)
-                    
-                    cursor.execute("""
-                        INSERT INTO challenge_projects 
-                        (id, theme, name, description, objectives, deliverables, tasks, difficulty_level, estimated_hours, min_team_size, max_team_size)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        project["id"],
-                        project["theme"],
-                        project["name"],
-                        project["description"],
-                        objectives_json,
-                        deliverables_json,
-                        tasks_json,
-                        project["difficulty_level"],
-                        project["estimated_hours"],
-                        project["min_team_size"],
-                        project["max_team_size"]
-                    ))
-                    projects_added += 1
-                    logger.debug(f"[+] Proje eklendi: {project['name']} ({project['theme']})")
-            
-            if projects_added > 0:
-                logger.info(f"[+] {projects_added} yeni proje eklendi.")
-            else:
-                logger.debug("[i] Tüm projeler zaten mevcut.")
-            
-            # Toplam istatistik
-            cursor.execute("SELECT COUNT(*) FROM challenge_projects")
-            total_projects = cursor.fetchone()[0]
-            cursor.execute("SELECT COUNT(*) FROM challenge_themes WHERE is_active = 1")
-            total_themes = cursor.fetchone()[0]
-            
-            logger.info(f"[i] Challenge veritabanı durumu: {total_themes} tema, {total_projects} proje mevcut.")
-        except Exception as e:
-            logger.warning(f"[!] Challenge seed data eklenirken hata: {e}")
-    
-    def _create_indexes(self, cursor):
-        """Performans için index'leri oluşturur."""
-        try:
-            indexes = [
-                # Challenge indexes
-                ("idx_challenge_hubs_status", "challenge_hubs", "status"),
-                ("idx_challenge_hubs_creator", "challenge_hubs", "creator_id"),
-                ("idx_challenge_participants_hub", "challenge_participants", "challenge_hub_id"),
-                ("idx_challenge_participants_user", "challenge_participants", "user_id"),
-                ("idx_challenge_submissions_hub", "challenge_submissions", "challenge_hub_id"),
-                ("idx_challenge_evaluations_hub", "challenge_evaluations", "challenge_hub_id"),
-                ("idx_challenge_evaluations_status", "challenge_evaluations", "status"),
-                ("idx_challenge_evaluators_evaluation", "challenge_evaluators", "evaluation_id"),
-                ("idx_challenge_evaluators_user", "challenge_evaluators", "user_id"),
-                
-                # Help indexes
-                ("idx_help_requests_status", "help_requests", "status"),
-                ("idx_help_requests_requester", "help_requests", "requester_id"),
-                ("idx_help_requests_helper", "help_requests", "helper_id"),
-                
-                # Match indexes
-                ("idx_matches_status", "matches", "status"),
-                ("idx_matches_user1", "matches", "user1_id"),
-                ("idx_matches_user2", "matches", "user2_id"),
-                
-                # Poll indexes
-                ("idx_polls_is_closed", "polls", "is_closed"),
-                ("idx_polls_creator", "polls", "creator_id"),
-                ("idx_votes_poll", "votes", "poll_id"),
-                ("idx_votes_user", "votes", "user_id"),
-                
-                # User indexes
-                ("idx_users_slack_id", "users", "slack_id"),
-            ]
-            
-            for index_name, table_name, column_name in indexes:
-                try:
-                    cursor.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name}({column_name})")
-                    logger.debug(f"[+] Index oluşturuldu: {index_name}")
-                except sqlite3.Error as e:
-                    logger.warning(f"[!] Index oluşturulamadı ({index_name}): {e}")
-            
-            logger.info("[+] Veritabanı index'leri kontrol edildi.")
-        except Exception as e:
-            logger.warning(f"[!] Index oluşturulurken hata: {e}")
-    
-    def clean_challenge_tables(self):
-        """Challenge tablolarını temizler (startup için)."""
-        try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Foreign key constraint'leri geçici olarak devre dışı bırak
-                cursor.execute("PRAGMA foreign_keys = OFF")
-                
-                # Sırayla temizle (foreign key bağımlılıklarına göre)
-                tables = [
-                    "challenge_evaluators",
-                    "challenge_evaluations",
-                    "challenge_submissions",
-                    "challenge_participants",
-                    "challenge_hubs",
-                    "user_challenge_stats"
-                ]
-                
-                deleted_counts = {}
-                for table in tables:
-                    cursor.execute(f"DELETE FROM {table}")
-                    deleted_counts[table] = cursor.rowcount
-                    logger.debug(f"[+] {table} temizlendi: {cursor.rowcount} kayıt silindi")
-                
-                # Foreign key constraint'leri tekrar etkinleştir
-                cursor.execute("PRAGMA foreign_keys = ON")
-                
-                conn.commit()
-                
-                total_deleted = sum(deleted_counts.values())
-                if total_deleted > 0:
-                    logger.info(f"[+] Challenge tabloları temizlendi: {total_deleted} kayıt silindi")
-                else:
-                    logger.info("[i] Challenge tabloları zaten temizdi.")
-                
-                return deleted_counts
-        except Exception as e:
-            logger.error(f"[X] Challenge tabloları temizlenirken hata: {e}", exc_info=True)
-            # Hata durumunda foreign key'leri tekrar etkinleştir
-            try:
-                with self.get_connection() as conn:
-                    conn.execute("PRAGMA foreign_keys = ON")
-            except:
-                pass
-            return {}
\ No newline at end of file
+
+_SEED_THEME_IDS = frozenset(theme[0] for theme in _SEED_THEMES)
+_SEED_PROJECT_IDS = frozenset(project["id"] for project in _SEED_PROJECTS)
+
+
+@lru_cache(maxsize=1)
+def _seed_project_rows() -> Dict[str, tuple]:
+    """Proje şablonlarını INSERT satırlarına çevirir; JSON alanları ilk ihtiyaçta bir kez serileştirilir."""
+    return {
+        project["id"]: (
+            project["id"],
+            project["theme"],
+            project["name"],
+            project["description"],
+            json.dumps(project["objectives"], ensure_ascii=False),
+            json.dumps(project["deliverables"], ensure_ascii=False),
+            json.dumps(project["tasks"], ensure_ascii=False),
+            project["difficulty_level"],
+            project["estimated_hours"],
+            project["min_team_size"],
+            project["max_team_size"],
+        )
+        for project in _SEED_PROJECTS
+    }
@@ -1,9 +1,8 @@
 import os
-import faiss
+import threading
 import numpy as np
 import pickle
 from typing import List, Dict, Any, Tuple
-from sentence_transformers import SentenceTransformer
 from src.core.logger import logger
 from src.core.singleton import SingletonMeta
 
@@ -11,14 +10,19 @@ class VectorClient(metaclass=SingletonMeta):
     """
     Yerel FAISS indeksi ve SentenceTransformers kullanarak 
     ücretsiz ve limitsiz vektör arama işlemlerini yönetir.
+
+    Ağır kütüphaneler (torch/transformers, faiss) modül yüklenirken değil,
+    ilk ihtiyaç anında import edilir; böylece AI gerektirmeyen komutlar
+    ve CLI araçları bu maliyeti ödemez.
     """
 
     def __init__(self, model_name: str = "all-MiniLM-L6-v2", index_path: str = "data/vector_store"):
-        self.model = SentenceTransformer(model_name)
+        self.model_name = model_name
+        self._model = None
+        self._model_lock = threading.Lock()
         self.index_path = index_path
         self.index = None
         self.documents = []  # Chunks/Texts
-        self.dimension = self.model.get_sentence_embedding_dimension()
         
         # Dizini oluştur
         os.makedirs(os.path.dirname(index_path) if os.path.dirname(index_path) else "data", exist_ok=True)
@@ -26,6 +30,22 @@ class VectorClient(metaclass=SingletonMeta):
         # Mevcut indeksi yükle
         self.load_index()
 
+    @property
+    def model(self):
+        """SentenceTransformer modelini ilk kullanımda yükler."""
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    from sentence_transformers import SentenceTransformer
+                    logger.info(f"[>] Embedding modeli yükleniyor: {self.model_name}")
+                    self._model = SentenceTransformer(self.model_name)
+        return self._model
+
+    @property
+    def dimension(self) -> int:
+        """Embedding boyutu (model yüklenmesini tetikler)."""
+        return self.model.get_sentence_embedding_dimension()
+
     def add_texts(self, texts: List[str], metadata: List[Dict] = None):
         """Metinleri vektörleştirir ve indekse ekler."""
         if not texts:
@@ -35,6 +55,7 @@ class VectorClient(metaclass=SingletonMeta):
         embeddings = np.array(embeddings).astype('float32')
 
         if self.index is None:
+            import faiss
             self.index = faiss.IndexFlatL2(self.dimension)
         
         self.index.add(embeddings)
@@ -122,6 +143,7 @@ class VectorClient(metaclass=SingletonMeta):
     def save_index(self):
         """İndeksi ve dökümanları diske kaydeder."""
         if self.index is not None:
+            import faiss
             faiss.write_index(self.index, f"{self.index_path}.index")
             with open(f"{self.index_path}.pkl", "wb") as f:
                 pickle.dump(self.documents, f)
@@ -130,6 +152,7 @@ class VectorClient(metaclass=SingletonMeta):
     def load_index(self):
         """İndeksi ve dökümanları diskten yükler."""
         if os.path.exists(f"{self.index_path}.index"):
+            import faiss
             self.index = faiss.read_index(f"{self.index_path}.index")
             with open(f"{self.index_path}.pkl", "rb") as f:
                 self.documents = pickle.load(f)
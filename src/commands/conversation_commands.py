@@ -1,7 +1,13 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Any, Union
 from src.core.logger import logger
 from src.core.exceptions import SlackClientError
 
+# conversations.invite başına kullanıcı sayısı ve eşzamanlı çağrı üst sınırı (Tier 3 limitleri)
+INVITE_CHUNK_SIZE = 50
+INVITE_MAX_PARALLEL = 3
+
 class ConversationManager:
     """
     Slack Konuşma/Kanal (Conversations) işlemlerini merkezi olarak yöneten sınıf.
@@ -166,47 +172,86 @@ class ConversationManager:
             except Exception:
                 return {"id": channel_id}
         
+        # Büyük listeler parçalar halinde davet edilir; birden fazla parça varsa sınırlı paralellikle
+        chunks = [
+            final_user_ids[i:i + INVITE_CHUNK_SIZE]
+            for i in range(0, len(final_user_ids), INVITE_CHUNK_SIZE)
+        ]
+        if len(chunks) == 1:
+            self._invite_chunk(client_to_use, channel_id, chunks[0])
+        else:
+            with ThreadPoolExecutor(max_workers=INVITE_MAX_PARALLEL) as executor:
+                futures = [
+                    executor.submit(self._invite_chunk, client_to_use, channel_id, chunk)
+                    for chunk in chunks
+                ]
+                # Tüm parçalar bitsin; kritik hata varsa ilki fırlatılır
+                errors = [f.exception() for f in futures if f.exception() is not None]
+            if errors:
+                raise errors[0]
+
+        token_type = "user token" if self.user_client else "bot token"
+        logger.info(
+            f"[+] Davet gönderildi: {len(final_user_ids)} kullanıcı, {len(chunks)} parça "
+            f"(Kanal: {channel_id}) - {token_type} kullanıldı"
+        )
         try:
-            response = client_to_use.conversations_invite(channel=channel_id, users=final_user_ids)
-            if response["ok"]:
-                token_type = "user token" if self.user_client else "bot token"
-                logger.info(f"[+] Davet gönderildi: {len(final_user_ids)} kullanıcı (Kanal: {channel_id}) - {token_type} kullanıldı")
-                try:
-                    return self.get_info(channel_id)
-                except Exception:
-                    return {"id": channel_id}
-            
-            # Kısmi başarı durumunu kontrol et (bazı kullanıcılar zaten kanalda olabilir)
-            if "errors" in response:
-                # Sadece 'cant_invite_self' veya 'already_in_channel' hataları varsa, kısmi başarı sayılabilir
-                non_critical_errors = ["cant_invite_self", "already_in_channel"]
-                critical_errors = [err for err in response.get("errors", []) 
-                                if err.get("error") not in non_critical_errors]
-                
-                if not critical_errors:
-                    # Bazı kullanıcılar davet edildi, bazıları zaten kanaldaydı - bu başarı sayılır
-                    logger.info(f"[i] Kısmi başarı: Bazı kullanıcılar zaten kanalda (Kanal: {channel_id})")
+            return self.get_info(channel_id)
+        except Exception:
+            return {"id": channel_id}
+
+    def _invite_chunk(self, client_to_use, channel_id: str, user_ids: List[str], max_retries: int = 3):
+        """
+        Tek bir conversations.invite çağrısı yapar.
+        Rate limit (429) durumunda Retry-After kadar bekleyip tekrar dener;
+        'cant_invite_self' / 'already_in_channel' hataları başarı sayılır.
+        """
+        non_critical_errors = ["cant_invite_self", "already_in_channel"]
+
+        for attempt in range(max_retries):
+            try:
+                response = client_to_use.conversations_invite(channel=channel_id, users=user_ids)
+                if response["ok"]:
+                    return
+
+                # Kısmi başarı durumunu kontrol et (bazı kullanıcılar zaten kanalda olabilir)
+                if "errors" in response:
+                    critical_errors = [err for err in response.get("errors", [])
+                                       if err.get("error") not in non_critical_errors]
+                    if not critical_errors:
+                        logger.info(f"[i] Kısmi başarı: Bazı kullanıcılar zaten kanalda (Kanal: {channel_id})")
+                        return
+
+                raise SlackClientError(response.get('error', 'Bilinmeyen hata'))
+            except SlackClientError:
+                raise
+            except Exception as e:
+                error_str = str(e)
+                # 'cant_invite_self' veya 'already_in_channel' hatalarını yumuşak handle et
+                if any(err in error_str for err in non_critical_errors):
+                    logger.warning(f"[!] Bazı kullanıcılar zaten kanalda, devam ediliyor: {e}")
+                    return
+
+                error_response = getattr(e, "response", None)
+                is_rate_limited = (
+                    getattr(error_response, "status_code", None) == 429
+                    or "ratelimited" in error_str
+                    or "rate_limited" in error_str
+                )
+                if is_rate_limited and attempt < max_retries - 1:
                     try:
-                        channel_info = self.get_info(channel_id)
-                        return channel_info
+                        retry_after = int(error_response.headers.get("Retry-After", 1))
                     except Exception:
-                        return {"id": channel_id}
-            
-            raise SlackClientError(response.get('error', 'Bilinmeyen hata'))
-        except SlackClientError:
-            raise
-        except Exception as e:
-            error_str = str(e)
-            # 'cant_invite_self' veya 'already_in_channel' hatalarını yumuşak handle et
-            if "cant_invite_self" in error_str or "already_in_channel" in error_str:
-                logger.warning(f"[!] Bazı kullanıcılar zaten kanalda, devam ediliyor: {e}")
-                try:
-                    channel_info = self.get_info(channel_id)
-                    return channel_info
-                except Exception:
-                    return {"id": channel_id}
-            logger.error(f"[X] conversations.invite hatası: {e}")
-            raise SlackClientError(str(e))
+                        retry_after = 1
+                    logger.warning(
+                        f"[!] conversations.invite rate limit! {retry_after} saniye bekleniyor... "
+                        f"(deneme {attempt + 1}/{max_retries}) | Kanal: {channel_id}"
+                    )
+                    time.sleep(retry_after)
+                    continue
+
+                logger.error(f"[X] conversations.invite hatası: {e}")
+                raise SlackClientError(str(e))
 
     def kick_user(self, channel_id: str, user_id: str, max_retries: int = 3) -> bool:
         """
@@ -214,8 +259,6 @@ class ConversationManager:
         User token varsa onu kullanır (workspace owner olarak işlem yapar).
         Rate limit hatalarında otomatik retry yapar.
         """
-        import time
-        
         # User token varsa onu kullan (workspace owner olarak işlem yapar)
         client_to_use = self.user_client if self.user_client else self.client
         token_type = "user token" if self.user_client else "bot token"
@@ -0,0 +1,60 @@
+"""
+Senkron koddan (Bolt handler'ları, APScheduler thread'leri) coroutine çalıştırmak için
+paylaşılan arka plan event loop'u.
+Her çağrıda asyncio.run ile loop kurup yıkmak yerine tek bir kalıcı loop kullanılır.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Coroutine, Optional
+
+from src.core.logger import logger
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_thread: Optional[threading.Thread] = None
+_lock = threading.Lock()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Paylaşılan loop'u döndürür; ilk çağrıda daemon thread üzerinde başlatır."""
+    global _loop, _thread
+    # İlk kontrol (Kilit maliyetinden kaçınmak için)
+    if _loop is None or _loop.is_closed():
+        with _lock:
+            if _loop is None or _loop.is_closed():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="async-loop", daemon=True)
+                thread.start()
+                _loop, _thread = loop, thread
+                logger.debug("[i] Paylaşılan async loop başlatıldı.")
+    return _loop
+
+
+def run_async(coro: Coroutine[Any, Any, Any], timeout: Optional[float] = None) -> Any:
+    """
+    Coroutine'i paylaşılan loop'ta çalıştırır ve sonucunu bekler.
+    Zaman aşımında coroutine iptal edilir ve (yerleşik) TimeoutError fırlatılır.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, get_loop())
+    try:
+        return future.result(timeout)
+    except FutureTimeoutError:
+        future.cancel()
+        # Python 3.10'da concurrent.futures.TimeoutError yerleşik TimeoutError'dan türemez
+        raise TimeoutError(f"Coroutine {timeout} saniyede tamamlanmadı") from None
+
+
+def stop_loop(timeout: float = 5.0):
+    """Paylaşılan loop'u durdurur ve kapatır (shutdown için)."""
+    global _loop, _thread
+    with _lock:
+        loop, thread = _loop, _thread
+        _loop, _thread = None, None
+    if loop is None:
+        return
+    loop.call_soon_threadsafe(loop.stop)
+    if thread is not None:
+        thread.join(timeout=timeout)
+    if not loop.is_running():
+        loop.close()
@@ -9,6 +9,10 @@ class DatabaseError(CemilBotError):
     """Veritabanı işlemleri sırasında oluşan hatalar."""
     pass
 
+class DuplicateRecordError(DatabaseError):
+    """Benzersizlik (UNIQUE) kısıtını ihlal eden kayıt eklenmeye çalışıldığında fırlatılan hata."""
+    pass
+
 class SlackClientError(CemilBotError):
     """Slack API ile iletişim sırasında oluşan hatalar."""
     pass
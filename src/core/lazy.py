@@ -0,0 +1,41 @@
+"""
+İlk erişimde oluşturulan (lazy) nesne sarmalayıcısı.
+"""
+
+import threading
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class Lazy(Generic[T]):
+    """
+    İlk kullanımda oluşturulan (lazy) servis sarmalayıcısı.
+    Nadiren kullanılan servisler bot açılışında değil, ilk erişimde ilklendirilir.
+    Nitelik erişimleri gerçek nesneye yönlendirildiği için handler'lar değişmeden kullanabilir.
+    """
+
+    def __init__(self, factory: Callable[[], T]):
+        self._factory = factory
+        self._value = _MISSING
+        self._lock = threading.Lock()
+
+    def value(self) -> T:
+        """Gerçek nesneyi döndürür; ilk çağrıda (thread-safe) oluşturur."""
+        # İlk kontrol (Kilit maliyetinden kaçınmak için)
+        if self._value is _MISSING:
+            with self._lock:
+                if self._value is _MISSING:
+                    self._value = self._factory()
+        return self._value
+
+    @property
+    def is_resolved(self) -> bool:
+        """Nesne oluşturuldu mu?"""
+        return self._value is not _MISSING
+
+    def __getattr__(self, name: str):
+        # Sadece Lazy'de bulunmayan nitelikler için çağrılır
+        return getattr(self.value(), name)
@@ -3,6 +3,7 @@ Cemil Bot için merkezi konfigürasyon yönetimi.
 Pydantic Settings kullanarak environment variable'ları yönetir.
 """
 
+from functools import lru_cache
 from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, field_validator, ConfigDict
@@ -60,8 +61,16 @@ class BotSettings(BaseSettings):
         validation_alias="DB_PATH"
     )
     
+    db_pool_size: int = Field(8, description="SQLite bağlantı havuzu boyutu (cron + Bolt thread sayısına göre)")
+    db_mmap_size: int = Field(
+        268435456,
+        ge=0,
+        description="SQLite memory-mapped I/O boyutu (byte, varsayılan 256 MB; düşük RAM'li ortamlarda 0 ile kapatılır)"
+    )
+    
     # Knowledge Base Ayarları
     knowledge_base_path: str = Field("knowledge_base", description="Bilgi küpü klasör yolu")
+    kb_read_concurrency: int = Field(4, description="Bilgi küpü indekslenirken paralel okunacak en fazla dosya sayısı")
     
     # Başlangıç Senaryo Ayarları (Soruları Otomatize Etmek İçin)
     db_clean_on_startup: bool = Field(False, description="Başlangıçta challenge tablolarını temizle")
@@ -78,7 +87,7 @@ class BotSettings(BaseSettings):
             raise ValueError(f"Log seviyesi {valid_levels} arasından biri olmalı")
         return v.upper()
     
-    @field_validator('rate_limit_requests', 'rate_limit_window')
+    @field_validator('rate_limit_requests', 'rate_limit_window', 'db_pool_size', 'kb_read_concurrency')
     @classmethod
     def validate_positive_int(cls, v: int) -> int:
         """Pozitif integer doğrula."""
@@ -94,13 +103,14 @@ class BotSettings(BaseSettings):
     )
 
 
-# Global settings instance
-_settings: Optional[BotSettings] = None
+@lru_cache(maxsize=1)
+def _load_settings() -> BotSettings:
+    """Environment/.env okumasını tek seferlik yapar (sonuç önbellekte tutulur)."""
+    return BotSettings()
 
 
 def get_settings(reload: bool = False) -> BotSettings:
-    """Settings singleton instance döndürür."""
-    global _settings
-    if _settings is None or reload:
-        _settings = BotSettings()
-    return _settings
+    """Settings singleton instance döndürür. reload=True önbelleği temizleyip yeniden okur."""
+    if reload:
+        _load_settings.cache_clear()
+    return _load_settings()
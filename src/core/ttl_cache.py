@@ -0,0 +1,64 @@
+"""
+Süreli (TTL) bellek içi önbellek.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Thread-safe, boyut sınırlı ve süreli anahtar-değer önbelleği.
+    Süresi dolan kayıtlar okunurken veya kapasite dolduğunda temizlenir.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 60.0):
+        """
+        Args:
+            maxsize: Saklanacak en fazla kayıt sayısı
+            ttl: Kaydın geçerlilik süresi (saniye)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Geçerli kaydı döndürür; yoksa veya süresi dolmuşsa default döner."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        """Kaydı ttl süresiyle saklar."""
+        now = time.monotonic()
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                # Önce süresi dolanları at, yine yer yoksa en eski kaydı çıkar
+                expired = [k for k, (expires_at, _) in self._data.items() if expires_at <= now]
+                for k in expired:
+                    del self._data[k]
+                if len(self._data) >= self.maxsize:
+                    del self._data[next(iter(self._data))]
+            self._data[key] = (now + self.ttl, value)
+
+    def pop(self, key: Hashable):
+        """Kaydı (varsa) siler."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        """Tüm kayıtları siler."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
@@ -2,12 +2,31 @@
 Input validation için Pydantic modelleri.
 """
 
-import re
 from typing import List, Optional
-from pydantic import BaseModel, field_validator, Field
+from pydantic import BaseModel, ConfigDict, field_validator, Field
 
+# Geri bildirim kategorileri (her doğrulamada liste yeniden oluşturulmasın diye modül seviyesinde)
+_VALID_FEEDBACK_CATEGORIES = frozenset({'general', 'technical', 'feature', 'bug', 'other'})
 
-class PollRequest(BaseModel):
+
+class _RequestModel(BaseModel):
+    """Komut istek modelleri için ortak taban."""
+
+    # Tüm str alanları (liste elemanları dahil) Pydantic çekirdeğinde kırpılır;
+    # validator'lar sadece Türkçe hata mesajı gereken kontrolleri yapar
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    @classmethod
+    def fast_construct(cls, **data):
+        """
+        Doğrulama yapmadan model oluşturur (model_construct).
+        DİKKAT: Sadece parse_from_text içinde, alanların kısıtları elle kanıtlandıktan sonra kullanılmalı;
+        dışarıdan gelen doğrulanmamış veri için normal constructor / model_validate kullanılır.
+        """
+        return cls.model_construct(**data)
+
+
+class PollRequest(_RequestModel):
     """Oylama komutu için input validation."""
     
     minutes: int = Field(..., description="Oylama süresi (dakika)")
@@ -26,7 +45,6 @@ class PollRequest(BaseModel):
     @classmethod
     def validate_topic(cls, v: str) -> str:
         """Konu başlığını doğrula."""
-        v = v.strip()
         if not v:
             raise ValueError('Konu başlığı boş olamaz')
         if len(v) > 200:
@@ -42,17 +60,14 @@ class PollRequest(BaseModel):
         if len(v) > 10:
             raise ValueError('En fazla 10 seçenek olabilir')
         
-        # Seçenekleri temizle ve doğrula
-        cleaned_options = []
+        # Seçenekler çekirdekte kırpılmış olarak gelir
         for opt in v:
-            opt = opt.strip()
             if not opt:
                 raise ValueError('Boş seçenek olamaz')
             if len(opt) > 100:
                 raise ValueError('Her seçenek en fazla 100 karakter olabilir')
-            cleaned_options.append(opt)
         
-        return cleaned_options
+        return v
     
     @classmethod
     def parse_from_text(cls, text: str) -> 'PollRequest':
@@ -69,17 +84,17 @@ class PollRequest(BaseModel):
         except ValueError:
             raise ValueError("İlk parametre bir sayı olmalı (dakika)")
         
-        content_parts = parts[1].split("|")
+        # Konu + en fazla 10 seçenek; fazlası ayrıca bölünmez, fazladan bir parça
+        # kalır ve validate_options 'En fazla 10 seçenek' hatasını verir
+        content_parts = parts[1].split("|", 11)
         if len(content_parts) < 3:
             raise ValueError("En az iki seçenek gerekli. Format: [Konu] | Seçenek 1 | Seçenek 2")
         
-        topic = content_parts[0].strip()
-        options = [opt.strip() for opt in content_parts[1:]]
-        
-        return cls(minutes=minutes, topic=topic, options=options)
+        # Kırpma işlemini model (str_strip_whitespace) yapar; burada tekrar strip edilmez
+        return cls(minutes=minutes, topic=content_parts[0], options=content_parts[1:])
 
 
-class FeedbackRequest(BaseModel):
+class FeedbackRequest(_RequestModel):
     """Geri bildirim komutu için input validation."""
     
     category: str = Field(default="general", description="Geri bildirim kategorisi")
@@ -89,7 +104,6 @@ class FeedbackRequest(BaseModel):
     @classmethod
     def validate_content(cls, v: str) -> str:
         """İçeriği doğrula."""
-        v = v.strip()
         if not v:
             raise ValueError('Geri bildirim içeriği boş olamaz')
         if len(v) > 2000:
@@ -100,9 +114,8 @@ class FeedbackRequest(BaseModel):
     @classmethod
     def validate_category(cls, v: str) -> str:
         """Kategoriyi doğrula."""
-        v = v.strip().lower()
-        valid_categories = ['general', 'technical', 'feature', 'bug', 'other']
-        if v not in valid_categories:
+        v = v.lower()
+        if v not in _VALID_FEEDBACK_CATEGORIES:
             return 'general'  # Geçersiz kategori için default
         return v
     
@@ -124,7 +137,7 @@ class FeedbackRequest(BaseModel):
             return cls(category=parts[0], content=parts[1])
 
 
-class QuestionRequest(BaseModel):
+class QuestionRequest(_RequestModel):
     """Soru komutu için input validation."""
     
     question: str = Field(..., description="Sorulan soru")
@@ -133,7 +146,6 @@ class QuestionRequest(BaseModel):
     @classmethod
     def validate_question(cls, v: str) -> str:
         """Soruyu doğrula."""
-        v = v.strip()
         if not v:
             raise ValueError('Soru boş olamaz')
         if len(v) > 500:
@@ -141,7 +153,7 @@ class QuestionRequest(BaseModel):
         return v
 
 
-class HelpRequest(BaseModel):
+class HelpRequest(_RequestModel):
     """Yardım isteği komutu için input validation."""
     
     topic: str = Field(..., description="Yardım isteği konusu")
@@ -151,7 +163,6 @@ class HelpRequest(BaseModel):
     @classmethod
     def validate_topic(cls, v: str) -> str:
         """Konuyu doğrula."""
-        v = v.strip()
         if not v:
             raise ValueError('Yardım isteği konusu boş olamaz')
         if len(v) > 200:
@@ -162,7 +173,6 @@ class HelpRequest(BaseModel):
     @classmethod
     def validate_description(cls, v: str) -> str:
         """Açıklamayı doğrula."""
-        v = v.strip()
         if len(v) > 1000:
             raise ValueError('Açıklama en fazla 1000 karakter olabilir')
         return v
@@ -185,7 +195,7 @@ class HelpRequest(BaseModel):
             return cls(topic=parts[0], description=parts[1])
 
 
-class ChallengeStartRequest(BaseModel):
+class ChallengeStartRequest(_RequestModel):
     """Challenge başlatma komutu için input validation - Sadece kişi sayısı."""
     
     team_size: int = Field(
@@ -201,23 +211,26 @@ class ChallengeStartRequest(BaseModel):
         Parse: /challenge start 4
         Sadece kişi sayısı alınır, tema ve diğer parametreler random seçilir.
         """
-        text = text.strip()
+        # Tek geçiş: split baştaki boşlukları da atlar, ayrıca strip gerekmez;
+        # team_size ilk ve tek parametre, metnin geri kalanı bölünmez
+        parts = text.split(maxsplit=1)
         
-        if not text:
+        if not parts:
             raise ValueError("Kişi sayısı gerekli. Örnek: `/challenge start 4`")
         
-        parts = text.split()
-        
-        # team_size (ilk ve tek parametre)
         try:
             team_size = int(parts[0])
         except ValueError:
             raise ValueError("Kişi sayısı bir sayı olmalı (2-6 arası)")
         
-        return cls(team_size=team_size)
+        if not 2 <= team_size <= 6:
+            # Aralık dışı: Pydantic ValidationError'ı fırlatsın (handler bu hatayı yakalıyor)
+            return cls(team_size=team_size)
+        # Tam sayı ve 2-6 aralığı yukarıda kanıtlandı
+        return cls.fast_construct(team_size=team_size)
 
 
-class ChallengeJoinRequest(BaseModel):
+class ChallengeJoinRequest(_RequestModel):
     """Challenge katılma komutu için input validation."""
     
     challenge_id: Optional[str] = Field(
@@ -231,7 +244,6 @@ class ChallengeJoinRequest(BaseModel):
         Parse: /challenge join [challenge_id]
         """
         text = text.strip()
-        if not text:
-            return cls(challenge_id=None)
-        return cls(challenge_id=text)
+        # Tek alan serbest metin (opsiyonel), doğrulanacak kısıt yok
+        return cls.fast_construct(challenge_id=text or None)
 
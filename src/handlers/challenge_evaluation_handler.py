@@ -8,9 +8,7 @@ from slack_bolt import App
 from src.core.logger import logger
 from src.services import ChallengeEvaluationService, ChallengeHubService
 from src.commands import ChatManager
-from src.repositories import UserRepository, ChallengeHubRepository, ChallengeEvaluationRepository
-from src.clients import DatabaseClient
-from src.core.settings import get_settings
+from src.repositories import UserRepository
 
 
 def setup_challenge_evaluation_handlers(
@@ -21,6 +19,10 @@ def setup_challenge_evaluation_handlers(
     user_repo: UserRepository
 ):
     """Challenge değerlendirme handler'larını kaydeder."""
+    # Repository'ler servislerden bir kez alınır (her event'te DatabaseClient/Repository kurulmaz)
+    hub_repo = evaluation_service.hub_repo
+    eval_repo = evaluation_service.evaluation_repo
+    evaluator_repo = evaluation_service.evaluator_repo
 
     @app.action("evaluate_challenge_button")
     def handle_evaluate_button(ack, body):
@@ -125,10 +127,6 @@ def setup_challenge_evaluation_handlers(
                 return
             
             # Bu kanal bir challenge kanalı mı?
-            settings = get_settings()
-            db_client = DatabaseClient(db_path=settings.database_path)
-            hub_repo = ChallengeHubRepository(db_client)
-            
             challenge = hub_repo.get_by_channel_id(channel_id)
             if not challenge:
                 return
@@ -138,7 +136,6 @@ def setup_challenge_evaluation_handlers(
                 return
             
             # Zaten değerlendirme başlatılmış mı?
-            eval_repo = ChallengeEvaluationRepository(db_client)
             existing = eval_repo.get_by_challenge(challenge["id"])
             if existing:
                 return
@@ -165,18 +162,11 @@ def setup_challenge_evaluation_handlers(
             user_id = event.get("user")
             
             # Bu kanal bir değerlendirme kanalı mı?
-            settings = get_settings()
-            db_client = DatabaseClient(db_path=settings.database_path)
-            eval_repo = ChallengeEvaluationRepository(db_client)
-            
             evaluation = eval_repo.get_by_channel_id(channel_id)
             if not evaluation:
                 return
             
             # Kullanıcı değerlendirici mi kontrol et
-            from src.repositories import ChallengeEvaluatorRepository
-            evaluator_repo = ChallengeEvaluatorRepository(db_client)
-            
             evaluator = evaluator_repo.get_by_evaluation_and_user(
                 evaluation["id"], 
                 user_id
@@ -25,6 +25,12 @@ def setup_challenge_handlers(
 ):
     """Challenge handler'larını kaydeder."""
     settings = get_settings()
+    # Repository'ler servislerden bir kez alınır (her komutta DatabaseClient/Repository kurulmaz)
+    db_client = user_repo.db_client
+    hub_repo = challenge_service.hub_repo
+    participant_repo = challenge_service.participant_repo
+    theme_repo = challenge_service.theme_repo
+    eval_repo = evaluation_service.evaluation_repo
     rate_limiter = get_rate_limiter(
         max_requests=settings.rate_limit_requests,
         window_seconds=settings.rate_limit_window
@@ -79,16 +85,7 @@ def setup_challenge_handlers(
         subcommand = parts[0].lower()
         subcommand_text = parts[1] if len(parts) > 1 else ""
 
-        # Kullanıcı bilgisini al
-        try:
-            user_data = user_repo.get_by_slack_id(user_id)
-            user_name = user_data.get('full_name', user_id) if user_data else user_id
-        except Exception:
-            user_name = user_id
-
-        logger.info(f"[>] /challenge {subcommand} komutu geldi | Kullanıcı: {user_name} ({user_id})")
-
-        # Rate limiting
+        # Rate limiting (en ucuz kontrol; reddedilen istek için DB'ye gidilmez)
         allowed, error_msg = rate_limiter.is_allowed(user_id)
         if not allowed:
             chat_manager.post_ephemeral(
@@ -105,6 +102,11 @@ def setup_challenge_handlers(
             )
             return
 
+        # Kullanıcı bilgisini al (UserRepository önbelleğinden)
+        user_name = user_repo.get_display_name(user_id)
+
+        logger.info(f"[>] /challenge {subcommand} komutu geldi | Kullanıcı: {user_name} ({user_id})")
+
         if subcommand == "start":
             handle_start_challenge(subcommand_text, user_id, channel_id)
         elif subcommand == "join":
@@ -160,11 +162,6 @@ def setup_challenge_handlers(
             return
 
         # Mevcut temaları veritabanından çek
-        from src.repositories import ChallengeThemeRepository
-        from src.clients import DatabaseClient
-        
-        db_client = DatabaseClient(db_path=settings.database_path)
-        theme_repo = ChallengeThemeRepository(db_client)
         active_themes = theme_repo.get_active_themes()
         
         if not active_themes:
@@ -325,15 +322,6 @@ def setup_challenge_handlers(
         """Challenge durumunu göster."""
         async def process_status():
             # Kullanıcının aktif challenge'ını bul (katılımcı olarak VEYA creator olarak)
-            from src.repositories import ChallengeParticipantRepository, ChallengeHubRepository
-            from src.clients import DatabaseClient
-            from src.core.settings import get_settings
-            
-            settings = get_settings()
-            db_client = DatabaseClient(db_path=settings.database_path)
-            participant_repo = ChallengeParticipantRepository(db_client)
-            hub_repo = ChallengeHubRepository(db_client)
-            
             # Önce katılımcı olarak bak
             active_challenges = participant_repo.get_user_active_challenges(user_id)
             
@@ -409,14 +397,6 @@ def setup_challenge_handlers(
         """Challenge bitirme komutu - Challenge kanalında çalıştırılmalı."""
         async def process_finish():
             # Bu kanal bir challenge kanalı mı?
-            from src.repositories import ChallengeHubRepository, ChallengeEvaluationRepository
-            from src.clients import DatabaseClient
-            from src.core.settings import get_settings
-            
-            settings = get_settings()
-            db_client = DatabaseClient(db_path=settings.database_path)
-            hub_repo = ChallengeHubRepository(db_client)
-            
             challenge = hub_repo.get_by_channel_id(channel_id)
             if not challenge:
                 chat_manager.post_ephemeral(
@@ -436,7 +416,6 @@ def setup_challenge_handlers(
                 return
             
             # Zaten değerlendirme başlatılmış mı?
-            eval_repo = ChallengeEvaluationRepository(db_client)
             existing = eval_repo.get_by_challenge(challenge["id"])
             if existing:
                 # Mesajı hub kanalına veya mevcut kanala gönder (challenge kanalı arşivlenmiş olabilir)
@@ -492,15 +471,6 @@ def setup_challenge_handlers(
 
         async def process_set():
             # Değerlendirme kanalında mı kontrol et
-            from src.repositories import ChallengeEvaluationRepository, ChallengeHubRepository
-            from src.clients import DatabaseClient
-            from src.core.settings import get_settings
-            
-            settings = get_settings()
-            db_client = DatabaseClient(db_path=settings.database_path)
-            eval_repo = ChallengeEvaluationRepository(db_client)
-            hub_repo = ChallengeHubRepository(db_client)
-            
             # Bu kanal bir değerlendirme kanalı mı?
             evaluation = eval_repo.get_by_channel_id(channel_id)
             if not evaluation:
@@ -592,12 +562,6 @@ def setup_challenge_handlers(
                 return
 
             # Bu kanal bir değerlendirme kanalı mı?
-            from src.repositories import ChallengeEvaluationRepository
-            from src.clients import DatabaseClient
-            
-            db_client = DatabaseClient(db_path=settings.database_path)
-            eval_repo = ChallengeEvaluationRepository(db_client)
-            
             evaluation_list = eval_repo.list(filters={"evaluation_channel_id": channel_id})
             if not evaluation_list:
                 chat_manager.post_ephemeral(
@@ -676,11 +640,7 @@ def setup_challenge_handlers(
             return
         
         # Kullanıcı bilgisini al
-        try:
-            user_data = user_repo.get_by_slack_id(user_id)
-            user_name = user_data.get('full_name', user_id) if user_data else user_id
-        except Exception:
-            user_name = user_id
+        user_name = user_repo.get_display_name(user_id)
         
         logger.info(f"[>] Challenge join butonu tıklandı | Kullanıcı: {user_name} ({user_id}) | Challenge: {challenge_id}")
         
@@ -719,15 +679,6 @@ def setup_challenge_handlers(
                         return
                     
                     # Challenge bilgisini al (servis üzerinden)
-                    from src.repositories import ChallengeHubRepository, ChallengeParticipantRepository
-                    from src.clients import DatabaseClient
-                    from src.core.settings import get_settings
-                    
-                    settings = get_settings()
-                    db_client = DatabaseClient(db_path=settings.database_path)
-                    hub_repo = ChallengeHubRepository(db_client)
-                    participant_repo = ChallengeParticipantRepository(db_client)
-                    
                     challenge = hub_repo.get(challenge_id)
                     if not challenge:
                         logger.warning(f"[!] Challenge bulunamadı: {challenge_id}")
@@ -838,11 +789,7 @@ def setup_challenge_handlers(
             return
         
         # Kullanıcı bilgisini al
-        try:
-            user_data = user_repo.get_by_slack_id(user_id)
-            user_name = user_data.get('full_name', user_id) if user_data else user_id
-        except Exception:
-            user_name = user_id
+        user_name = user_repo.get_display_name(user_id)
         
         logger.info(f"[>] Tema seçildi: {theme_name} | Kullanıcı: {user_name} ({user_id}) | Takım: {team_size + 1}")
         
@@ -1177,14 +1124,9 @@ def setup_challenge_handlers(
         
         async def process_cancel():
             try:
-                # Challenge'ı al
-                from src.repositories import ChallengeHubRepository
-                from src.clients import DatabaseClient
-                
                 settings = get_settings()
-                db_client = DatabaseClient(db_path=settings.database_path)
-                hub_repo = ChallengeHubRepository(db_client)
-                
+
+                # Challenge'ı al
                 challenge = hub_repo.get(challenge_id)
                 if not challenge:
                     chat_manager.post_ephemeral(
@@ -43,12 +43,7 @@ def setup_coffee_handlers(
             return
         
         # Kullanıcı bilgisini al
-        try:
-            user_data = user_repo.get_by_slack_id(user_id)
-            user_name = user_data.get('full_name', user_id) if user_data else user_id
-        except Exception as e:
-            logger.warning(f"[!] Kullanıcı bilgisi alınamadı: {e}")
-            user_name = user_id
+        user_name = user_repo.get_display_name(user_id)
         
         logger.info(f"[>] /kahve komutu geldi | Kullanıcı: {user_name} ({user_id}) | Kanal: {channel_id}")
         
@@ -90,11 +85,7 @@ def setup_coffee_handlers(
         channel_id = body["channel"]["id"]
         
         # Kullanıcı bilgisini al
-        try:
-            user_data = user_repo.get_by_slack_id(user_id)
-            user_name = user_data.get('full_name', user_id) if user_data else user_id
-        except Exception:
-            user_name = user_id
+        user_name = user_repo.get_display_name(user_id)
         
         logger.info(f"[>] join_coffee action tetiklendi | Kullanıcı: {user_name} ({user_id}) | Kanal: {channel_id}")
         
@@ -1,9 +1,8 @@
-import asyncio
 import random
 import time
-from datetime import datetime
 from slack_bolt import App
 from src.core.logger import logger
+from src.core.async_loop import run_async
 from src.clients import GroqClient
 from src.commands import ChatManager
 
@@ -68,6 +67,28 @@ DAILY_CONFIGS = {
     }
 }
 
+# AI'nın seçebileceği geniş tema havuzu
+DAILY_THEMES = (
+    "Space & Astronomy", "Cooking & Spices", "Ocean Life", "Ancient Civilizations",
+    "Weekend Traditions", "Gardening Tips", "Urban Exploration", "Street Food",
+    "Public Transport Adventures", "Morning Rituals", "Art & Museums"
+)
+
+def _daily_card_blocks(response: str, user_id: str) -> list:
+    """Daily kartının bloklarını oluşturur (sadece yanıt ve kullanıcı dinamiktir)."""
+    return [
+        {"type": "section", "text": {"type": "mrkdwn", "text": response}},
+        {"type": "context", "elements": [{"type": "mrkdwn", "text": f"Requested by <@{user_id}>"}]}
+    ]
+
+# Geçersiz komut yanıtı (her reddedişte yeniden oluşturulmaz)
+_INVALID_DAILY_TEXT = "⚠️ Geçersiz komut! Şunları deneyebilirsin: `{}`".format(
+    ", ".join(k.capitalize() for k in DAILY_CONFIGS)
+)
+
+# Groq yanıtı için beklenecek en uzun süre (saniye)
+DAILY_TIMEOUT_SECONDS = 30
+
 #* --- COOLDOWN STORAGE ---
 # Yapı: { "user_id": { "english": timestamp, "motivasyon": timestamp } }
 DAILY_COOLDOWN_STORAGE = {}
@@ -80,15 +101,15 @@ def setup_daily_handlers(app: App, groq_client: GroqClient, chat_manager: ChatMa
         user_id = body["user_id"]
 
         # 1. Kullanıcının yazdığı ham metni alıyoruz temizliyoruz ve Alias Kontrolü yapıyoruz
-        raw_text = body.get("text", "").strip().lower()
+        # casefold() + 'İ' düzeltmesi: "İNGİLİZCE" gibi Türkçe büyük harfler de eşleşsin
+        raw_text = body.get("text", "").strip().replace("İ", "i").casefold()
 
         # ALIASES içinden raw_text'i arıyoruz, bulamazsak None döner.
         user_text = ALIASES.get(raw_text) # Yazılan kelime havuzda var mı?
 
         # 2. VALIDATION (Geçerli bir komut mu?)
         if not user_text or user_text not in DAILY_CONFIGS:
-            available = ", ".join([k.capitalize() for k in DAILY_CONFIGS.keys()])
-            respond(text=f"⚠️ Geçersiz komut! Şunları deneyebilirsin: `{available}`", response_type="ephemeral")
+            respond(text=_INVALID_DAILY_TEXT, response_type="ephemeral")
             return
 
         # 3. COOLDOWN KONTROLÜ (Kullanıcı ve komut bazlı)
@@ -112,16 +133,10 @@ def setup_daily_handlers(app: App, groq_client: GroqClient, chat_manager: ChatMa
                 # 1. DAHA GÜÇLÜ RANDOMİZASYON
                 # Sadece 4 haneli sayı değil, mikrosaniyeyi de işin içine katalım
                 unique_id = int(time.time() * 1000) % 100000 
-                current_date_str = datetime.now().strftime("%d %B %Y, %H:%M")
                 
                 # 2. DİNAMİK USER PROMPT (AI'yı zorluyoruz)
                 # AI'ya her seferinde tamamen farklı bir alt konu seçmesini emrediyoruz AI'nın seçebileceği geniş bir tema havuzu oluşturuyoruz
-                themes = [
-                    "Space & Astronomy", "Cooking & Spices", "Ocean Life", "Ancient Civilizations",
-                    "Weekend Traditions", "Gardening Tips", "Urban Exploration", "Street Food",
-                    "Public Transport Adventures", "Morning Rituals", "Art & Museums"
-                ]
-                chosen_theme = random.choice(themes) # Her seferinde birini rastgele seçiyoruz
+                chosen_theme = random.choice(DAILY_THEMES) # Her seferinde birini rastgele seçiyoruz
 
                 dynamic_user_prompt = (
                     f"Seed: {unique_id}. Topic category: {chosen_theme}. " # Temayı zorunlu kılıyoruz
@@ -135,21 +150,7 @@ def setup_daily_handlers(app: App, groq_client: GroqClient, chat_manager: ChatMa
                 )
                 
                 # Başarılı ise kanala gönder (Groq tarafından yazısı silindi, kim tarafından istendiği yazıyor sadece.)
-                say(
-                    text=f"{config['title']} Card",
-                    blocks=[
-                        {
-                            "type": "section",
-                            "text": {"type": "mrkdwn", "text": response}
-                        },
-                        {
-                            "type": "context",
-                            "elements": [{
-                                "type": "mrkdwn", 
-                                "text": f"Requested by <@{user_id}>"}]
-                        }
-                    ]
-                )
+                say(text=f"{config['title']} Card", blocks=_daily_card_blocks(response, user_id))
                 
                 # 5. COOLDOWN GÜNCELLEME (Başarıdan sonra listeye ekle)
                 if user_id not in DAILY_COOLDOWN_STORAGE:
@@ -161,5 +162,10 @@ def setup_daily_handlers(app: App, groq_client: GroqClient, chat_manager: ChatMa
                 logger.error(f"Daily error: {e}")
                 respond(text="❌ Bir hata oluştu, lütfen daha sonra dene.")
 
-        asyncio.run(process_daily())
+        # Paylaşılan arka plan loop'unda çalıştır (istek başına loop kurulmaz)
+        try:
+            run_async(process_daily(), timeout=DAILY_TIMEOUT_SECONDS)
+        except TimeoutError:
+            logger.error(f"[X] Daily zaman aşımı | Kullanıcı: {user_id}")
+            respond(text="❌ Bir hata oluştu, lütfen daha sonra dene.")
         
\ No newline at end of file
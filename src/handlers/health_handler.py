@@ -43,6 +43,20 @@ def check_vector_store(vector_client: VectorClient) -> tuple[bool, str]:
         return False, f"❌ Vector store hatası: {str(e)[:50]}"
 
 
+def run_health_checks(
+    db_client: DatabaseClient,
+    groq_client: GroqClient,
+    vector_client: VectorClient
+) -> tuple[bool, list[str]]:
+    """Tüm servis kontrollerini çalıştırır; (genel durum, mesajlar) döndürür."""
+    results = [
+        check_database(db_client),
+        check_groq_api(groq_client),
+        check_vector_store(vector_client),
+    ]
+    return all(ok for ok, _ in results), [msg for _, msg in results]
+
+
 def setup_health_handlers(
     app: App,
     chat_manager: ChatManager,
@@ -63,20 +77,10 @@ def setup_health_handlers(
         
         try:
             # Tüm servisleri kontrol et
-            db_status, db_msg = check_database(db_client)
-            groq_status, groq_msg = check_groq_api(groq_client)
-            vector_status, vector_msg = check_vector_store(vector_client)
-            
-            # Genel durum
-            all_healthy = db_status and groq_status and vector_status
+            all_healthy, messages = run_health_checks(db_client, groq_client, vector_client)
             status_icon = "✅" if all_healthy else "⚠️"
             
-            health_report = (
-                f"{status_icon} *CEMIL BOT SAĞLIK RAPORU*\n\n"
-                f"{db_msg}\n"
-                f"{groq_msg}\n"
-                f"{vector_msg}\n\n"
-            )
+            health_report = f"{status_icon} *CEMIL BOT SAĞLIK RAPORU*\n\n" + "\n".join(messages) + "\n\n"
             
             if all_healthy:
                 health_report += "🎉 Tüm sistemler çalışıyor!"
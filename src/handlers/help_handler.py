@@ -41,11 +41,7 @@ def setup_help_handlers(
             return
         
         # Kullanıcı bilgisini al
-        try:
-            user_data = user_repo.get_by_slack_id(user_id)
-            user_name = user_data.get('full_name', user_id) if user_data else user_id
-        except Exception:
-            user_name = user_id
+        user_name = user_repo.get_display_name(user_id)
         
         logger.info(f"[>] /yardim-iste komutu geldi | Kullanıcı: {user_name} ({user_id}) | Kanal: {channel_id}")
         
@@ -105,11 +101,7 @@ def setup_help_handlers(
         help_id = body["actions"][0]["value"]
         
         # Kullanıcı bilgisini al
-        try:
-            user_data = user_repo.get_by_slack_id(user_id)
-            user_name = user_data.get('full_name', user_id) if user_data else user_id
-        except Exception:
-            user_name = user_id
+        user_name = user_repo.get_display_name(user_id)
         
         logger.info(f"[>] Kanala katılma isteği | Kullanıcı: {user_name} ({user_id}) | Yardım ID: {help_id}")
         
@@ -57,11 +57,7 @@ def setup_knowledge_handlers(
             return
         
         # Kullanıcı bilgisini al
-        try:
-            user_data = user_repo.get_by_slack_id(user_id)
-            user_name = user_data.get('full_name', user_id) if user_data else user_id
-        except Exception:
-            user_name = user_id
+        user_name = user_repo.get_display_name(user_id)
         
         logger.info(f"[>] /sor komutu geldi | Kullanıcı: {user_name} ({user_id}) | Kanal: {channel_id} | Soru: {question[:100]}...")
         
@@ -120,11 +116,7 @@ def setup_knowledge_handlers(
         channel_id = body["channel_id"]
         
         # Kullanıcı bilgisini al
-        try:
-            user_data = user_repo.get_by_slack_id(user_id)
-            user_name = user_data.get('full_name', user_id) if user_data else user_id
-        except Exception:
-            user_name = user_id
+        user_name = user_repo.get_display_name(user_id)
         
         logger.info(f"[>] /cemil-indeksle komutu geldi | Kullanıcı: {user_name} ({user_id}) | Kanal: {channel_id}")
         
@@ -57,11 +57,7 @@ def setup_poll_handlers(
             return
         
         # Kullanıcı bilgisini al
-        try:
-            user_data = user_repo.get_by_slack_id(user_id)
-            user_name = user_data.get('full_name', user_id) if user_data else user_id
-        except Exception:
-            user_name = user_id
+        user_name = user_repo.get_display_name(user_id)
         
         logger.info(f"[>] /oylama komutu geldi | Kullanıcı: {user_name} ({user_id}) | Kanal: {channel_id} | Parametreler: {text[:50]}...")
         
@@ -122,11 +118,7 @@ def setup_poll_handlers(
         channel_id = body["channel"]["id"]
         
         # Kullanıcı bilgisini al
-        try:
-            user_data = user_repo.get_by_slack_id(user_id)
-            user_name = user_data.get('full_name', user_id) if user_data else user_id
-        except Exception:
-            user_name = user_id
+        user_name = user_repo.get_display_name(user_id)
         
         # value formatı: vote_{poll_id}_{option_index}
         parts = value.split("_")
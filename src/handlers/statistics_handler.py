@@ -2,6 +2,10 @@
 Admin istatistik komut handler'ları.
 """
 
+from datetime import datetime
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Dict, List, Optional, Tuple
 from slack_bolt import App
 from src.core.logger import logger
 from src.commands import ChatManager
@@ -10,20 +14,85 @@ from src.repositories import (
     UserRepository,
     ChallengeHubRepository,
     ChallengeParticipantRepository,
-    ChallengeEvaluationRepository
+    ChallengeEvaluationRepository,
+    ChallengeProjectRepository
 )
-from src.clients import DatabaseClient
-from src.core.settings import get_settings
+from src.core.ttl_cache import TTLCache
+
+# Admin yetki sonuçları kısa süre önbelleklenir (her komutta users_info çağrısı yapılmaz)
+ADMIN_CACHE_SIZE = 256
+ADMIN_CACHE_TTL_SECONDS = 300
+_admin_cache = TTLCache(maxsize=ADMIN_CACHE_SIZE, ttl=ADMIN_CACHE_TTL_SECONDS)
+
+
+@lru_cache(maxsize=2048)
+def _format_iso_day(value) -> str:
+    """ISO tarih metnini 'GG.AA.YYYY' olarak biçimlendirir; aynı tarih tekrar parse edilmez."""
+    if not value:
+        return "Bilinmiyor"
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).strftime("%d.%m.%Y")
+    except (TypeError, ValueError, AttributeError):
+        return "Bilinmiyor"
+
+
+def _render_project_blocks(
+    eval_data: Dict[str, Any],
+    challenge: Dict[str, Any],
+    participants: List[Dict[str, Any]],
+    project: Optional[Dict[str, Any]]
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Başarılı proje listesindeki tek bir proje için (section, divider) block çiftini üretir."""
+    # Takım üyeleri (kurucu + katılımcılar)
+    creator_id = challenge.get("creator_id")
+    members_text = ", ".join(chain(
+        (f"<@{creator_id}>",) if creator_id else (),
+        (f"<@{participant.get('user_id')}>" for participant in participants)
+    ))
+    
+    # GitHub linki
+    github_url = eval_data.get("github_repo_url")
+    github_text = f"🔗 <{github_url}|GitHub>" if github_url else "❌ Link yok"
+    
+    # Tarih bilgisi
+    date_text = _format_iso_day(eval_data.get("completed_at"))
+    
+    # Proje bilgileri
+    theme = challenge.get("theme", "N/A")
+    project_name = project.get("name", "N/A") if project else "N/A"
+    
+    # Block oluştur - daha kompakt
+    project_text = (
+        f"*{theme}* | {project_name}\n"
+        f"👥 {members_text}\n"
+        f"{github_text} | 📅 {date_text}"
+    )
+    return (
+        {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": project_text
+            }
+        },
+        {"type": "divider"}
+    )
 
 
 def is_admin(app: App, user_id: str) -> bool:
-    """Kullanıcının admin olup olmadığını kontrol eder."""
+    """Kullanıcının admin olup olmadığını kontrol eder (sonuç ADMIN_CACHE_TTL_SECONDS boyunca önbellekte)."""
+    cached = _admin_cache.get(user_id)
+    if cached is not None:
+        return cached
     try:
         res = app.client.users_info(user=user_id)
         if res["ok"]:
             user = res["user"]
-            return user.get("is_admin", False) or user.get("is_owner", False)
+            result = bool(user.get("is_admin", False) or user.get("is_owner", False))
+            _admin_cache.set(user_id, result)
+            return result
     except Exception as e:
+        # Hata sonucu önbelleklenmez, bir sonraki komutta tekrar denenir
         logger.error(f"[X] Yetki kontrolü hatası: {e}")
     return False
 
@@ -32,7 +101,11 @@ def setup_statistics_handlers(
     app: App,
     statistics_service: StatisticsService,
     chat_manager: ChatManager,
-    user_repo: UserRepository
+    user_repo: UserRepository,
+    eval_repo: ChallengeEvaluationRepository,
+    hub_repo: ChallengeHubRepository,
+    participant_repo: ChallengeParticipantRepository,
+    project_repo: ChallengeProjectRepository
 ):
     """Admin istatistik handler'larını kaydeder."""
     
@@ -44,11 +117,7 @@ def setup_statistics_handlers(
         channel_id = body["channel_id"]
         
         # Kullanıcı bilgisini al
-        try:
-            user_data = user_repo.get_by_slack_id(user_id)
-            user_name = user_data.get('full_name', user_id) if user_data else user_id
-        except Exception:
-            user_name = user_id
+        user_name = user_repo.get_display_name(user_id)
         
         logger.info(f"[>] /admin-istatistik komutu geldi | Kullanıcı: {user_name} ({user_id})")
         
@@ -94,11 +163,7 @@ def setup_statistics_handlers(
         channel_id = body["channel_id"]
         
         # Kullanıcı bilgisini al
-        try:
-            user_data = user_repo.get_by_slack_id(user_id)
-            user_name = user_data.get('full_name', user_id) if user_data else user_id
-        except Exception:
-            user_name = user_id
+        user_name = user_repo.get_display_name(user_id)
         
         logger.info(f"[>] /admin-basarili-projeler komutu geldi | Kullanıcı: {user_name} ({user_id})")
         
@@ -113,13 +178,6 @@ def setup_statistics_handlers(
             return
         
         try:
-            # Başarılı projeleri getir
-            settings = get_settings()
-            db_client = DatabaseClient(db_path=settings.database_path)
-            eval_repo = ChallengeEvaluationRepository(db_client)
-            hub_repo = ChallengeHubRepository(db_client)
-            participant_repo = ChallengeParticipantRepository(db_client)
-            
             # Başarılı değerlendirmeleri bul
             successful_evaluations = eval_repo.list(filters={"final_result": "success"})
             
@@ -144,66 +202,24 @@ def setup_statistics_handlers(
                 {"type": "divider"}
             ]
             
+            # İlişkili kayıtlar tek seferde toplu çekilir (proje başına ayrı sorgu yapılmaz)
+            challenge_ids = [eval_data["challenge_hub_id"] for eval_data in successful_evaluations]
+            challenges = hub_repo.get_many(challenge_ids)
+            members_by_challenge = participant_repo.get_team_members_bulk(challenge_ids)
+            projects = project_repo.get_many(
+                [challenge.get("selected_project_id") for challenge in challenges.values()]
+            )
+            
             for eval_data in successful_evaluations:
-                challenge_id = eval_data["challenge_hub_id"]
-                challenge = hub_repo.get(challenge_id)
-                
+                challenge = challenges.get(eval_data["challenge_hub_id"])
                 if not challenge:
                     continue
-                
-                # Takım üyelerini al
-                participants = participant_repo.get_team_members(challenge_id)
-                creator_id = challenge.get("creator_id")
-                
-                team_members = []
-                if creator_id:
-                    team_members.append(f"<@{creator_id}>")
-                
-                for participant in participants:
-                    user_id_p = participant.get("user_id")
-                    team_members.append(f"<@{user_id_p}>")
-                
-                # GitHub linki
-                github_url = eval_data.get("github_repo_url")
-                github_text = f"🔗 <{github_url}|GitHub>" if github_url else "❌ Link yok"
-                
-                # Tarih bilgisi
-                completed_at = eval_data.get("completed_at")
-                date_text = "Bilinmiyor"
-                if completed_at:
-                    from datetime import datetime
-                    try:
-                        dt = datetime.fromisoformat(completed_at.replace('Z', '+00:00'))
-                        date_text = dt.strftime("%d.%m.%Y")
-                    except:
-                        pass
-                
-                # Proje bilgileri
-                theme = challenge.get("theme", "N/A")
-                project_id = challenge.get("selected_project_id")
-                project_name = "N/A"
-                if project_id:
-                    from src.repositories import ChallengeProjectRepository
-                    project_repo = ChallengeProjectRepository(db_client)
-                    project = project_repo.get(project_id)
-                    if project:
-                        project_name = project.get("name", "N/A")
-                
-                # Block oluştur - daha kompakt
-                project_text = (
-                    f"*{theme}* | {project_name}\n"
-                    f"👥 {', '.join(team_members)}\n"
-                    f"{github_text} | 📅 {date_text}"
-                )
-                
-                blocks.append({
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": project_text
-                    }
-                })
-                blocks.append({"type": "divider"})
+                blocks.extend(_render_project_blocks(
+                    eval_data,
+                    challenge,
+                    members_by_challenge.get(challenge["id"], []),
+                    projects.get(challenge.get("selected_project_id"))
+                ))
             
             # Mesajı gönder
             chat_manager.post_ephemeral(
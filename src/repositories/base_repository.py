@@ -1,7 +1,7 @@
-import uuid
+import sqlite3
 from typing import List, Dict, Any, Optional
 from src.core.logger import logger
-from src.core.exceptions import DatabaseError
+from src.core.exceptions import DatabaseError, DuplicateRecordError
 from src.clients.database_client import DatabaseClient
 
 class BaseRepository:
@@ -16,9 +16,9 @@ class BaseRepository:
 
     def create(self, data: Dict[str, Any]) -> str:
         """Yeni bir kayıt oluşturur."""
-        # Eğer id verilmemişse UUID oluştur
+        # Eğer id verilmemişse zaman sıralı ID oluştur
         if "id" not in data:
-            data["id"] = str(uuid.uuid4())
+            data["id"] = self.db_client.new_id()
         
         columns = list(data.keys())
         placeholders = ", ".join(["?"] * len(columns))
@@ -32,6 +32,12 @@ class BaseRepository:
                 conn.commit()
                 logger.debug(f"[+] Kayıt eklendi ({self.table_name}): {data['id']}")
                 return data["id"]
+        except sqlite3.IntegrityError as e:
+            if "UNIQUE" in str(e):
+                logger.warning(f"[!] {self.table_name}.create: kayıt zaten mevcut ({e})")
+                raise DuplicateRecordError(str(e))
+            logger.error(f"[X] {self.table_name}.create hatası: {e}")
+            raise DatabaseError(str(e))
         except Exception as e:
             logger.error(f"[X] {self.table_name}.create hatası: {e}")
             raise DatabaseError(str(e))
@@ -49,6 +55,22 @@ class BaseRepository:
             logger.error(f"[X] {self.table_name}.get hatası: {e}")
             raise DatabaseError(str(e))
 
+    def get_many(self, record_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Birden fazla kaydı tek sorguyla (WHERE id IN (...)) getirir: {id: kayıt}."""
+        unique_ids = list(dict.fromkeys(record_id for record_id in record_ids if record_id))
+        if not unique_ids:
+            return {}
+        try:
+            with self.db_client.get_connection() as conn:
+                cursor = conn.cursor()
+                placeholders = ", ".join(["?"] * len(unique_ids))
+                sql = f"SELECT * FROM {self.table_name} WHERE id IN ({placeholders})"
+                cursor.execute(sql, unique_ids)
+                return {row["id"]: dict(row) for row in cursor.fetchall()}
+        except Exception as e:
+            logger.error(f"[X] {self.table_name}.get_many hatası: {e}")
+            raise DatabaseError(str(e))
+
     def update(self, record_id: str, data: Dict[str, Any]) -> bool:
         """Kayıt günceller."""
         set_clause = ", ".join([f"{key} = ?" for key in data.keys()])
@@ -104,3 +126,18 @@ class BaseRepository:
         except Exception as e:
             logger.error(f"[X] {self.table_name}.list hatası: {e}")
             raise DatabaseError(str(e))
+
+    def find_one(self, filters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Filtreye uyan ilk kaydı getirir (LIMIT 1); yoksa None döner."""
+        conditions = [f"{key} = ?" for key in filters.keys()]
+        sql = f"SELECT * FROM {self.table_name} WHERE {' AND '.join(conditions)} LIMIT 1"
+
+        try:
+            with self.db_client.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(sql, list(filters.values()))
+                row = cursor.fetchone()
+                return dict(row) if row else None
+        except Exception as e:
+            logger.error(f"[X] {self.table_name}.find_one hatası: {e}")
+            raise DatabaseError(str(e))
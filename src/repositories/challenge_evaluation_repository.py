@@ -1,7 +1,30 @@
-from typing import Optional, Dict, Any, List
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Tuple
 from src.repositories.base_repository import BaseRepository
 from src.clients.database_client import DatabaseClient
 from src.core.logger import logger
+from src.core.exceptions import DatabaseError
+from src.core.transaction import transaction
+
+
+@dataclass
+class EvaluationContext:
+    """Oy/jüri akışlarının ihtiyaç duyduğu, tek sorguda toplanan değerlendirme bağlamı."""
+    evaluation: Dict[str, Any]
+    challenge: Optional[Dict[str, Any]]
+    is_participant: bool = False
+    evaluator: Optional[Dict[str, Any]] = None
+    evaluator_count: int = 0
+    true_votes: int = 0
+    false_votes: int = 0
+
+
+# get_context sorgusunda tabloların kolon gruplarını ayıran işaret kolonları
+_CTX_CHALLENGE = "__ctx_challenge__"
+_CTX_EVALUATOR = "__ctx_evaluator__"
+_CTX_STATS = "__ctx_stats__"
 
 
 class ChallengeEvaluationRepository(BaseRepository):
@@ -12,8 +35,94 @@ class ChallengeEvaluationRepository(BaseRepository):
 
     def get_by_challenge(self, challenge_hub_id: str) -> Optional[Dict[str, Any]]:
         """Challenge'a ait değerlendirmeyi getirir."""
-        evaluations = self.list(filters={"challenge_hub_id": challenge_hub_id})
-        return evaluations[0] if evaluations else None
+        return self.find_one({"challenge_hub_id": challenge_hub_id})
+
+    def create_for_challenge(self, data: Dict[str, Any]) -> bool:
+        """
+        Challenge için henüz değerlendirme yoksa kaydı ekler; varsa eklemeden False döner.
+        Kontrol INSERT içinde yapılır: UNIQUE index'i henüz oluşturulamamış (mükerrer kayıtlı)
+        veritabanlarında da ikinci değerlendirme açılamaz.
+        """
+        columns = ", ".join(data.keys())
+        placeholders = ", ".join("?" for _ in data)
+        try:
+            with self.db_client.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(f"""
+                    INSERT INTO {self.table_name} ({columns})
+                    SELECT {placeholders}
+                    WHERE NOT EXISTS (SELECT 1 FROM {self.table_name} WHERE challenge_hub_id = ?)
+                """, (*data.values(), data["challenge_hub_id"]))
+                conn.commit()
+                created = cursor.rowcount > 0
+        except sqlite3.IntegrityError as e:
+            if "UNIQUE" not in str(e):
+                logger.error(f"[X] {self.table_name}.create_for_challenge hatası: {e}")
+                raise DatabaseError(str(e))
+            created = False
+        except Exception as e:
+            logger.error(f"[X] {self.table_name}.create_for_challenge hatası: {e}")
+            raise DatabaseError(str(e))
+        if created:
+            logger.debug(f"[+] Kayıt eklendi ({self.table_name}): {data['id']}")
+        return created
+
+    def get_context(self, evaluation_id: str, user_id: Optional[str] = None) -> Optional[EvaluationContext]:
+        """
+        Değerlendirme, challenge, kullanıcının katılımcı/jüri kaydı ve oy sayılarını tek sorguda getirir.
+        Değerlendirme yoksa None döner.
+        """
+        sql = f"""
+            SELECT
+                e.*,
+                NULL AS {_CTX_CHALLENGE}, c.*,
+                NULL AS {_CTX_EVALUATOR}, ev.*,
+                NULL AS {_CTX_STATS},
+                EXISTS(
+                    SELECT 1 FROM challenge_participants p
+                    WHERE p.challenge_hub_id = e.challenge_hub_id AND p.user_id = ?
+                ) AS is_participant,
+                (
+                    SELECT COUNT(*) FROM challenge_evaluators
+                    WHERE evaluation_id = e.id
+                ) AS evaluator_count
+            FROM challenge_evaluations e
+            LEFT JOIN challenge_hubs c ON c.id = e.challenge_hub_id
+            LEFT JOIN challenge_evaluators ev ON ev.evaluation_id = e.id AND ev.user_id = ?
+            WHERE e.id = ?
+            LIMIT 1
+        """
+        try:
+            with self.db_client.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(sql, (user_id, user_id, evaluation_id))
+                row = cursor.fetchone()
+                if not row:
+                    return None
+
+                # Kolonları işaretlere göre gruplara ayır (e.*, c.*, ev.*, istatistikler)
+                groups: List[Dict[str, Any]] = [{}]
+                for index, column in enumerate(cursor.description):
+                    name = column[0]
+                    if name in (_CTX_CHALLENGE, _CTX_EVALUATOR, _CTX_STATS):
+                        groups.append({})
+                    else:
+                        groups[-1][name] = row[index]
+                evaluation, challenge, evaluator, stats = groups
+
+                return EvaluationContext(
+                    evaluation=evaluation,
+                    challenge=challenge if challenge.get("id") else None,
+                    is_participant=bool(stats["is_participant"]),
+                    evaluator=evaluator if evaluator.get("id") else None,
+                    evaluator_count=stats["evaluator_count"] or 0,
+                    # Oy sayaçları record_vote ile güncel tutulur; jüri kayıtları taranmaz
+                    true_votes=evaluation.get("true_votes") or 0,
+                    false_votes=evaluation.get("false_votes") or 0,
+                )
+        except Exception as e:
+            logger.error(f"[X] get_context hatası: {e}")
+            raise DatabaseError(str(e))
 
     def get_by_channel_id(self, channel_id: str) -> Optional[Dict[str, Any]]:
         """Kanal ID'sine göre değerlendirme getirir."""
@@ -61,9 +170,164 @@ class ChallengeEvaluationRepository(BaseRepository):
             logger.error(f"[X] Pending evaluations getirme hatası: {e}")
             return []
 
+    def get_open_evaluation_deadlines(self) -> List[Dict[str, Any]]:
+        """Devam eden (status='evaluating') değerlendirmelerin ID ve deadline bilgisini getirir."""
+        try:
+            with self.db_client.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT id, deadline_at FROM challenge_evaluations
+                    WHERE status = 'evaluating' 
+                    AND deadline_at IS NOT NULL
+                """)
+                return [dict(row) for row in cursor.fetchall()]
+        except Exception as e:
+            logger.error(f"[X] Açık değerlendirme deadline'ları getirme hatası: {e}")
+            return []
+
+    def get_pending_evaluation_ids(self, limit: int = 500) -> List[str]:
+        """
+        Deadline'ı geçmiş ve tamamlanmamış değerlendirmelerin sadece ID'lerini getirir.
+        (status, deadline_at) index'i üzerinden çalışır; tüm satırlar materyalize edilmez.
+        """
+        try:
+            with self.db_client.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT id FROM challenge_evaluations
+                    WHERE status = 'evaluating' 
+                    AND deadline_at IS NOT NULL
+                    AND deadline_at <= datetime('now')
+                    ORDER BY deadline_at ASC
+                    LIMIT ?
+                """, (limit,))
+                return [row[0] for row in cursor.fetchall()]
+        except Exception as e:
+            logger.error(f"[X] Pending evaluation ID'leri getirme hatası: {e}")
+            return []
+
+    def count_pending_evaluations(self) -> int:
+        """Deadline'ı geçmiş ve tamamlanmamış değerlendirme sayısını döndürür (ucuz ön kontrol)."""
+        try:
+            with self.db_client.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT COUNT(*) FROM challenge_evaluations
+                    WHERE status = 'evaluating' 
+                    AND deadline_at IS NOT NULL
+                    AND deadline_at <= datetime('now')
+                """)
+                return cursor.fetchone()[0]
+        except Exception as e:
+            logger.error(f"[X] Pending evaluations sayma hatası: {e}")
+            return 0
+
+    def record_vote(
+        self,
+        evaluation_id: str,
+        evaluator_id: str,
+        vote: str,
+        voted_at: str
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Jüri oyunu kaydeder ve değerlendirmenin oy sayısını aynı transaction içinde artırır.
+        Sayaç yeniden sayılmaz; oyun yönüne göre SQL tarafında +1 yapılır.
+        (true_votes, false_votes) döner; jüri üyesi zaten oy vermişse None döner.
+        """
+        is_true = 1 if vote == "true" else 0
+        try:
+            with self.db_client.get_connection() as conn:
+                cursor = conn.cursor()
+                # vote IS NULL koşulu eşzamanlı ikinci oyu engeller
+                cursor.execute("""
+                    UPDATE challenge_evaluators
+                    SET vote = ?, voted_at = ?
+                    WHERE id = ? AND vote IS NULL
+                """, (vote, voted_at, evaluator_id))
+                if cursor.rowcount == 0:
+                    conn.rollback()
+                    return None
+                cursor.execute("""
+                    UPDATE challenge_evaluations
+                    SET true_votes = COALESCE(true_votes, 0) + ?,
+                        false_votes = COALESCE(false_votes, 0) + ?
+                    WHERE id = ?
+                    RETURNING true_votes, false_votes
+                """, (is_true, 1 - is_true, evaluation_id))
+                row = cursor.fetchone()
+                conn.commit()
+                return (row[0], row[1]) if row else (0, 0)
+        except Exception as e:
+            logger.error(f"[X] record_vote hatası: {e}")
+            raise DatabaseError(str(e))
+
     def update_votes(self, evaluation_id: str, true_votes: int, false_votes: int):
         """Oyları günceller."""
         self.update(evaluation_id, {
             "true_votes": true_votes,
             "false_votes": false_votes
         })
+
+    def complete(
+        self,
+        evaluation_id: str,
+        challenge_hub_id: str,
+        final_result: str,
+        award_points: int = 0,
+        completed_at: Optional[str] = None,
+        expected_status: Optional[str] = None
+    ) -> Optional[Tuple[Optional[Dict[str, Any]], List[str]]]:
+        """
+        Değerlendirmeyi ve challenge'ı tamamlar; award_points > 0 ise ekibin (katılımcılar + owner)
+        puan/başarı sayaçlarını artırır. Hepsi tek transaction'da yapılır: yarıda kalan finalize
+        (tamamlanmış değerlendirme, açık kalmış challenge veya eksik puan) oluşmaz.
+        users tablosunda olmayan kullanıcılar (foreign key) atlanır, transaction'ı bozmaz.
+        expected_status verilirse değerlendirme yalnızca o durumdaysa tamamlanır (koşullu UPDATE);
+        aksi halde hiçbir şey yazılmaz ve None döner. Böylece eşzamanlı iki finalize'dan sadece biri kazanır.
+        (güncellenmiş challenge kaydı, puan verilen kullanıcılar) döner.
+        """
+        # Değerlendirme ve challenge aynı tamamlanma zamanını alır
+        completed_at = completed_at or datetime.now().isoformat()
+        # Hata durumunda transaction() rollback yapar ve DatabaseError fırlatır
+        with transaction(self.db_client) as conn:
+            cursor = conn.cursor()
+            query = """
+                UPDATE challenge_evaluations
+                SET status = 'completed', final_result = ?, completed_at = ?
+                WHERE id = ?
+            """
+            params: Tuple[Any, ...] = (final_result, completed_at, evaluation_id)
+            if expected_status is not None:
+                query += " AND status = ?"
+                params += (expected_status,)
+            cursor.execute(query, params)
+            if cursor.rowcount == 0 and expected_status is not None:
+                # Başka bir finalize önce davrandı (veya durum değişti); hiçbir şey yazılmadı
+                return None
+            # Güncellenen challenge satırı aynı ifadede döner (ayrı SELECT gerekmez)
+            cursor.execute("""
+                UPDATE challenge_hubs
+                SET status = 'completed', completed_at = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+                RETURNING *
+            """, (completed_at, challenge_hub_id))
+            row = cursor.fetchone()
+            challenge = dict(row) if row else None
+
+            awarded_user_ids: List[str] = []
+            if challenge and award_points:
+                cursor.execute("""
+                    INSERT INTO user_challenge_stats (user_id, total_points, completed_challenges)
+                    SELECT slack_id, ?, 1 FROM users
+                    WHERE slack_id IN (
+                        SELECT user_id FROM challenge_participants WHERE challenge_hub_id = ?
+                        UNION SELECT ?
+                    )
+                    ON CONFLICT(user_id) DO UPDATE SET
+                        total_points = COALESCE(total_points, 0) + excluded.total_points,
+                        completed_challenges = COALESCE(completed_challenges, 0) + 1,
+                        updated_at = CURRENT_TIMESTAMP
+                    RETURNING user_id
+                """, (award_points, challenge_hub_id, challenge.get("creator_id")))
+                awarded_user_ids = [r[0] for r in cursor.fetchall()]
+        return challenge, awarded_user_ids
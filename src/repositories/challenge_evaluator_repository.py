@@ -2,6 +2,7 @@ from typing import Optional, Dict, Any, List
 from src.repositories.base_repository import BaseRepository
 from src.clients.database_client import DatabaseClient
 from src.core.logger import logger
+from src.core.exceptions import DatabaseError
 
 
 class ChallengeEvaluatorRepository(BaseRepository):
@@ -24,11 +25,10 @@ class ChallengeEvaluatorRepository(BaseRepository):
         user_id: str
     ) -> Optional[Dict[str, Any]]:
         """Belirli bir kullanıcının değerlendirmesini getirir."""
-        evaluators = self.list(filters={
+        return self.find_one({
             "evaluation_id": evaluation_id,
             "user_id": user_id
         })
-        return evaluators[0] if evaluators else None
 
     def has_voted(self, evaluation_id: str, user_id: str) -> bool:
         """Kullanıcı oy vermiş mi kontrol eder."""
@@ -41,8 +41,47 @@ class ChallengeEvaluatorRepository(BaseRepository):
         return len(evaluators)
 
     def get_votes(self, evaluation_id: str) -> Dict[str, int]:
-        """Değerlendirmenin oy sayılarını döner."""
-        evaluators = self.get_by_evaluation(evaluation_id)
-        true_count = sum(1 for e in evaluators if e.get("vote") == "true")
-        false_count = sum(1 for e in evaluators if e.get("vote") == "false")
+        """Değerlendirmenin oy sayılarını döner (sayım SQL'de yapılır, satırlar taşınmaz)."""
+        try:
+            with self.db_client.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(f"""
+                    SELECT
+                        COALESCE(SUM(vote = 'true'), 0),
+                        COALESCE(SUM(vote = 'false'), 0)
+                    FROM {self.table_name}
+                    WHERE evaluation_id = ?
+                """, (evaluation_id,))
+                true_count, false_count = cursor.fetchone()
+        except Exception as e:
+            logger.error(f"[X] {self.table_name}.get_votes hatası: {e}")
+            raise DatabaseError(str(e))
         return {"true": true_count, "false": false_count}
+
+    def add_juror(self, evaluation_id: str, user_id: str, max_jurors: int = 3) -> Optional[List[str]]:
+        """
+        Kontenjan doluysa eklemeden, jüri kaydını ekler ve güncel jüri listesini aynı transaction'da döner.
+        Kontrol INSERT içinde yapıldığı için eşzamanlı katılımlar kontenjanı aşamaz.
+        Jüri kullanıcı id'leri katılım sırasıyla döner; kontenjan doluysa None döner.
+        """
+        try:
+            with self.db_client.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(f"""
+                    INSERT INTO {self.table_name} (id, evaluation_id, user_id)
+                    SELECT ?, ?, ?
+                    WHERE (SELECT COUNT(*) FROM {self.table_name} WHERE evaluation_id = ?) < ?
+                """, (self.db_client.new_id(), evaluation_id, user_id, evaluation_id, max_jurors))
+                if cursor.rowcount == 0:
+                    conn.rollback()
+                    return None
+                cursor.execute(
+                    f"SELECT user_id FROM {self.table_name} WHERE evaluation_id = ? ORDER BY rowid",
+                    (evaluation_id,)
+                )
+                juror_ids = [row[0] for row in cursor.fetchall()]
+                conn.commit()
+                return juror_ids
+        except Exception as e:
+            logger.error(f"[X] {self.table_name}.add_juror hatası: {e}")
+            raise DatabaseError(str(e))
@@ -2,14 +2,50 @@ from typing import Optional, List, Dict, Any
 from src.repositories.base_repository import BaseRepository
 from src.clients.database_client import DatabaseClient
 from src.core.logger import logger
+from src.core.ttl_cache import TTLCache
+
+# Aynı challenge satırı bir değerlendirme boyunca defalarca okunur; kısa süreli önbellek
+HUB_CACHE_MAXSIZE = 1024
+HUB_CACHE_TTL_SECONDS = 30
 
 
 class ChallengeHubRepository(BaseRepository):
     """Challenge Hub'lar için veritabanı erişim sınıfı."""
 
+    # Servisler kendi repository örneklerini oluşturduğu için önbellek sınıf seviyesinde paylaşılır;
+    # bir örnekteki update/delete diğerlerinin eski kayıt döndürmesini engeller
+    _cache = TTLCache(maxsize=HUB_CACHE_MAXSIZE, ttl=HUB_CACHE_TTL_SECONDS)
+
     def __init__(self, db_client: DatabaseClient):
         super().__init__(db_client, "challenge_hubs")
 
+    def get(self, record_id: str) -> Optional[Dict[str, Any]]:
+        """ID ile challenge getirir (önbellekten; çağıran değiştirebilsin diye kopya döner)."""
+        cached = self._cache.get(record_id)
+        if cached is None:
+            cached = super().get(record_id)
+            if cached is None:
+                return None
+            self._cache.set(record_id, cached)
+        return dict(cached)
+
+    @classmethod
+    def invalidate(cls, record_id: str):
+        """Challenge'ı önbellekten düşürür (repository dışından yapılan yazmalar için)."""
+        cls._cache.pop(record_id)
+
+    def update(self, record_id: str, data: Dict[str, Any]) -> bool:
+        try:
+            return super().update(record_id, data)
+        finally:
+            self._cache.pop(record_id)
+
+    def delete(self, record_id: str) -> bool:
+        try:
+            return super().delete(record_id)
+        finally:
+            self._cache.pop(record_id)
+
     def get_active_challenge(self) -> Optional[Dict[str, Any]]:
         """Katılım için uygun aktif challenge getirir (sadece recruiting durumunda)."""
         try:
@@ -30,10 +30,59 @@ class ChallengeParticipantRepository(BaseRepository):
             logger.error(f"[X] get_by_challenge_and_user hatası: {e}")
             return None
 
+    def is_participant(self, challenge_hub_id: str, user_id: str) -> bool:
+        """Kullanıcı bu challenge'ın katılımcısı mı? (UNIQUE(challenge_hub_id, user_id) index'i üzerinden)"""
+        try:
+            with self.db_client.get_connection() as conn:
+                cursor = conn.cursor()
+                sql = """
+                    SELECT 1 FROM challenge_participants
+                    WHERE challenge_hub_id = ? AND user_id = ?
+                    LIMIT 1
+                """
+                cursor.execute(sql, (challenge_hub_id, user_id))
+                return cursor.fetchone() is not None
+        except Exception as e:
+            logger.error(f"[X] is_participant hatası: {e}")
+            return False
+
+    def list_user_ids(self, challenge_hub_id: str) -> List[str]:
+        """Challenge katılımcılarının sadece user_id'lerini getirir."""
+        try:
+            with self.db_client.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT user_id FROM challenge_participants WHERE challenge_hub_id = ?",
+                    (challenge_hub_id,)
+                )
+                return [row[0] for row in cursor.fetchall()]
+        except Exception as e:
+            logger.error(f"[X] list_user_ids hatası: {e}")
+            return []
+
     def get_team_members(self, challenge_hub_id: str) -> List[Dict[str, Any]]:
         """Takım üyelerini getirir."""
         return self.list(filters={"challenge_hub_id": challenge_hub_id})
 
+    def get_team_members_bulk(self, challenge_hub_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Birden fazla challenge'ın takım üyelerini tek sorguyla getirir: {challenge_hub_id: [üye, ...]}."""
+        unique_ids = list(dict.fromkeys(hub_id for hub_id in challenge_hub_ids if hub_id))
+        if not unique_ids:
+            return {}
+        try:
+            with self.db_client.get_connection() as conn:
+                cursor = conn.cursor()
+                placeholders = ", ".join(["?"] * len(unique_ids))
+                sql = f"SELECT * FROM challenge_participants WHERE challenge_hub_id IN ({placeholders})"
+                cursor.execute(sql, unique_ids)
+                members: Dict[str, List[Dict[str, Any]]] = {}
+                for row in cursor.fetchall():
+                    members.setdefault(row["challenge_hub_id"], []).append(dict(row))
+                return members
+        except Exception as e:
+            logger.error(f"[X] get_team_members_bulk hatası: {e}")
+            return {}
+
     def get_user_active_challenges(self, user_id: str) -> List[Dict[str, Any]]:
         """Kullanıcının aktif challenge'larını getirir."""
         try:
@@ -1,15 +1,61 @@
 import random
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from src.repositories.base_repository import BaseRepository
 from src.clients.database_client import DatabaseClient
 from src.core.logger import logger
+from src.core.exceptions import DatabaseError
 
 
 class ChallengeProjectRepository(BaseRepository):
     """Challenge proje şablonları için veritabanı erişim sınıfı."""
 
+    # Proje şablonları neredeyse statik; her yazma işleminde artırılır ve tema önbelleğini geçersiz kılar
+    _version = 0
+
     def __init__(self, db_client: DatabaseClient):
         super().__init__(db_client, "challenge_projects")
+        # {tema: (sürüm, proje id'leri)}
+        self._theme_cache: Dict[str, Tuple[int, Tuple[str, ...]]] = {}
+
+    @classmethod
+    def _invalidate(cls):
+        cls._version += 1
+
+    def create(self, data: Dict[str, Any]) -> str:
+        try:
+            return super().create(data)
+        finally:
+            self._invalidate()
+
+    def update(self, record_id: str, data: Dict[str, Any]) -> bool:
+        try:
+            return super().update(record_id, data)
+        finally:
+            self._invalidate()
+
+    def delete(self, record_id: str) -> bool:
+        try:
+            return super().delete(record_id)
+        finally:
+            self._invalidate()
+
+    def _theme_ids(self, theme: str) -> Tuple[str, ...]:
+        """Temanın proje id'lerini önbellekten döndürür; sürüm değiştiyse DB'den yeniden okur."""
+        version = self._version
+        cached = self._theme_cache.get(theme)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        try:
+            with self.db_client.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(f"SELECT id FROM {self.table_name} WHERE theme = ?", (theme,))
+                ids = tuple(row[0] for row in cursor.fetchall())
+        except Exception as e:
+            logger.error(f"[X] {self.table_name}._theme_ids hatası: {e}")
+            raise DatabaseError(str(e))
+        self._theme_cache[theme] = (version, ids)
+        logger.debug(f"[i] Proje önbelleği yenilendi: {theme} ({len(ids)} proje)")
+        return ids
 
     def get_by_theme(self, theme: str) -> List[Dict[str, Any]]:
         """Tema bazlı projeleri getirir."""
@@ -17,10 +63,17 @@ class ChallengeProjectRepository(BaseRepository):
 
     def get_random_project(self, theme: str) -> Optional[Dict[str, Any]]:
         """Tema bazlı random proje seçer."""
-        projects = self.get_by_theme(theme)
-        if not projects:
+        ids = self._theme_ids(theme)
+        if not ids:
             return None
-        return random.choice(projects)
+        # Sadece seçilen proje satırı okunur
+        project = self.get(ids[random.randrange(len(ids))])
+        if project is None:
+            # Kayıt repository dışında silinmiş; önbelleği tazeleyip bir kez daha dene
+            self._invalidate()
+            ids = self._theme_ids(theme)
+            project = self.get(random.choice(ids)) if ids else None
+        return project
 
     def get_by_id(self, project_id: str) -> Optional[Dict[str, Any]]:
         """ID ile proje getirir."""
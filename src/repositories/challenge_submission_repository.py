@@ -10,5 +10,4 @@ class ChallengeSubmissionRepository(BaseRepository):
 
     def get_by_challenge(self, challenge_hub_id: str):
         """Challenge'a ait submission'ı getirir."""
-        submissions = self.list(filters={"challenge_hub_id": challenge_hub_id})
-        return submissions[0] if submissions else None
+        return self.find_one({"challenge_hub_id": challenge_hub_id})
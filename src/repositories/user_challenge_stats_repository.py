@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from src.repositories.base_repository import BaseRepository
 from src.clients.database_client import DatabaseClient
 from src.core.logger import logger
@@ -26,36 +26,34 @@ class UserChallengeStatsRepository(BaseRepository):
                 row = cursor.fetchone()
 
                 if not row:
+                    # Eşzamanlı oluşturmada da tek satır kalır; RETURNING ile tekrar SELECT gerekmez
                     cursor.execute(
                         f"""
                         INSERT INTO {self.table_name} 
                         (user_id, total_challenges, completed_challenges, total_points)
                         VALUES (?, 0, 0, 0)
+                        ON CONFLICT(user_id) DO UPDATE SET user_id = excluded.user_id
+                        RETURNING *
                         """,
                         (user_id,),
                     )
-                    conn.commit()
-                    cursor.execute(
-                        f"SELECT * FROM {self.table_name} WHERE user_id = ?",
-                        (user_id,),
-                    )
                     row = cursor.fetchone()
+                    conn.commit()
 
-                return dict(row) if row else {
-                    "user_id": user_id,
-                    "total_challenges": 0,
-                    "completed_challenges": 0,
-                    "total_points": 0,
-                }
+                return dict(row) if row else self._empty_stats(user_id)
         except Exception as e:
             logger.error(f"[X] user_challenge_stats.get_or_create hatası: {e}")
             # Hata durumunda boş istatistik döndür, akışı bozmamak için
-            return {
-                "user_id": user_id,
-                "total_challenges": 0,
-                "completed_challenges": 0,
-                "total_points": 0,
-            }
+            return self._empty_stats(user_id)
+
+    @staticmethod
+    def _empty_stats(user_id: str) -> Dict[str, Any]:
+        return {
+            "user_id": user_id,
+            "total_challenges": 0,
+            "completed_challenges": 0,
+            "total_points": 0,
+        }
 
     def _update_fields(self, user_id: str, fields: Dict[str, Any]) -> None:
         """Belirtilen alanları user_id'ye göre günceller."""
@@ -77,20 +75,38 @@ class UserChallengeStatsRepository(BaseRepository):
         except Exception as e:
             logger.error(f"[X] user_challenge_stats._update_fields hatası: {e}")
 
+    def _increment(self, user_id: str, column: str, amount: int) -> Optional[Dict[str, Any]]:
+        """
+        Sayaç alanını tek bir atomik UPSERT ile artırır (satır yoksa oluşturur).
+        Oku-değiştir-yaz yerine SQLite içinde artırıldığı için eşzamanlı artışlar kaybolmaz.
+        """
+        try:
+            with self.db_client.get_connection() as conn:
+                cursor = conn.cursor()
+                sql = f"""
+                    INSERT INTO {self.table_name} (user_id, {column})
+                    VALUES (?, ?)
+                    ON CONFLICT(user_id) DO UPDATE SET
+                        {column} = COALESCE({column}, 0) + excluded.{column},
+                        updated_at = CURRENT_TIMESTAMP
+                    RETURNING *
+                """
+                cursor.execute(sql, (user_id, amount))
+                row = cursor.fetchone()
+                conn.commit()
+                return dict(row) if row else None
+        except Exception as e:
+            logger.error(f"[X] user_challenge_stats._increment hatası ({column}): {e}")
+            return None
+
     def add_points(self, user_id: str, points: int):
         """Kullanıcıya puan ekler."""
-        stats = self.get_or_create(user_id)
-        new_total = stats.get("total_points", 0) + points
-        self._update_fields(user_id, {"total_points": new_total})
+        self._increment(user_id, "total_points", points)
 
     def increment_total(self, user_id: str):
         """Toplam challenge sayısını artırır (katıldığı challenge'lar)."""
-        stats = self.get_or_create(user_id)
-        new_count = stats.get("total_challenges", 0) + 1
-        self._update_fields(user_id, {"total_challenges": new_count})
+        self._increment(user_id, "total_challenges", 1)
 
     def increment_completed(self, user_id: str):
         """Tamamlanan challenge sayısını artırır."""
-        stats = self.get_or_create(user_id)
-        new_count = stats.get("completed_challenges", 0) + 1
-        self._update_fields(user_id, {"completed_challenges": new_count})
+        self._increment(user_id, "completed_challenges", 1)
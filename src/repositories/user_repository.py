@@ -1,10 +1,17 @@
-import uuid
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, List
 from src.repositories.base_repository import BaseRepository
 from src.clients.database_client import DatabaseClient
 from src.core.logger import logger
 from src.core.exceptions import DatabaseError
 
+# CSV import'unda tek executemany çağrısına verilecek en fazla kayıt
+IMPORT_BATCH_SIZE = 10_000
+
+# Handler'ların log için kullandığı görünen isim önbelleğinin boyutu
+DISPLAY_NAME_CACHE_SIZE = 4096
+
+
 class UserRepository(BaseRepository):
     """
     Kullanıcılar tablosuna özel veri erişim sınıfı.
@@ -12,6 +19,38 @@ class UserRepository(BaseRepository):
 
     def __init__(self, db_client: DatabaseClient):
         super().__init__(db_client, "users")
+        # Her Slack event'inde isim için DB'ye gidilmesin; yazma işlemlerinde temizlenir
+        self._display_name_cache = lru_cache(maxsize=DISPLAY_NAME_CACHE_SIZE)(self._load_display_name)
+
+    def get_display_name(self, slack_id: str) -> str:
+        """Kullanıcının tam adını döndürür (önbellekli); bulunamazsa veya hata olursa Slack ID'yi döndürür."""
+        try:
+            return self._display_name_cache(slack_id)
+        except Exception:
+            return slack_id
+
+    def _load_display_name(self, slack_id: str) -> str:
+        user_data = self.get_by_slack_id(slack_id)
+        return user_data.get('full_name', slack_id) if user_data else slack_id
+
+    def invalidate_cache(self):
+        """Görünen isim önbelleğini temizler."""
+        self._display_name_cache.cache_clear()
+
+    def create(self, data: Dict[str, Any]) -> str:
+        record_id = super().create(data)
+        self.invalidate_cache()
+        return record_id
+
+    def update(self, record_id: str, data: Dict[str, Any]) -> bool:
+        updated = super().update(record_id, data)
+        self.invalidate_cache()
+        return updated
+
+    def delete(self, record_id: str) -> bool:
+        deleted = super().delete(record_id)
+        self.invalidate_cache()
+        return deleted
 
     def get_by_slack_id(self, slack_id: str) -> Optional[Dict[str, Any]]:
         """Slack ID'ye göre kullanıcı getirir."""
@@ -37,6 +76,7 @@ class UserRepository(BaseRepository):
                 sql = f"UPDATE {self.table_name} SET {set_clause}, updated_at = CURRENT_TIMESTAMP WHERE slack_id = ?"
                 cursor.execute(sql, values)
                 conn.commit()
+                self.invalidate_cache()
                 return cursor.rowcount > 0
         except Exception as e:
             logger.error(f"[X] UserRepository.update_by_slack_id hatası: {e}")
@@ -64,7 +104,6 @@ class UserRepository(BaseRepository):
         Önce mevcut tabloyu temizler.
         """
         import csv
-        from datetime import datetime
         
         try:
             with open(file_path, 'r', encoding='utf-8-sig') as f:  # BOM'u temizlemek için utf-8-sig
@@ -90,88 +129,126 @@ class UserRepository(BaseRepository):
                 return 0
 
             with self.db_client.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # 1. Tabloyu temizle
-                cursor.execute(f"DELETE FROM {self.table_name}")
-                
-                # 2. Yeni kayıtları ekle
-                count = 0
-                for row in rows:
-                    try:
-                        # CSV'den sadece gerekli alanları al
-                        raw_slack_id = row.get('Slack ID', '').strip()
-                        # Slack ID bazen "U123 (name)" formatında olabiliyor, sadece ID kısmını al
-                        slack_id = raw_slack_id.split(' ')[0] if raw_slack_id else ''
-                        
-                        first_name = row.get('First Name', '').strip()
-                        middle_name = row.get('Middle Name', '').strip()
-                        surname = row.get('Surname', '').strip()
-                        
-                        # Tam isim oluştur (orta isim varsa dahil et)
-                        if middle_name:
-                            full_name = f"{first_name} {middle_name} {surname}".strip()
-                        else:
-                            full_name = f"{first_name} {surname}".strip()
-                        
-                        # Cohort - ilk kolondan veya Cohort kolonundan al
-                        cohort = row.get(cohort_col_name, '').strip()
-                        if not cohort and first_col_name and first_col_name != cohort_col_name:
-                            # Eğer cohort boşsa ve ilk kolon varsa, ilk kolondan dene
-                            cohort = row.get(first_col_name, '').strip()
-                        
-                        # Debug için log (sadece ilk birkaç satır için)
-                        if count < 3:
-                            logger.debug(f"[i] CSV Satır {count+2}: Cohort='{cohort}', Slack ID='{slack_id}'")
-                        
-                        # Tarih formatını düzelt (DD.MM.YYYY veya D.M.YYYY -> YYYY-MM-DD)
-                        birthday_raw = row.get('Birthday', '').strip()
-                        birthday = None
-                        if birthday_raw:
-                            try:
-                                # Önce standart formatı dene (DD.MM.YYYY)
-                                dt = datetime.strptime(birthday_raw, '%d.%m.%Y')
-                                birthday = dt.strftime('%Y-%m-%d')
-                            except ValueError:
-                                try:
-                                    # Tek haneli gün/ay formatını dene (D.M.YYYY)
-                                    parts = birthday_raw.split('.')
-                                    if len(parts) == 3:
-                                        day = parts[0].zfill(2)  # Tek haneli günü iki haneli yap
-                                        month = parts[1].zfill(2)  # Tek haneli ayı iki haneli yap
-                                        year = parts[2]
-                                        normalized_date = f"{day}.{month}.{year}"
-                                        dt = datetime.strptime(normalized_date, '%d.%m.%Y')
-                                        birthday = dt.strftime('%Y-%m-%d')
-                                    else:
-                                        raise ValueError("Tarih formatı geçersiz")
-                                except ValueError:
-                                    # Tarih formatı uymuyorsa None bırak veya logla
-                                    logger.warning(f"[!] Geçersiz tarih formatı: {birthday_raw} (Satır: {count+2})")
-                        
-                        if not slack_id or not first_name or not surname:
-                            logger.warning(f"[!] Eksik veri atlandı (Satır: {count+2}): Slack ID, First Name veya Surname boş")
-                            continue
-
-                        # ID oluştur (UUID)
-                        user_id = str(uuid.uuid4())
-
-                        sql = f"""
-                            INSERT INTO {self.table_name} 
-                            (id, slack_id, first_name, middle_name, surname, full_name, birthday, cohort) 
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                        """
-                        cursor.execute(sql, (user_id, slack_id, first_name, middle_name, surname, full_name, birthday, cohort))
-                        count += 1
-                        
-                    except Exception as row_error:
-                        logger.warning(f"[!] Satır işlenirken hata (Satır: {count+2}): {row_error}")
-                        continue
+                # Toplu yükleme boyunca fsync'i kapat (tek transaction, sonunda eski değere dönülür).
+                # synchronous transaction içinde değiştirilemediği için DELETE'ten önce ayarlanır.
+                previous_synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+                conn.execute("PRAGMA synchronous=OFF")
+                try:
+                    count = self._bulk_insert_rows(conn, rows, first_col_name, cohort_col_name)
+                finally:
+                    conn.execute(f"PRAGMA synchronous={int(previous_synchronous)}")
                 
-                conn.commit()
+                self.invalidate_cache()
                 logger.info(f"[+] CSV import tamamlandı. {count} kullanıcı eklendi.")
                 return count
                 
         except Exception as e:
             logger.error(f"[X] UserRepository.import_from_csv hatası: {e}")
             raise DatabaseError(str(e))
+
+    def _bulk_insert_rows(self, conn, rows: List[Dict[str, str]], first_col_name: Optional[str], cohort_col_name: str) -> int:
+        """
+        CSV satırlarını tabloyu temizleyip tek transaction içinde toplu olarak ekler.
+        Kayıtlar IMPORT_BATCH_SIZE'lık parçalar halinde executemany ile yazılır; eklenen satır sayısını döndürür.
+        """
+        from datetime import datetime
+        
+        cursor = conn.cursor()
+        try:
+            # 1. Tabloyu temizle
+            cursor.execute(f"DELETE FROM {self.table_name}")
+            changes_before = conn.total_changes
+            insert_sql = f"""
+                INSERT OR IGNORE INTO {self.table_name} 
+                (id, slack_id, first_name, middle_name, surname, full_name, birthday, cohort) 
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """
+            
+            # 2. Yeni kayıtları hazırla ve parça parça ekle
+            records = []
+            prepared = 0
+            count = 0
+            for row in rows:
+                try:
+                    # CSV'den sadece gerekli alanları al
+                    raw_slack_id = row.get('Slack ID', '').strip()
+                    # Slack ID bazen "U123 (name)" formatında olabiliyor, sadece ID kısmını al
+                    slack_id = raw_slack_id.split(' ')[0] if raw_slack_id else ''
+                    
+                    first_name = row.get('First Name', '').strip()
+                    middle_name = row.get('Middle Name', '').strip()
+                    surname = row.get('Surname', '').strip()
+                    
+                    # Tam isim oluştur (orta isim varsa dahil et)
+                    if middle_name:
+                        full_name = f"{first_name} {middle_name} {surname}".strip()
+                    else:
+                        full_name = f"{first_name} {surname}".strip()
+                    
+                    # Cohort - ilk kolondan veya Cohort kolonundan al
+                    cohort = row.get(cohort_col_name, '').strip()
+                    if not cohort and first_col_name and first_col_name != cohort_col_name:
+                        # Eğer cohort boşsa ve ilk kolon varsa, ilk kolondan dene
+                        cohort = row.get(first_col_name, '').strip()
+                    
+                    # Debug için log (sadece ilk birkaç satır için)
+                    if count < 3:
+                        logger.debug(f"[i] CSV Satır {count+2}: Cohort='{cohort}', Slack ID='{slack_id}'")
+                    
+                    # Tarih formatını düzelt (DD.MM.YYYY veya D.M.YYYY -> YYYY-MM-DD)
+                    birthday_raw = row.get('Birthday', '').strip()
+                    birthday = None
+                    if birthday_raw:
+                        try:
+                            # Önce standart formatı dene (DD.MM.YYYY)
+                            dt = datetime.strptime(birthday_raw, '%d.%m.%Y')
+                            birthday = dt.strftime('%Y-%m-%d')
+                        except ValueError:
+                            try:
+                                # Tek haneli gün/ay formatını dene (D.M.YYYY)
+                                parts = birthday_raw.split('.')
+                                if len(parts) == 3:
+                                    day = parts[0].zfill(2)  # Tek haneli günü iki haneli yap
+                                    month = parts[1].zfill(2)  # Tek haneli ayı iki haneli yap
+                                    year = parts[2]
+                                    normalized_date = f"{day}.{month}.{year}"
+                                    dt = datetime.strptime(normalized_date, '%d.%m.%Y')
+                                    birthday = dt.strftime('%Y-%m-%d')
+                                else:
+                                    raise ValueError("Tarih formatı geçersiz")
+                            except ValueError:
+                                # Tarih formatı uymuyorsa None bırak veya logla
+                                logger.warning(f"[!] Geçersiz tarih formatı: {birthday_raw} (Satır: {count+2})")
+                    
+                    if not slack_id or not first_name or not surname:
+                        logger.warning(f"[!] Eksik veri atlandı (Satır: {count+2}): Slack ID, First Name veya Surname boş")
+                        continue
+
+                    # ID oluştur (zaman sıralı)
+                    user_id = self.db_client.new_id()
+
+                    records.append((user_id, slack_id, first_name, middle_name, surname, full_name, birthday, cohort))
+                    count += 1
+                    
+                except Exception as row_error:
+                    logger.warning(f"[!] Satır işlenirken hata (Satır: {count+2}): {row_error}")
+                    continue
+                
+                if len(records) >= IMPORT_BATCH_SIZE:
+                    cursor.executemany(insert_sql, records)
+                    prepared += len(records)
+                    records.clear()
+            
+            # 3. Kalan kayıtları ekle. Tekrarlanan Slack ID'ler (UNIQUE) önceki davranıştaki gibi atlanır.
+            if records:
+                cursor.executemany(insert_sql, records)
+                prepared += len(records)
+            count = conn.total_changes - changes_before
+            if count < prepared:
+                logger.warning(f"[!] {prepared - count} tekrarlanan Slack ID atlandı.")
+            
+            conn.commit()
+            return count
+        except Exception:
+            conn.rollback()
+            raise
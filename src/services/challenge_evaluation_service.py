@@ -2,12 +2,20 @@
 Challenge değerlendirme servisi.
 """
 
+import asyncio
+import atexit
+import logging
 import uuid
+from concurrent.futures import Future
+from functools import lru_cache
 import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
 from src.core.logger import logger
+from src.core.async_loop import get_loop
 from src.commands import ChatManager, ConversationManager, CanvasManager, UserManager
 from src.repositories import (
     ChallengeEvaluationRepository,
@@ -18,6 +26,182 @@ from src.repositories import (
 )
 from src.clients import CronClient
 from src.core.settings import get_settings
+from src.core.ttl_cache import TTLCache
+
+# GitHub repo URL kalıpları (modül yüklenirken bir kez derlenir)
+_GITHUB_REPO_PREFIX_RE = re.compile(r'https?://github\.com/([^/]+)/([^/]+)')
+_GITHUB_REPO_URL_RE = re.compile(r'https?://github\.com/[^/\s]+/[^/\s]+/?')
+
+# GitHub public kontrolü: TCP/TLS bağlantısı çağrılar arasında yeniden kullanılır,
+# public sonucu aynı repo için kısa süre önbellekte tutulur
+GITHUB_API_TIMEOUT_SECONDS = 5
+GITHUB_PUBLIC_CACHE_TTL_SECONDS = 120
+_github_session = requests.Session()
+# Eşzamanlı kontroller (to_thread) için yeterli keep-alive havuzu; geçici 5xx hataları kısa backoff ile tekrar denenir
+_github_session.mount("https://", HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504))
+))
+# Kimliksiz istek bilinçli: token ile private repolar da 200 döner ve public kontrolü anlamsızlaşır
+_github_session.headers.update({
+    "Accept": "application/vnd.github+json",
+    "X-GitHub-Api-Version": "2022-11-28"
+})
+# Çıkışta havuzdaki keep-alive bağlantıları kapatılır
+atexit.register(_github_session.close)
+_github_public_cache = TTLCache(maxsize=1024, ttl=GITHUB_PUBLIC_CACHE_TTL_SECONDS)
+# Public repoların son ETag'i; önbellek süresi dolunca koşullu istek (If-None-Match) atılır, 304 = hâlâ public
+GITHUB_ETAG_TTL_SECONDS = 24 * 60 * 60
+_github_etags = TTLCache(maxsize=1024, ttl=GITHUB_ETAG_TTL_SECONDS)
+
+# Eşzamanlı Slack DM çağrısı üst sınırı (rate limit'e takılmamak için)
+SLACK_DM_CONCURRENCY = 5
+
+# Başarılı challenge'da ekipteki her kullanıcıya verilen puan
+POINTS_PER_SUCCESS = 100
+
+
+def _log_slack_error(message: str):
+    """
+    Beklenen dış servis (Slack) hatalarını loglar.
+    Rate limit fırtınalarında her hata için traceback üretilmesin diye traceback sadece DEBUG seviyesinde eklenir;
+    beklenmeyen hatalar için çağıranlar exc_info=True kullanmaya devam eder.
+    """
+    logger.error(message, exc_info=logger.isEnabledFor(logging.DEBUG))
+
+
+# Değerlendirme kanalı açılış mesajı (tamamen statik; paylaşıldığı için değiştirilmemelidir)
+_EVALUATION_WELCOME_BLOCKS = [
+    {
+        "type": "section",
+        "text": {
+            "type": "mrkdwn",
+            "text": (
+                "👋 *Değerlendirme Başladı!*\n\n"
+                "3 kişilik jüri ekibi bekleniyor. Jüri gelince değerlendirme başlayacak.\n\n"
+                "💡 GitHub linki ekleyin: `/challenge set github <link>`"
+            )
+        }
+    }
+]
+
+# Jüri çağrısı mesajının statik blokları ve dinamik bölüm şablonu
+_JURY_CALL_HEADER_BLOCK = {
+    "type": "header",
+    "text": {
+        "type": "plain_text",
+        "text": "📣 Jüri Aranıyor",
+        "emoji": True
+    }
+}
+_DIVIDER_BLOCK = {"type": "divider"}
+_JURY_CALL_SECTION_TMPL = (
+    "🎯 *Tema:* {theme}\n"
+    "📌 *Proje:* {project_name}\n"
+    "👥 *Takım:* {participants_text}\n\n"
+    "💡 *Açıklama:*\n{description}"
+)
+
+
+# Başarısızlık mesajları: nedenler (oy yetersiz, GitHub linki yok, repo private) 3 bitlik koda göre
+# önceden birleştirilir; finalize'da liste kurup join etmek yerine doğrudan okunur
+_FAIL_REASON_VOTES = "True oyları ({true_votes}) False oylarından ({false_votes}) fazla değil"
+_FAIL_REASON_NO_URL = "GitHub repo linki eklenmemiş"
+_FAIL_REASON_PRIVATE = "GitHub repo public değil"
+
+
+def _build_fail_messages() -> Dict[int, str]:
+    messages = {}
+    for code in range(8):
+        reasons = [
+            reason for bit, reason in (
+                (4, _FAIL_REASON_VOTES), (2, _FAIL_REASON_NO_URL), (1, _FAIL_REASON_PRIVATE)
+            ) if code & bit
+        ]
+        messages[code] = "❌ *Challenge Başarısız*\n\n*Nedenler:*\n" + "\n".join(f"• {r}" for r in reasons)
+    return messages
+
+
+_FAIL_MESSAGES = _build_fail_messages()
+
+
+def _jury_call_actions(evaluation_id: str) -> Dict[str, Any]:
+    """Jüri çağrısındaki 'Jüri Ol' butonunu içeren actions bloğu (tek dinamik alan: value)."""
+    return {
+        "type": "actions",
+        "elements": [
+            {
+                "type": "button",
+                "text": {
+                    "type": "plain_text",
+                    "text": "🙋 Jüri Ol (0/3)",
+                    "emoji": True
+                },
+                "style": "primary",
+                "action_id": "challenge_join_jury_toggle",
+                "value": evaluation_id
+            }
+        ]
+    }
+
+@lru_cache(maxsize=256)
+def _admin_approve_actions(evaluation_id: str) -> Dict[str, Any]:
+    """
+    Admin onay/red butonlarını içeren actions bloğu (değerlendirme başına bir kez üretilir).
+    Dönen sözlük paylaşıldığı için değiştirilmemelidir.
+    """
+    return {
+        "type": "actions",
+        "elements": [
+            {
+                "type": "button",
+                "text": {
+                    "type": "plain_text",
+                    "text": "✅ Onayla ve Bitir",
+                    "emoji": True
+                },
+                "style": "primary",
+                "action_id": "admin_approve_evaluation",
+                "value": evaluation_id
+            },
+            {
+                "type": "button",
+                "text": {
+                    "type": "plain_text",
+                    "text": "❌ Reddet ve Bitir",
+                    "emoji": True
+                },
+                "style": "danger",
+                "action_id": "admin_reject_evaluation",
+                "value": evaluation_id
+            }
+        ]
+    }
+
+
+def _build_admin_approve_blocks(
+    title: str,
+    true_votes: int,
+    false_votes: int,
+    github_url: str,
+    evaluation_id: str
+) -> List[Dict[str, Any]]:
+    """Oy özeti ve admin onay butonlarından oluşan mesaj bloklarını döndürür."""
+    return [
+        {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": (
+                    f"✅ *{title}*\n"
+                    f"📊 Oylar: ✅{true_votes} ❌{false_votes} | 🔗 {github_url}\n\n"
+                    "👤 Admin onayı bekleniyor..."
+                )
+            }
+        },
+        _admin_approve_actions(evaluation_id)
+    ]
 
 
 class ChallengeEvaluationService:
@@ -46,16 +230,73 @@ class ChallengeEvaluationService:
         self.participant_repo = participant_repo
         self.stats_repo = stats_repo
         self.cron = cron_client
+        # Admin ID bir kez çözülür (her istekte settings'e gidilmez)
+        self._admin_id = get_settings().admin_slack_id
+        # Arka planda çalışan görevler (tamamlanana kadar referans tutulur)
+        self._background_tasks: Set[Future] = set()
+
+    def _send_dm(self, user_id: str, text: str):
+        """Kullanıcıya DM gönderir (senkron Slack çağrıları)."""
+        dm_channel = self.conv.open_conversation([user_id])
+        if dm_channel:
+            self.chat.post_message(channel=dm_channel["channel"]["id"], text=text)
+
+    async def _dm_user(self, user_id: str, text: str):
+        """DM'i event loop'u bloklamadan thread'de gönderir; hatalar yutulur."""
+        try:
+            await asyncio.to_thread(self._send_dm, user_id, text)
+        except Exception as e:
+            logger.debug(f"[!] DM gönderilemedi ({user_id}): {e}")
+
+    async def _dm_users(self, user_ids: List[str], text: str):
+        """Aynı DM'i kullanıcılara paralel gönderir (en fazla SLACK_DM_CONCURRENCY eşzamanlı)."""
+        # Semaphore çağrı içinde oluşturulur; servis farklı event loop'lardan çağrılabiliyor
+        semaphore = asyncio.Semaphore(SLACK_DM_CONCURRENCY)
+
+        async def _send(user_id: str):
+            async with semaphore:
+                await self._dm_user(user_id, text)
+
+        await asyncio.gather(*(_send(user_id) for user_id in user_ids))
+
+    async def _db(self, fn, *args, **kwargs):
+        """Senkron repository çağrısını thread'de çalıştırır; event loop diğer isteklere açık kalır."""
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    def _ensure_user_row(self, user_id: str):
+        """Kullanıcı users tablosunda yoksa ekler (jüri kaydının foreign key'i için); hatalar yutulur."""
+        try:
+            with self.evaluation_repo.db_client.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT id FROM users WHERE slack_id = ?", (user_id,))
+                user_exists = cursor.fetchone()
+
+                if not user_exists:
+                    # Kullanıcı yoksa otomatik ekle
+                    user_uuid = str(uuid.uuid4())
+                    cursor.execute("""
+                        INSERT INTO users (id, slack_id, full_name, created_at, updated_at)
+                        VALUES (?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+                    """, (user_uuid, user_id, f"User {user_id}"))
+                    conn.commit()
+                    logger.info(f"[+] Jüri için kullanıcı otomatik eklendi: {user_id}")
+        except Exception as e:
+            logger.warning(f"[!] Kullanıcı kontrolü/ekleme hatası (jüri): {e}")
 
     async def update_challenge_canvas(self, challenge_id: str = None) -> None:
         """
         Duyuru kanalındaki challenge özet/canvas mesajını günceller veya yoksa oluşturur.
         Tüm aktif challenge'ları yatay tablo formatında gösterir.
         Her challenge bir satır olarak eklenir.
+        DB ve Slack çağrıları senkron olduğundan event loop'u bloklamamak için thread'de çalışır.
         
         Args:
             challenge_id: Belirli bir challenge için güncelleme (opsiyonel, None ise tüm aktif challenge'lar)
         """
+        await asyncio.to_thread(self._update_challenge_canvas_sync, challenge_id)
+
+    def _update_challenge_canvas_sync(self, challenge_id: str = None) -> None:
+        """update_challenge_canvas'ın senkron gövdesi."""
         try:
             # Tüm aktif challenge'ları al
             all_active_challenges = self.hub_repo.get_all_active()
@@ -159,14 +400,11 @@ class ChallengeEvaluationService:
                 # Oylar
                 votes_info = "-"
                 if evaluation:
-                    try:
-                        votes = self.evaluator_repo.get_votes(evaluation["id"])
-                        true_votes = votes.get("true", 0)
-                        false_votes = votes.get("false", 0)
-                        if true_votes > 0 or false_votes > 0:
-                            votes_info = f"✅{true_votes} ❌{false_votes}"
-                    except:
-                        pass
+                    # Oy sayaçları değerlendirme satırında tutulur (ek sorgu yok)
+                    true_votes = evaluation.get("true_votes") or 0
+                    false_votes = evaluation.get("false_votes") or 0
+                    if true_votes > 0 or false_votes > 0:
+                        votes_info = f"✅{true_votes} ❌{false_votes}"
                 
                 # Tablo satırı ekle
                 table_rows.append({
@@ -387,7 +625,85 @@ class ChallengeEvaluationService:
             except Exception as e:
                 logger.warning(f"[!] Canvas mesajı oluşturulamadı: {e}")
         except Exception as e:
-            logger.error(f"[X] Canvas güncelleme hatası: {e}", exc_info=True)
+            _log_slack_error(f"[X] Canvas güncelleme hatası: {e}")
+
+    def _spawn_background(self, coro):
+        """
+        Coroutine'i paylaşılan arka plan loop'unda başlatır; referans tutulur ki GC toplamasın.
+        Handler'lar istek başına loop (asyncio.run) kullandığından görev, çağıran loop kapansa da sürer.
+        """
+        name = getattr(coro, "__qualname__", repr(coro))
+        future = asyncio.run_coroutine_threadsafe(coro, get_loop())
+        self._background_tasks.add(future)
+        future.add_done_callback(lambda f: self._on_background_done(f, name))
+        return future
+
+    def _on_background_done(self, future: Future, name: str):
+        """Biten arka plan görevini bırakır; yakalanmamış hatayı loglar (aksi halde sessizce kaybolur)."""
+        self._background_tasks.discard(future)
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            logger.error(f"[X] Arka plan görevi hatası ({name}): {exc}", exc_info=exc)
+
+    async def _post_start_tasks(
+        self,
+        evaluation_id: str,
+        eval_channel_id: str,
+        challenge: Dict[str, Any],
+        deadline: datetime
+    ):
+        """Değerlendirme başlangıcının kritik yolda olmayan işleri: deadline görevi ve açılış mesajları."""
+        try:
+            # Deadline anında otomatik kapatma görevi planla (saatlik tarama sadece güvenlik ağı)
+            self.cron.add_once_job(
+                func=self.finalize_evaluation,
+                run_date=deadline,
+                job_id=f"finalize_evaluation_{evaluation_id}",
+                args=[evaluation_id]
+            )
+            logger.info(f"[+] 48 saatlik değerlendirme timer'ı başlatıldı | Evaluation: {evaluation_id}")
+        except Exception as e:
+            logger.error(f"[X] Değerlendirme timer'ı kurulamadı: {e}", exc_info=True)
+
+        # Kanal açılış mesajı (EKİP İÇİN) ve challenge kanalına yönlendirme mesajı paralel gönderilir
+        challenge_channel_id = challenge.get("challenge_channel_id")
+        posts = [
+            asyncio.to_thread(
+                self.chat.post_message,
+                channel=eval_channel_id,
+                text="👋 Değerlendirme Başladı!",
+                blocks=_EVALUATION_WELCOME_BLOCKS
+            )
+        ]
+        if challenge_channel_id:
+            posts.append(asyncio.to_thread(
+                self.chat.post_message,
+                channel=challenge_channel_id,
+                text="🚀 Challenge tamamlandı! Değerlendirme süreci başladı.",
+                blocks=[
+                    {
+                        "type": "section",
+                        "text": {
+                            "type": "mrkdwn",
+                            "text": (
+                                "🚀 *Challenge Tamamlandı!*\n\n"
+                                f"Değerlendirme süreci başladı. Lütfen <#{eval_channel_id}> kanalında devam edin.\n\n"
+                                "💡 *Not:* Tüm ekip üyeleri otomatik olarak değerlendirme kanalına eklendi."
+                            )
+                        }
+                    }
+                ]
+            ))
+        welcome_result, *redirect_results = await asyncio.gather(*posts, return_exceptions=True)
+        if isinstance(welcome_result, Exception):
+            logger.warning(f"[!] Değerlendirme açılış mesajı gönderilemedi: {welcome_result}")
+        for result in redirect_results:
+            if isinstance(result, Exception):
+                logger.warning(f"[!] Challenge kanalına yönlendirme mesajı gönderilemedi: {result}")
+            else:
+                logger.info(f"[+] Challenge kanalına yönlendirme mesajı gönderildi: {challenge_channel_id}")
 
     async def start_evaluation(
         self,
@@ -400,21 +716,13 @@ class ChallengeEvaluationService:
         """
         try:
             # Challenge kontrolü
-            challenge = self.hub_repo.get(challenge_id)
+            challenge = await self._db(self.hub_repo.get, challenge_id)
             if not challenge:
                 return {
                     "success": False,
                     "message": "❌ Challenge bulunamadı."
                 }
 
-            # Zaten değerlendirme başlatılmış mı?
-            existing = self.evaluation_repo.get_by_challenge(challenge_id)
-            if existing:
-                return {
-                    "success": False,
-                    "message": "⚠️ Bu challenge için değerlendirme zaten başlatılmış."
-                }
-
             # Değerlendirme kaydı oluştur
             evaluation_id = str(uuid.uuid4())
             deadline = datetime.now() + timedelta(hours=48)
@@ -425,7 +733,12 @@ class ChallengeEvaluationService:
                 "status": "pending",
                 "deadline_at": deadline.isoformat()
             }
-            self.evaluation_repo.create(evaluation_data)
+            # Zaten değerlendirme başlatılmış mı? (kontrol INSERT içinde, ön SELECT gerekmez)
+            if not await self._db(self.evaluation_repo.create_for_challenge, evaluation_data):
+                return {
+                    "success": False,
+                    "message": "⚠️ Bu challenge için değerlendirme zaten başlatılmış."
+                }
 
             # 1. Değerlendirme kanalını HEMEN oluştur
             channel_suffix = str(uuid.uuid4())[:8]
@@ -439,99 +752,39 @@ class ChallengeEvaluationService:
                 eval_channel_id = eval_channel["id"]
                 
                 # Değerlendirme kaydını güncelle
-                self.evaluation_repo.update(evaluation_id, {
+                await self._db(self.evaluation_repo.update, evaluation_id, {
                     "evaluation_channel_id": eval_channel_id,
                     "status": "evaluating"
                 })
                 
                 logger.info(f"[+] Değerlendirme kanalı oluşturuldu: {eval_channel_id} | Challenge: {challenge_id}")
             except Exception as e:
-                logger.error(f"[X] Değerlendirme kanalı oluşturulamadı: {e}", exc_info=True)
+                _log_slack_error(f"[X] Değerlendirme kanalı oluşturulamadı: {e}")
                 return {
                     "success": False,
                     "message": "❌ Değerlendirme kanalı oluşturulamadı."
                 }
 
             # 2. Tüm katılımcıları kanala ekle (creator + participants + admin)
-            settings = get_settings()
-            ADMIN_USER_ID = settings.admin_slack_id
             creator_id = challenge.get("creator_id")
-            participants = self.participant_repo.list(filters={"challenge_hub_id": challenge_id})
-            participant_ids = [p["user_id"] for p in participants]
+            participant_ids = await self._db(self.participant_repo.list_user_ids, challenge_id)
             
-            # Tüm kullanıcıları birleştir (tekrarları önle)
-            all_user_ids = set()
-            if creator_id:
-                all_user_ids.add(creator_id)
-            for pid in participant_ids:
-                all_user_ids.add(pid)
-            if ADMIN_USER_ID:
-                all_user_ids.add(ADMIN_USER_ID)
+            # Tüm kullanıcıları birleştir (tekrarları önle, sırayı koru)
+            all_user_ids = list(dict.fromkeys(
+                uid for uid in (creator_id, *participant_ids, self._admin_id) if uid
+            ))
             
             # Kullanıcıları kanala davet et
             try:
-                self.conv.invite_users(eval_channel_id, list(all_user_ids))
+                self.conv.invite_users(eval_channel_id, all_user_ids)
                 logger.info(f"[+] {len(all_user_ids)} kullanıcı değerlendirme kanalına eklendi | Evaluation: {evaluation_id}")
             except Exception as e:
                 logger.warning(f"[!] Kullanıcılar kanala davet edilirken hata: {e}")
 
-            # 3. 48 saat sonra otomatik kapatma görevi planla
-            self.cron.add_once_job(
-                func=self.finalize_evaluation,
-                delay_minutes=48 * 60,
-                job_id=f"finalize_evaluation_{evaluation_id}",
-                args=[evaluation_id]
+            # 3-4. Deadline görevi ve açılış/yönlendirme mesajları arka planda (yanıtı bekletmez)
+            self._spawn_background(
+                self._post_start_tasks(evaluation_id, eval_channel_id, challenge, deadline)
             )
-            logger.info(f"[+] 48 saatlik değerlendirme timer'ı başlatıldı | Evaluation: {evaluation_id}")
-
-            # 4. Kanal açılış mesajını gönder (EKİP İÇİN)
-            welcome_blocks = [
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": (
-                            "👋 *Değerlendirme Başladı!*\n\n"
-                            "3 kişilik jüri ekibi bekleniyor. Jüri gelince değerlendirme başlayacak.\n\n"
-                            "💡 GitHub linki ekleyin: `/challenge set github <link>`"
-                        )
-                    }
-                }
-            ]
-            
-            try:
-                self.chat.post_message(
-                    channel=eval_channel_id,
-                    text="👋 Değerlendirme Başladı!",
-                    blocks=welcome_blocks
-                )
-                
-                # 5. Challenge kanalına yönlendirme mesajı gönder
-                challenge_channel_id = challenge.get("challenge_channel_id")
-                if challenge_channel_id:
-                    try:
-                        self.chat.post_message(
-                            channel=challenge_channel_id,
-                            text="🚀 Challenge tamamlandı! Değerlendirme süreci başladı.",
-                            blocks=[
-                                {
-                                    "type": "section",
-                                    "text": {
-                                        "type": "mrkdwn",
-                                        "text": (
-                                            "🚀 *Challenge Tamamlandı!*\n\n"
-                                            f"Değerlendirme süreci başladı. Lütfen <#{eval_channel_id}> kanalında devam edin.\n\n"
-                                            "💡 *Not:* Tüm ekip üyeleri otomatik olarak değerlendirme kanalına eklendi."
-                                        )
-                                    }
-                                }
-                            ]
-                        )
-                        logger.info(f"[+] Challenge kanalına yönlendirme mesajı gönderildi: {challenge_channel_id}")
-                    except Exception as e:
-                        logger.warning(f"[!] Challenge kanalına yönlendirme mesajı gönderilemedi: {e}")
-            except Exception as e:
-                logger.warning(f"[!] Değerlendirme açılış mesajı gönderilemedi: {e}")
 
             # 5. Topluluk kanalına JÜRİ ÇAĞRISI gönder
             target_channel = challenge.get("hub_channel_id") or trigger_channel_id
@@ -542,7 +795,7 @@ class ChallengeEvaluationService:
             project_description = challenge.get("project_description") or "Henüz açıklama bulunmuyor."
             
             # Katılımcıları al
-            participants = self.participant_repo.get_team_members(challenge_id)
+            participants = await self._db(self.participant_repo.get_team_members, challenge_id)
             participant_ids = [p["user_id"] for p in participants]
             creator_id = challenge.get("creator_id")
             if creator_id and creator_id not in participant_ids:
@@ -555,46 +808,23 @@ class ChallengeEvaluationService:
             if len(participant_ids) > 5:
                 participants_text += f" ve {len(participant_ids) - 5} kişi daha"
             
+            description = project_description[:150] + ("..." if len(project_description) > 150 else "")
             info_blocks = [
-                {
-                    "type": "header",
-                    "text": {
-                        "type": "plain_text",
-                        "text": "📣 Jüri Aranıyor",
-                        "emoji": True
-                    }
-                },
+                _JURY_CALL_HEADER_BLOCK,
                 {
                     "type": "section",
                     "text": {
                         "type": "mrkdwn",
-                        "text": (
-                            f"🎯 *Tema:* {theme}\n"
-                            f"📌 *Proje:* {project_name}\n"
-                            f"👥 *Takım:* {participants_text}\n\n"
-                            f"💡 *Açıklama:*\n{project_description[:150]}{'...' if len(project_description) > 150 else ''}"
-                        )
+                        "text": _JURY_CALL_SECTION_TMPL.format_map({
+                            "theme": theme,
+                            "project_name": project_name,
+                            "participants_text": participants_text,
+                            "description": description
+                        })
                     }
                 },
-                {
-                    "type": "divider"
-                },
-                {
-                    "type": "actions",
-                    "elements": [
-                        {
-                            "type": "button",
-                            "text": {
-                                "type": "plain_text",
-                                "text": "🙋 Jüri Ol (0/3)",
-                                "emoji": True
-                            },
-                            "style": "primary",
-                            "action_id": "challenge_join_jury_toggle",
-                            "value": evaluation_id
-                        }
-                    ]
-                }
+                _DIVIDER_BLOCK,
+                _jury_call_actions(evaluation_id)
             ]
 
             self.chat.post_message(
@@ -639,11 +869,21 @@ class ChallengeEvaluationService:
         - 'locked': Davet tamamlandı, jüri ekibi artık değiştirilemez (toggle KİLİTLİ)
         """
         try:
-            evaluation = self.evaluation_repo.get(evaluation_id)
-            if not evaluation:
+            # Admin jüri olamaz - I/O yapmadan önce kontrol et
+            if user_id == self._admin_id:
+                return {
+                    "success": False,
+                    "message": "⚠️ Proje ekibi veya admin jüri olamaz.",
+                    "action": "none"
+                }
+
+            # Değerlendirme, challenge, katılımcılık, jüri kaydı ve jüri sayısı tek sorguda
+            context = await self._db(self.evaluation_repo.get_context, evaluation_id, user_id)
+            if not context:
                 return {"success": False, "message": "❌ Değerlendirme bulunamadı."}
 
-            challenge = self.hub_repo.get(evaluation["challenge_hub_id"])
+            evaluation = context.evaluation
+            challenge = context.challenge
             if not challenge:
                 return {"success": False, "message": "❌ Challenge bulunamadı."}
 
@@ -658,14 +898,8 @@ class ChallengeEvaluationService:
                     "status": jury_status
                 }
 
-            # 2. Proje sahibi/üyesi/admin kontrolü - bunlar jüri olamaz
-            settings = get_settings()
-            ADMIN_USER_ID = settings.admin_slack_id
-            creator_id = challenge.get("creator_id")
-            participants = self.participant_repo.list(filters={"challenge_hub_id": challenge["id"]})
-            participant_ids = [p["user_id"] for p in participants]
-
-            if user_id == ADMIN_USER_ID or user_id == creator_id or user_id in participant_ids:
+            # 2. Proje sahibi/üyesi kontrolü - bunlar jüri olamaz (admin yukarıda elendi)
+            if user_id == challenge.get("creator_id") or context.is_participant:
                 return {
                     "success": False,
                     "message": "⚠️ Proje ekibi veya admin jüri olamaz.",
@@ -673,26 +907,22 @@ class ChallengeEvaluationService:
                 }
 
             # 3. Zaten jüri mi? (Toggle Mantığı)
-            existing_juror = self.evaluator_repo.get_by_evaluation_and_user(evaluation_id, user_id)
+            existing_juror = context.evaluator
             
             if existing_juror:
                 # VARSA -> ÇIKAR (LEAVE)
                 # Status 'recruiting' olduğu için çıkabilir
-                self.evaluator_repo.delete(existing_juror["id"])
+                await self._db(self.evaluator_repo.delete, existing_juror["id"])
                 logger.info(f"[-] Jüri havuzundan çıktı: {user_id} | Evaluation: {evaluation_id}")
                 
-                # Güncel sayıyı al
-                count = self.evaluator_repo.count_evaluators(evaluation_id)
+                # Güncel sayı (kendi kaydı silindi)
+                count = max(context.evaluator_count - 1, 0)
                 
                 # DM Gönder
-                try:
-                    dm_channel = self.conv.open_conversation([user_id])
-                    if dm_channel:
-                         self.chat.post_message(
-                            channel=dm_channel["channel"]["id"],
-                            text=f"ℹ️ `{challenge.get('theme')}` projesi jüri adaylığından çekildiniz."
-                        )
-                except: pass
+                await self._dm_user(
+                    user_id,
+                    f"ℹ️ `{challenge.get('theme')}` projesi jüri adaylığından çekildiniz."
+                )
                 
                 return {
                     "success": True,
@@ -705,7 +935,7 @@ class ChallengeEvaluationService:
             else:
                 # YOKSA -> EKLE (JOIN)
                 # Önce kontenjan dolu mu kontrol et
-                current_count = self.evaluator_repo.count_evaluators(evaluation_id)
+                current_count = context.evaluator_count
                 if current_count >= 3:
                     return {
                         "success": False,
@@ -714,63 +944,35 @@ class ChallengeEvaluationService:
                     }
 
                 # Kullanıcıyı users tablosuna ekle (foreign key için gerekli)
-                try:
-                    from src.clients import DatabaseClient
-                    db_client = DatabaseClient(db_path=settings.database_path)
-                    
-                    with db_client.get_connection() as conn:
-                        cursor = conn.cursor()
-                        cursor.execute("SELECT id FROM users WHERE slack_id = ?", (user_id,))
-                        user_exists = cursor.fetchone()
-                        
-                        if not user_exists:
-                            # Kullanıcı yoksa otomatik ekle
-                            user_uuid = str(uuid.uuid4())
-                            cursor.execute("""
-                                INSERT INTO users (id, slack_id, full_name, created_at, updated_at)
-                                VALUES (?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-                            """, (user_uuid, user_id, f"User {user_id}"))
-                            conn.commit()
-                            logger.info(f"[+] Jüri için kullanıcı otomatik eklendi: {user_id}")
-                except Exception as e:
-                    logger.warning(f"[!] Kullanıcı kontrolü/ekleme hatası (jüri): {e}")
-
-                # Havuza ekle
-                juror_id = str(uuid.uuid4())
-                self.evaluator_repo.create({
-                    "id": juror_id,
-                    "evaluation_id": evaluation_id,
-                    "user_id": user_id
-                })
-                current_count += 1
+                await self._db(self._ensure_user_row, user_id)
+
+                # Havuza ekle (kontenjan kontrolü ve güncel jüri listesi aynı transaction'da)
+                juror_ids = await self._db(self.evaluator_repo.add_juror, evaluation_id, user_id)
+                if juror_ids is None:
+                    return {
+                        "success": False,
+                        "message": "⚠️ Jüri kontenjanı dolu (3/3).",
+                        "action": "full"
+                    }
+                current_count = len(juror_ids)
                 logger.info(f"[+] Jüri havuzuna eklendi: {user_id} | Evaluation: {evaluation_id}")
                 
                 # DM Gönder
-                try:
-                    dm_channel = self.conv.open_conversation([user_id])
-                    if dm_channel:
-                         self.chat.post_message(
-                            channel=dm_channel["channel"]["id"],
-                            text=(
-                                f"🎉 `{challenge.get('theme')}` projesi için jüri adaylığınız alındı!\n"
-                                f"Şu an *{current_count}/3* kişiyiz. 3 kişi tamamlandığında otomatik olarak kanala ekleneceksiniz.\n\n"
-                                "O zamana kadar bekleyiniz..."
-                            )
-                        )
-                except: pass
+                await self._dm_user(
+                    user_id,
+                    f"🎉 `{challenge.get('theme')}` projesi için jüri adaylığınız alındı!\n"
+                    f"Şu an *{current_count}/3* kişiyiz. 3 kişi tamamlandığında otomatik olarak kanala ekleneceksiniz.\n\n"
+                    "O zamana kadar bekleyiniz..."
+                )
 
                 # 4. EĞER 3. KİŞİ İSE -> STATUS KİLİTLE VE TOPLU DAVET BAŞLAT
                 if current_count >= 3:
                     # ⚠️ ÖNEMLİ: Önce status'ü "finalizing" yap (LOCK)
                     # Bu sayede başka biri toggle yapamaz
-                    self.evaluation_repo.update(evaluation_id, {"jury_status": "finalizing"})
+                    await self._db(self.evaluation_repo.update, evaluation_id, {"jury_status": "finalizing"})
                     logger.info(f"[🔒] Jüri status: 'finalizing' | Evaluation: {evaluation_id}")
-                    
-                    # 3 Jüriyi Al
-                    all_jurors = self.evaluator_repo.list_by_evaluation(evaluation_id)
-                    juror_ids = [j["user_id"] for j in all_jurors]
-                    
-                    # Kanala Davet Et (Batch)
+
+                    # Kanala Davet Et (Batch) - jüri listesi add_juror'dan geldi
                     eval_channel_id = evaluation.get("evaluation_channel_id")
                     if eval_channel_id:
                         try:
@@ -787,25 +989,20 @@ class ChallengeEvaluationService:
                                 )
                             )
                             
-                            # DM ile haber ver
-                            for j_id in juror_ids:
-                                try:
-                                    dm = self.conv.open_conversation([j_id])
-                                    if dm:
-                                        self.chat.post_message(
-                                            channel=dm["channel"]["id"],
-                                            text="🚀 Jüri ekibi tamamlandı ve kanala eklendiniz! Görev başına!"
-                                        )
-                                except: pass
+                            # DM ile haber ver (paralel)
+                            await self._dm_users(
+                                juror_ids,
+                                "🚀 Jüri ekibi tamamlandı ve kanala eklendiniz! Görev başına!"
+                            )
                             
                             # ✅ Davet tamamlandı, status'ü "locked" yap
-                            self.evaluation_repo.update(evaluation_id, {"jury_status": "locked"})
+                            await self._db(self.evaluation_repo.update, evaluation_id, {"jury_status": "locked"})
                             logger.info(f"[✅] Jüri status: 'locked' | Evaluation: {evaluation_id}")
                                 
                         except Exception as e:
                             logger.error(f"[X] Jüri batch davet hatası: {e}")
                             # Hata durumunda status'ü geri al
-                            self.evaluation_repo.update(evaluation_id, {"jury_status": "recruiting"})
+                            await self._db(self.evaluation_repo.update, evaluation_id, {"jury_status": "recruiting"})
 
                 return {
                     "success": True,
@@ -836,34 +1033,31 @@ class ChallengeEvaluationService:
         Proje üyeleri ve admin oy veremez (admin sadece onay verebilir).
         """
         try:
-            evaluation = self.evaluation_repo.get(evaluation_id)
-            if not evaluation:
+            # Admin oy veremez, sadece onay verebilir - I/O yapmadan önce kontrol et
+            if user_id == self._admin_id:
                 return {
                     "success": False,
-                    "message": "❌ Değerlendirme bulunamadı."
+                    "message": "❌ Admin olarak oy veremezsiniz. Sadece 'Onayla ve Bitir' / 'Reddet ve Bitir' butonlarını kullanabilirsiniz."
                 }
 
-            # Challenge'ı getir (proje üyesi kontrolü için)
-            challenge = self.hub_repo.get(evaluation["challenge_hub_id"])
-            if not challenge:
+            # Değerlendirme, challenge (proje üyesi kontrolü için) ve jüri kaydı tek sorguda
+            context = await self._db(self.evaluation_repo.get_context, evaluation_id, user_id)
+            if not context:
                 return {
                     "success": False,
-                    "message": "❌ Challenge bulunamadı."
+                    "message": "❌ Değerlendirme bulunamadı."
                 }
 
-            # Admin oy veremez, sadece onay verebilir
-            settings = get_settings()
-            ADMIN_USER_ID = settings.admin_slack_id
-            if user_id == ADMIN_USER_ID:
+            evaluation = context.evaluation
+            challenge = context.challenge
+            if not challenge:
                 return {
                     "success": False,
-                    "message": "❌ Admin olarak oy veremezsiniz. Sadece 'Onayla ve Bitir' / 'Reddet ve Bitir' butonlarını kullanabilirsiniz."
+                    "message": "❌ Challenge bulunamadı."
                 }
 
             # Proje ekibi (creator + participants) oy veremez - EN ÜSTTE KONTROL ET
             creator_id = challenge.get("creator_id")
-            participants = self.participant_repo.list(filters={"challenge_hub_id": challenge["id"]})
-            participant_ids = [p["user_id"] for p in participants]
             
             # Creator kontrolü
             if user_id == creator_id:
@@ -873,14 +1067,14 @@ class ChallengeEvaluationService:
                 }
             
             # Participant kontrolü
-            if user_id in participant_ids:
+            if context.is_participant:
                 return {
                     "success": False,
                     "message": "❌ Proje ekibi üyesi olarak oy veremezsiniz. Sadece harici değerlendiriciler oy kullanabilir."
                 }
 
             # Değerlendirici kontrolü (sadece harici değerlendiriciler oy verebilir)
-            evaluator = self.evaluator_repo.get_by_evaluation_and_user(evaluation_id, user_id)
+            evaluator = context.evaluator
             if not evaluator:
                 return {
                     "success": False,
@@ -894,21 +1088,17 @@ class ChallengeEvaluationService:
                     "message": "⚠️ Zaten oy verdiniz. Oyunuzu değiştiremezsiniz."
                 }
 
-            # Oyu kaydet
-            self.evaluator_repo.update(evaluator["id"], {
-                "vote": vote.lower(),
-                "voted_at": datetime.now().isoformat()
-            })
-
-            # Oyları güncelle
-            votes = self.evaluator_repo.get_votes(evaluation_id)
-            true_votes = votes["true"]
-            false_votes = votes["false"]
-            self.evaluation_repo.update_votes(
-                evaluation_id,
-                true_votes,
-                false_votes
+            # Oyu kaydet ve sayacı artır (tek transaction, yeniden sayım yok)
+            votes = await self._db(
+                self.evaluation_repo.record_vote,
+                evaluation_id, evaluator["id"], vote.lower(), datetime.now().isoformat()
             )
+            if votes is None:
+                return {
+                    "success": False,
+                    "message": "⚠️ Zaten oy verdiniz. Oyunuzu değiştiremezsiniz."
+                }
+            true_votes, false_votes = votes
 
             logger.info(f"[+] Oy kaydedildi: {user_id} | Vote: {vote} | Evaluation: {evaluation_id}")
 
@@ -940,79 +1130,38 @@ class ChallengeEvaluationService:
                             self.chat.post_message(
                                 channel=eval_channel_id,
                                 text="✅ Tüm oylar alındı! Admin onayı bekleniyor...",
+                                blocks=_build_admin_approve_blocks(
+                                    "Tüm oylar alındı!", true_votes, false_votes, github_url, evaluation_id
+                                )
+                            )
+                            logger.info(f"[i] Admin onay butonu gönderildi | Evaluation: {evaluation_id}")
+                        except Exception as e:
+                            logger.warning(f"[!] Admin onay butonu gönderilemedi: {e}")
+                    
+                    # Challenge kanalına da bilgilendirme mesajı gönder
+                    challenge_channel_id = challenge.get("challenge_channel_id")
+                    if challenge_channel_id:
+                        try:
+                            self.chat.post_message(
+                                channel=challenge_channel_id,
+                                text="✅ Değerlendirme tamamlandı! Admin onayı bekleniyor...",
                                 blocks=[
                                     {
                                         "type": "section",
                                         "text": {
                                             "type": "mrkdwn",
                                             "text": (
-                                                f"✅ *Tüm oylar alındı!*\n"
-                                                f"📊 Oylar: ✅{votes['true']} ❌{votes['false']} | 🔗 {github_url}\n\n"
+                                                f"✅ *Değerlendirme Tamamlandı!*\n"
+                                                f"📊 Oylar: ✅{true_votes} ❌{false_votes} | 🔗 {github_url}\n\n"
                                                 "👤 Admin onayı bekleniyor..."
                                             )
                                         }
-                                    },
-                                    {
-                                        "type": "actions",
-                                        "elements": [
-                                            {
-                                                "type": "button",
-                                                "text": {
-                                                    "type": "plain_text",
-                                                    "text": "✅ Onayla ve Bitir",
-                                                    "emoji": True
-                                                },
-                                                "style": "primary",
-                                                "action_id": "admin_approve_evaluation",
-                                                "value": evaluation_id
-                                            },
-                                            {
-                                                "type": "button",
-                                                "text": {
-                                                    "type": "plain_text",
-                                                    "text": "❌ Reddet ve Bitir",
-                                                    "emoji": True
-                                                },
-                                                "style": "danger",
-                                                "action_id": "admin_reject_evaluation",
-                                                "value": evaluation_id
-                                            }
-                                        ]
                                     }
                                 ]
                             )
-                            logger.info(f"[i] Admin onay butonu gönderildi | Evaluation: {evaluation_id}")
+                            logger.info(f"[+] Challenge kanalına admin onay bekleme mesajı gönderildi | Channel: {challenge_channel_id}")
                         except Exception as e:
-                            logger.warning(f"[!] Admin onay butonu gönderilemedi: {e}")
-                    
-                    # Challenge kanalına da bilgilendirme mesajı gönder
-                    challenge_id = evaluation.get("challenge_hub_id")
-                    if challenge_id:
-                        challenge = self.hub_repo.get(challenge_id)
-                        challenge_channel_id = challenge.get("challenge_channel_id") if challenge else None
-                        
-                        if challenge_channel_id:
-                            try:
-                                self.chat.post_message(
-                                    channel=challenge_channel_id,
-                                    text="✅ Değerlendirme tamamlandı! Admin onayı bekleniyor...",
-                                    blocks=[
-                                        {
-                                            "type": "section",
-                                            "text": {
-                                                "type": "mrkdwn",
-                                                "text": (
-                                                    f"✅ *Değerlendirme Tamamlandı!*\n"
-                                                    f"📊 Oylar: ✅{votes['true']} ❌{votes['false']} | 🔗 {github_url}\n\n"
-                                                    "👤 Admin onayı bekleniyor..."
-                                                )
-                                            }
-                                        }
-                                    ]
-                                )
-                                logger.info(f"[+] Challenge kanalına admin onay bekleme mesajı gönderildi | Channel: {challenge_channel_id}")
-                            except Exception as e:
-                                logger.warning(f"[!] Challenge kanalına bilgilendirme gönderilemedi: {e}")
+                            logger.warning(f"[!] Challenge kanalına bilgilendirme gönderilemedi: {e}")
                 else:
                     # Repo yok veya private → Bilgilendirme mesajı gönder
                     if eval_channel_id:
@@ -1020,13 +1169,13 @@ class ChallengeEvaluationService:
                             if not github_url:
                                 message = (
                                     f"✅ *Tüm oylar alındı!*\n\n"
-                                    f"📊 Oylar: ✅{votes['true']} ❌{votes['false']}\n\n"
+                                    f"📊 Oylar: ✅{true_votes} ❌{false_votes}\n\n"
                                     f"🔗 GitHub linki ekleyin: `/challenge set github <link>`"
                                 )
                             else:
                                 message = (
                                     f"✅ *Tüm oylar alındı!*\n\n"
-                                    f"📊 Oylar: ✅{votes['true']} ❌{votes['false']}\n\n"
+                                    f"📊 Oylar: ✅{true_votes} ❌{false_votes}\n\n"
                                     f"⚠️ GitHub repo private. Public yapın veya linki güncelleyin: `/challenge set github <link>`"
                                 )
                             
@@ -1078,13 +1227,20 @@ class ChallengeEvaluationService:
         github_url: str
     ) -> Dict[str, Any]:
         """GitHub repo linkini kaydeder ve public kontrolü yapar."""
+        # Normalizasyon bir kez yapılır; doğrulama, API kontrolü ve kayıt aynı değeri kullanır.
+        # Clone linkindeki ".git" ve sondaki "/" atılır (GitHub repo adları ".git" ile bitemez)
+        github_url = github_url.strip().rstrip("/")
+        if github_url.endswith(".git"):
+            github_url = github_url[:-4]
         try:
-            evaluation = self.evaluation_repo.get(evaluation_id)
-            if not evaluation:
+            # Değerlendirme ve oy sayıları tek sorguda (link kaydı oyları değiştirmez)
+            context = await self._db(self.evaluation_repo.get_context, evaluation_id)
+            if not context:
                 return {
                     "success": False,
                     "message": "❌ Değerlendirme bulunamadı."
                 }
+            evaluation = context.evaluation
 
             # GitHub URL formatını kontrol et
             if not self._is_valid_github_url(github_url):
@@ -1097,14 +1253,14 @@ class ChallengeEvaluationService:
             is_public = await self.check_github_repo_public(github_url)
 
             # Linki kaydet
-            self.evaluation_repo.update(evaluation_id, {
+            await self._db(self.evaluation_repo.update, evaluation_id, {
                 "github_repo_url": github_url,
                 "github_repo_public": 1 if is_public else 0
             })
 
             # Eğer repo public ve 3 kişi oy verdiyse admin onayı iste
             if is_public:
-                votes = self.evaluator_repo.get_votes(evaluation_id)
+                votes = {"true": context.true_votes, "false": context.false_votes}
                 total_votes = votes["true"] + votes["false"]
                 
                 if total_votes >= 3:
@@ -1117,46 +1273,9 @@ class ChallengeEvaluationService:
                             self.chat.post_message(
                                 channel=eval_channel_id,
                                 text="✅ GitHub public! Admin onayı bekleniyor...",
-                                blocks=[
-                                    {
-                                        "type": "section",
-                                        "text": {
-                                            "type": "mrkdwn",
-                                            "text": (
-                                                f"✅ *GitHub Public!*\n"
-                                                f"📊 Oylar: ✅{votes['true']} ❌{votes['false']} | 🔗 {github_url}\n\n"
-                                                "👤 Admin onayı bekleniyor..."
-                                            )
-                                        }
-                                    },
-                                    {
-                                        "type": "actions",
-                                        "elements": [
-                                            {
-                                                "type": "button",
-                                                "text": {
-                                                    "type": "plain_text",
-                                                    "text": "✅ Onayla ve Bitir",
-                                                    "emoji": True
-                                                },
-                                                "style": "primary",
-                                                "action_id": "admin_approve_evaluation",
-                                                "value": evaluation_id
-                                            },
-                                            {
-                                                "type": "button",
-                                                "text": {
-                                                    "type": "plain_text",
-                                                    "text": "❌ Reddet ve Bitir",
-                                                    "emoji": True
-                                                },
-                                                "style": "danger",
-                                                "action_id": "admin_reject_evaluation",
-                                                "value": evaluation_id
-                                            }
-                                        ]
-                                    }
-                                ]
+                                blocks=_build_admin_approve_blocks(
+                                    "GitHub Public!", votes["true"], votes["false"], github_url, evaluation_id
+                                )
                             )
                             logger.info(f"[i] Admin onay butonu gönderildi | Evaluation: {evaluation_id}")
                         except Exception as e:
@@ -1187,22 +1306,59 @@ class ChallengeEvaluationService:
     async def check_github_repo_public(self, github_url: str) -> bool:
         """GitHub repo'nun public olup olmadığını kontrol eder."""
         try:
-            # GitHub URL'ini parse et
-            # https://github.com/user/repo -> https://api.github.com/repos/user/repo
-            match = re.match(r'https?://github\.com/([^/]+)/([^/]+)', github_url)
+            # GitHub URL'ini parse et (https://github.com/user/repo)
+            match = _GITHUB_REPO_PREFIX_RE.match(github_url)
             if not match:
                 return False
 
             user, repo = match.groups()
-            api_url = f"https://api.github.com/repos/{user}/{repo}"
-
-            # API'ye istek at
-            response = requests.get(api_url, timeout=5)
+            # GitHub sahip/repo adları büyük-küçük harf duyarsızdır; aynı repo tek anahtarda toplanır
+            cache_key = (user.lower(), repo.lower())
+
+            # Sadece public sonucu önbelleğe alınır; repo'yu public yapıp linki
+            # hemen yeniden gönderen kullanıcı eski 'private' sonucuna takılmaz
+            if _github_public_cache.get(cache_key):
+                return True
+
+            # Önce web sayfasına HEAD: kimliksiz istekte public 200, private/yok 404 döner.
+            # REST API kotasını (saatte 60 istek) harcamaz; yeniden adlandırılmış repolar 301 ile yönlenir
+            response = await asyncio.to_thread(
+                _github_session.head,
+                f"https://github.com/{user}/{repo}",
+                headers={"Accept": "text/html"},
+                timeout=GITHUB_API_TIMEOUT_SECONDS,
+                allow_redirects=True
+            )
             if response.status_code == 200:
-                data = response.json()
-                return not data.get("private", True)
+                _github_public_cache.set(cache_key, True)
+                return True
+            if response.status_code == 404:
+                _github_etags.pop(cache_key)
+                return False
+
+            # Belirsiz yanıt (429, 5xx...): REST API ile kontrol edilir
+            logger.debug(f"[i] GitHub web kontrolü belirsiz ({response.status_code}), API'ye düşülüyor: {user}/{repo}")
+            # Daha önce public görülen repo için koşullu istek (değişmediyse 304 döner)
+            etag = _github_etags.get(cache_key)
+            headers = {"If-None-Match": etag} if etag else None
+
+            # Kimliksiz istekte private repo 404 döner; 200/304 ise repo public'tir, gövdeye gerek yok
+            response = await asyncio.to_thread(
+                _github_session.head,
+                f"https://api.github.com/repos/{user}/{repo}",
+                headers=headers,
+                timeout=GITHUB_API_TIMEOUT_SECONDS,
+                allow_redirects=True  # Yeniden adlandırılmış repolar 301 döner
+            )
+            if response.status_code in (200, 304):
+                new_etag = response.headers.get("ETag")
+                if new_etag:
+                    _github_etags.set(cache_key, new_etag)
+                _github_public_cache.set(cache_key, True)
+                return True
             elif response.status_code == 404:
                 # Repo bulunamadı veya private
+                _github_etags.pop(cache_key)
                 return False
             else:
                 logger.warning(f"[!] GitHub API hatası: {response.status_code}")
@@ -1214,8 +1370,7 @@ class ChallengeEvaluationService:
 
     def _is_valid_github_url(self, url: str) -> bool:
         """GitHub URL formatını kontrol eder."""
-        pattern = r'^https?://github\.com/[^/]+/[^/]+/?$'
-        return bool(re.match(pattern, url))
+        return _GITHUB_REPO_URL_RE.fullmatch(url) is not None
 
     async def admin_finalize_evaluation(
         self,
@@ -1228,12 +1383,9 @@ class ChallengeEvaluationService:
         Sadece admin (admin_slack_id) veya workspace owner çağırabilir.
         """
         try:
-            settings = get_settings()
-            ADMIN_USER_ID = settings.admin_slack_id
-            
             # Admin kontrolü: admin_slack_id veya workspace owner
             is_admin = False
-            if ADMIN_USER_ID and admin_user_id == ADMIN_USER_ID:
+            if self._admin_id and admin_user_id == self._admin_id:
                 is_admin = True
                 logger.debug(f"[i] Admin kontrolü: admin_slack_id eşleşti | User: {admin_user_id}")
             else:
@@ -1253,13 +1405,13 @@ class ChallengeEvaluationService:
                     logger.warning(f"[!] Workspace owner kontrolü yapılamadı: {e}")
             
             if not is_admin:
-                logger.warning(f"[!] Admin yetkisi reddedildi | User: {admin_user_id} | Admin ID: {ADMIN_USER_ID}")
+                logger.warning(f"[!] Admin yetkisi reddedildi | User: {admin_user_id} | Admin ID: {self._admin_id}")
                 return {
                     "success": False,
                     "message": "❌ Sadece admin (workspace owner) bu işlemi yapabilir."
                 }
             
-            evaluation = self.evaluation_repo.get(evaluation_id)
+            evaluation = await self._db(self.evaluation_repo.get, evaluation_id)
             if not evaluation:
                 return {
                     "success": False,
@@ -1273,14 +1425,22 @@ class ChallengeEvaluationService:
                 }
             
             # Admin onayını kaydet
-            self.evaluation_repo.update(evaluation_id, {
+            await self._db(self.evaluation_repo.update, evaluation_id, {
                 "admin_approval": approval
             })
             
             logger.info(f"[+] Admin onayı: {approval} | Evaluation: {evaluation_id} | Admin: {admin_user_id}")
             
-            # Değerlendirmeyi finalize et
-            await self.finalize_evaluation(evaluation_id, admin_approval=approval)
+            # Karar ve tamamlanma (DB aşaması) yanıt verilmeden yazılır; admin'e gerçek sonuç bildirilir
+            outcome = await self._complete_evaluation(evaluation_id, admin_approval=approval)
+            if not outcome:
+                return {
+                    "success": False,
+                    "message": "⚠️ Değerlendirme tamamlanamadı: henüz başlamamış veya başka bir işlem tarafından tamamlanmış."
+                }
+            
+            # Slack mesajları, canvas ve arşiv planı arka planda yürür; yanıt bunları beklemez
+            self._spawn_background(self._announce_finalize(outcome))
             
             if approval == "approved":
                 return {
@@ -1300,213 +1460,280 @@ class ChallengeEvaluationService:
                 "message": "❌ Admin onayı kaydedilirken bir hata oluştu."
             }
 
+    def reschedule_finalize_jobs(self) -> int:
+        """
+        Devam eden değerlendirmelerin finalize job'larını DB'deki deadline'lardan yeniden kurar.
+        Zamanlayıcı bellekte tutulduğu için yeniden başlatmada kaybolan job'lar böylece geri gelir;
+        deadline'ı geçmiş olanlar hemen çalışacak şekilde planlanır.
+        """
+        now = datetime.now()
+        scheduled = 0
+        for evaluation in self.evaluation_repo.get_open_evaluation_deadlines():
+            try:
+                deadline = datetime.fromisoformat(evaluation["deadline_at"])
+                self.cron.add_once_job(
+                    func=self.finalize_evaluation,
+                    run_date=max(deadline, now + timedelta(seconds=5)),
+                    job_id=f"finalize_evaluation_{evaluation['id']}",
+                    args=[evaluation["id"]]
+                )
+                scheduled += 1
+            except Exception as e:
+                logger.warning(f"[!] Finalize job'ı yeniden kurulamadı: {evaluation['id']} | {e}")
+        return scheduled
+
     async def finalize_evaluation(self, evaluation_id: str, admin_approval: str = None):
         """48 saat sonunda değerlendirmeyi finalize eder."""
         try:
-            evaluation = self.evaluation_repo.get(evaluation_id)
-            if not evaluation:
-                logger.error(f"[X] Finalize: Değerlendirme bulunamadı: {evaluation_id}")
-                return
-
-            if evaluation.get("status") != "evaluating":
-                logger.warning(f"[!] Finalize: Değerlendirme zaten tamamlanmış: {evaluation_id}")
-                return
-
-            # Oyları al
-            votes = self.evaluator_repo.get_votes(evaluation_id)
-            true_votes = votes["true"]
-            false_votes = votes["false"]
-
-            # Sonucu hesapla
-            github_public = evaluation.get("github_repo_public", 0) == 1
-            github_url = evaluation.get("github_repo_url")
-
-            # Admin reddetmişse otomatik olarak başarısız
-            if admin_approval == "rejected":
-                final_result = "failed"
-                result_message = "❌ *Challenge Başarısız*\n\n*Nedenler:*\n• Admin tarafından reddedildi"
-            elif true_votes > false_votes and github_public and github_url:
-                final_result = "success"
-                result_message = "🎉 *Challenge Başarılı!*"
-            else:
-                final_result = "failed"
-                reasons = []
-                if true_votes <= false_votes:
-                    reasons.append(f"True oyları ({true_votes}) False oylarından ({false_votes}) fazla değil")
-                if not github_url:
-                    reasons.append("GitHub repo linki eklenmemiş")
-                elif not github_public:
-                    reasons.append("GitHub repo public değil")
-                result_message = f"❌ *Challenge Başarısız*\n\n*Nedenler:*\n" + "\n".join(f"• {r}" for r in reasons)
-
-            # Değerlendirmeyi güncelle
-            self.evaluation_repo.update(evaluation_id, {
-                "status": "completed",
-                "final_result": final_result,
-                "completed_at": datetime.now().isoformat()
-            })
+            outcome = await self._complete_evaluation(evaluation_id, admin_approval)
+            if outcome:
+                await self._announce_finalize(outcome)
+        except Exception as e:
+            logger.error(f"[X] Değerlendirme finalize hatası: {e}", exc_info=True)
 
-            # Challenge'ı güncelle
-            challenge_id = evaluation["challenge_hub_id"]
-            challenge = self.hub_repo.get(challenge_id)
-            if challenge:
-                # Challenge'ın status'unu güncelle (değerlendirme tamamlandı)
-                self.hub_repo.update(challenge_id, {
-                    "status": "completed",
-                    "completed_at": datetime.now().isoformat()
-                })
-                logger.info(f"[+] Challenge status güncellendi: {challenge_id} | Status: completed")
-                
-                logger.info(f"[+] Challenge status güncellendi: {challenge_id} | Status: completed")
-                
-                # Başarı durumunda istatistikleri ve puanları güncelle
-                if final_result == "success":
-                    try:
-                        # Puan miktarı (varsayılan: 100)
-                        POINTS_PER_SUCCESS = 100
-                        
-                        # Katılımcıları al
-                        participants = self.participant_repo.get_team_members(challenge_id)
-                        participant_ids = [p["user_id"] for p in participants]
-                        
-                        # Owner'ı al (eğer katılımcılar arasında değilse ekle)
-                        creator_id = challenge.get("creator_id")
-                        if creator_id and creator_id not in participant_ids:
-                            participant_ids.append(creator_id)
-                        
-                        # Herkese puan ver ve başarı sayısını artır
-                        for user_id in participant_ids:
-                            self.stats_repo.add_points(user_id, POINTS_PER_SUCCESS)
-                            self.stats_repo.increment_completed(user_id)
-                            logger.info(f"[+] Puan ve başarı güncellendi: {user_id} | Challenge: {challenge_id}")
-                            
-                    except Exception as e:
-                        logger.error(f"[X] Başarı istatistikleri güncellenirken hata: {e}", exc_info=True)
+    async def _complete_evaluation(
+        self,
+        evaluation_id: str,
+        admin_approval: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Finalize'ın DB aşaması: sonucu hesaplar ve değerlendirmeyi tamamlar.
+        Değerlendirme bulunamazsa, "evaluating" durumunda değilse veya başka bir finalize önce
+        davrandıysa None döner; DB hataları çağırana iletilir.
+        Dönen sözlük Slack aşamasının (_announce_finalize) ihtiyaç duyduğu bilgileri taşır.
+        """
+        evaluation = await self._db(self.evaluation_repo.get, evaluation_id)
+        if not evaluation:
+            logger.error(f"[X] Finalize: Değerlendirme bulunamadı: {evaluation_id}")
+            return None
+
+        # Ucuz ön kontrol; asıl koruma complete() içindeki koşullu UPDATE'tir
+        if evaluation.get("status") != "evaluating":
+            logger.warning(f"[!] Finalize: Değerlendirme 'evaluating' durumunda değil ({evaluation.get('status')}): {evaluation_id}")
+            return None
+
+        # Oyları al (record_vote ile güncel tutulan sayaçlar)
+        true_votes = evaluation.get("true_votes") or 0
+        false_votes = evaluation.get("false_votes") or 0
+
+        # Sonucu hesapla
+        github_public = evaluation.get("github_repo_public", 0) == 1
+        github_url = evaluation.get("github_repo_url")
+
+        # Admin reddetmişse otomatik olarak başarısız
+        if admin_approval == "rejected":
+            final_result = "failed"
+            result_message = "❌ *Challenge Başarısız*\n\n*Nedenler:*\n• Admin tarafından reddedildi"
+        elif true_votes > false_votes and github_public and github_url:
+            final_result = "success"
+            result_message = "🎉 *Challenge Başarılı!*"
+        else:
+            final_result = "failed"
+            # Link yoksa "private" nedeni ayrıca yazılmaz
+            code = ((true_votes <= false_votes) << 2) | ((not github_url) << 1) | (bool(github_url) and not github_public)
+            result_message = _FAIL_MESSAGES[code]
+            if code & 4:
+                result_message = result_message.format(true_votes=true_votes, false_votes=false_votes)
+
+        # Değerlendirme, challenge durumu ve (başarıda) ekip puanları tek transaction'da yazılır;
+        # güncellenen challenge kaydı aynı çağrıdan döner
+        # Tamamlanma zamanı ve mesajlardaki kapanma saatleri tek "şimdi"den türetilir
+        now = datetime.now()
+        challenge_id = evaluation["challenge_hub_id"]
+        # Yalnızca hâlâ "evaluating" ise tamamlanır: admin onayı ile zamanlanmış job aynı anda
+        # çalışırsa ikincisi burada durur (çift puan / çift Slack mesajı oluşmaz)
+        completed = await self._db(
+            self.evaluation_repo.complete,
+            evaluation_id, challenge_id, final_result,
+            award_points=POINTS_PER_SUCCESS if final_result == "success" else 0,
+            completed_at=now.isoformat(),
+            expected_status="evaluating"
+        )
+        if completed is None:
+            logger.warning(f"[!] Finalize: Değerlendirme başka bir işlem tarafından tamamlandı: {evaluation_id}")
+            return None
+        challenge, awarded_user_ids = completed
+        await self._db(self.hub_repo.invalidate, challenge_id)
+        if awarded_user_ids:
+            logger.info(f"[+] Puan ve başarı güncellendi: {', '.join(awarded_user_ids)} | Challenge: {challenge_id}")
+
+        logger.info(f"[+] Değerlendirme tamamlandı: {evaluation_id} | Sonuç: {final_result}")
+        return {
+            "evaluation": evaluation,
+            "challenge": challenge,
+            "challenge_id": challenge_id,
+            "final_result": final_result,
+            "result_message": result_message,
+            "true_votes": true_votes,
+            "false_votes": false_votes,
+            "github_public": github_public,
+            "admin_approval": admin_approval,
+            "now": now
+        }
+
+    async def _announce_finalize(self, outcome: Dict[str, Any]):
+        """
+        Finalize'ın Slack aşaması: sonuç mesajları, değerlendirme kanalı kapanışı (arşiv planı) ve canvas.
+        Birbirinden bağımsız oldukları için paralel yürür; tek tek hatalar loglanır.
+        """
+        evaluation = outcome["evaluation"]
+        evaluation_id = evaluation["id"]
+        challenge = outcome["challenge"]
+        challenge_id = outcome["challenge_id"]
+        result_message = outcome["result_message"]
+        true_votes = outcome["true_votes"]
+        false_votes = outcome["false_votes"]
+        github_public = outcome["github_public"]
+        admin_approval = outcome["admin_approval"]
+        now = outcome["now"]
+
+        # Slack mesajları ve canvas birbirinden bağımsız; sırayla değil paralel gönderilir
+        # (başarı logu, çağrı, hata logu)
+        posts: List[Tuple[str, Any, str]] = []
+
+        if challenge:
+            logger.info(f"[+] Challenge status güncellendi: {challenge_id} | Status: completed")
+
+            # Sonuç mesajını hem challenge kanalına hem ana kanala gönder
+            votes_context = {
+                "type": "context",
+                "elements": [
+                    {
+                        "type": "mrkdwn",
+                        "text": f"📊 Oylar: True={true_votes}, False={false_votes} | GitHub: {'✅ Public' if github_public else '❌ Private/Missing'}"
+                    }
+                ]
+            }
+            result_blocks = [
+                {
+                    "type": "section",
+                    "text": {
+                        "type": "mrkdwn",
+                        "text": result_message
+                    }
+                },
+                votes_context
+            ]
 
-                # Sonuç mesajını hem challenge kanalına hem ana kanala gönder
-                result_blocks = [
+            # Ana kanala (hub_channel_id) sonuç mesajı gönder
+            hub_channel_id = challenge.get("hub_channel_id")
+            if hub_channel_id:
+                posts.append((
+                    f"[+] Değerlendirme sonucu ana kanala gönderildi: {hub_channel_id}",
+                    asyncio.to_thread(
+                        self.chat.post_message,
+                        channel=hub_channel_id,
+                        text=result_message,
+                        blocks=result_blocks
+                    ),
+                    "[!] Ana kanala sonuç mesajı gönderilemedi"
+                ))
+
+            # Challenge kanalına da gönder (kanal arşivlenmiş olabilir, hata kontrolü yap)
+            challenge_channel_id = challenge.get("challenge_channel_id")
+            if challenge_channel_id:
+                # Admin onay/red bilgisi ekle
+                admin_decision_text = ""
+                if admin_approval == "approved":
+                    admin_decision_text = "\n\n👤 *Admin Kararı:* ✅ Onaylandı"
+                elif admin_approval == "rejected":
+                    admin_decision_text = "\n\n👤 *Admin Kararı:* ❌ Reddedildi"
+
+                # Kanal kapanma zamanını hesapla (3 saat sonra)
+                close_time = (now + timedelta(hours=3)).strftime("%d/%m/%Y %H:%M")
+
+                # İlk section'a admin kararı eklenir (ana kanal mesajının bloğu paylaşılmaz)
+                challenge_result_blocks = [
                     {
                         "type": "section",
                         "text": {
                             "type": "mrkdwn",
-                            "text": result_message
+                            "text": result_message + admin_decision_text
                         }
                     },
+                    votes_context,
                     {
-                        "type": "context",
-                        "elements": [
-                            {
-                                "type": "mrkdwn",
-                                "text": f"📊 Oylar: True={true_votes}, False={false_votes} | GitHub: {'✅ Public' if github_public else '❌ Private/Missing'}"
-                            }
-                        ]
+                        "type": "divider"
+                    },
+                    {
+                        "type": "section",
+                        "text": {
+                            "type": "mrkdwn",
+                            "text": (
+                                f"⏳ *Önemli Bilgilendirme:*\n"
+                                f"Bu kanal *{close_time}*'de (3 saat sonra) otomatik olarak arşivlenecektir.\n"
+                                f"Lütfen önemli mesajlarınızı bu süre içinde kontrol edin. 📋"
+                            )
+                        }
                     }
                 ]
-                
-                # Ana kanala (hub_channel_id) sonuç mesajı gönder
-                hub_channel_id = challenge.get("hub_channel_id")
-                if hub_channel_id:
-                    try:
-                        self.chat.post_message(
-                            channel=hub_channel_id,
-                            text=result_message,
-                            blocks=result_blocks
-                        )
-                        logger.info(f"[+] Değerlendirme sonucu ana kanala gönderildi: {hub_channel_id}")
-                    except Exception as e:
-                        logger.warning(f"[!] Ana kanala sonuç mesajı gönderilemedi: {e}")
-                
-                # Challenge kanalına da gönder (kanal arşivlenmiş olabilir, hata kontrolü yap)
-                challenge_channel_id = challenge.get("challenge_channel_id")
-                if challenge_channel_id:
-                    try:
-                        # Admin onay/red bilgisi ekle
-                        admin_decision_text = ""
-                        if admin_approval == "approved":
-                            admin_decision_text = "\n\n👤 *Admin Kararı:* ✅ Onaylandı"
-                        elif admin_approval == "rejected":
-                            admin_decision_text = "\n\n👤 *Admin Kararı:* ❌ Reddedildi"
-                        
-                        # Kanal kapanma zamanını hesapla (3 saat sonra)
-                        close_time = (datetime.now() + timedelta(hours=3)).strftime("%d/%m/%Y %H:%M")
-                        
-                        challenge_result_blocks = result_blocks + [
-                            {
-                                "type": "divider"
-                            },
-                            {
-                                "type": "section",
-                                "text": {
-                                    "type": "mrkdwn",
-                                    "text": (
-                                        f"⏳ *Önemli Bilgilendirme:*\n"
-                                        f"Bu kanal *{close_time}*'de (3 saat sonra) otomatik olarak arşivlenecektir.\n"
-                                        f"Lütfen önemli mesajlarınızı bu süre içinde kontrol edin. 📋"
-                                    )
-                                }
-                            }
-                        ]
-                        
-                        # İlk section'a admin kararını ekle
-                        if admin_decision_text:
-                            challenge_result_blocks[0]["text"]["text"] += admin_decision_text
-                        
-                        self.chat.post_message(
-                            channel=challenge_channel_id,
-                            text=result_message,
-                            blocks=challenge_result_blocks
-                        )
-                        logger.info(f"[+] Challenge kanalına sonuç mesajı gönderildi: {challenge_channel_id}")
-                    except Exception as e:
-                        logger.warning(f"[!] Challenge kanalına sonuç mesajı gönderilemedi (kanal arşivlenmiş olabilir): {e}")
-            # Değerlendirme kanalına bitiş mesajı gönder ve 1 saat sonra kapat
-            eval_channel_id = evaluation.get("evaluation_channel_id")
-            if eval_channel_id:
-                try:
-                    # Kapanma saatini hesapla
-                    close_time = (datetime.now() + timedelta(hours=1)).strftime("%H:%M")
-
-                    self.chat.post_message(
-                        channel=eval_channel_id,
-                        text="🏁 *Değerlendirme Tamamlandı!*",
-                        blocks=[
-                            {
-                                "type": "section",
-                                "text": {
-                                    "type": "mrkdwn",
-                                    "text": (
-                                        f"🏁 *Değerlendirme süreci sona erdi.*\n\n"
-                                        f"Sonuçları yukarıdaki mesajdan veya ana kanaldan takip edebilirsiniz.\n\n"
-                                        f"⏳ *Önemli:* Bu kanal saat *{close_time}*'de (1 saat sonra) otomatik olarak arşivlenecektir. Bu süre zarfında mesajları kontrol edebilirsiniz. 👋"
-                                    )
-                                }
-                            }
-                        ]
-                    )
-
-                    # Kanalı 1 saat sonra arşivlemek üzere planla
-                    delay_hours = 1
-                    self.cron.add_once_job(
-                        func=self._archive_channel_delayed,
-                        delay_minutes=delay_hours * 60,
-                        job_id=f"archive_evaluation_{evaluation_id}",
-                        args=[evaluation_id, eval_channel_id]
-                    )
-                    logger.info(f"[+] Değerlendirme kanalı 1 saat sonra arşivlenmek üzere planlandı (Saat: {close_time}) | ID: {evaluation_id}")
-                except Exception as e:
-                    logger.warning(f"[!] Değerlendirme kanalı mesaj gönderimi veya arşivleme planı hatası: {e}")
+                posts.append((
+                    f"[+] Challenge kanalına sonuç mesajı gönderildi: {challenge_channel_id}",
+                    asyncio.to_thread(
+                        self.chat.post_message,
+                        channel=challenge_channel_id,
+                        text=result_message,
+                        blocks=challenge_result_blocks
+                    ),
+                    "[!] Challenge kanalına sonuç mesajı gönderilemedi (kanal arşivlenmiş olabilir)"
+                ))
+
+        # Değerlendirme kanalına bitiş mesajı gönder ve 1 saat sonra kapat
+        eval_channel_id = evaluation.get("evaluation_channel_id")
+        if eval_channel_id:
+            # Kapanma saatini hesapla
+            eval_close_time = (now + timedelta(hours=1)).strftime("%H:%M")
+            posts.append((
+                f"[+] Değerlendirme kanalı 1 saat sonra arşivlenmek üzere planlandı (Saat: {eval_close_time}) | ID: {evaluation_id}",
+                asyncio.to_thread(self._post_eval_closing, evaluation_id, eval_channel_id, eval_close_time),
+                "[!] Değerlendirme kanalı mesaj gönderimi veya arşivleme planı hatası"
+            ))
+
+        # Canvas'ı güncelle (admin onayı/reddi sonrası oylar ve GitHub bilgileri görünsün);
+        # mesajlara bağlı değil, DB yazımından sonra onlarla birlikte paralel çalışır
+        posts.append((
+            f"[+] Canvas güncellendi (admin finalize sonrası): {evaluation_id}",
+            self.update_challenge_canvas(challenge_id),
+            "[!] Admin finalize sonrası canvas güncellenemedi"
+        ))
+
+        results = await asyncio.gather(*(call for _, call, _ in posts), return_exceptions=True)
+        for (success_log, _, error_log), result in zip(posts, results):
+            if isinstance(result, Exception):
+                logger.warning(f"{error_log}: {result}")
+            else:
+                logger.info(success_log)
 
-            # Canvas'ı güncelle (admin onayı/reddi sonrası oylar ve GitHub bilgileri görünsün)
-            try:
-                await self.update_challenge_canvas(challenge_id)
-                logger.info(f"[+] Canvas güncellendi (admin finalize sonrası): {evaluation_id}")
-            except Exception as e:
-                logger.warning(f"[!] Admin finalize sonrası canvas güncellenemedi: {e}")
+        logger.info(f"[+] Değerlendirme finalize edildi: {evaluation_id} | Sonuç: {outcome['final_result']}")
 
-            logger.info(f"[+] Değerlendirme finalize edildi: {evaluation_id} | Sonuç: {final_result}")
+    def _post_eval_closing(self, evaluation_id: str, eval_channel_id: str, close_time: str):
+        """Değerlendirme kanalına bitiş mesajını gönderir ve kanalı 1 saat sonra arşivlemek üzere planlar."""
+        self.chat.post_message(
+            channel=eval_channel_id,
+            text="🏁 *Değerlendirme Tamamlandı!*",
+            blocks=[
+                {
+                    "type": "section",
+                    "text": {
+                        "type": "mrkdwn",
+                        "text": (
+                            f"🏁 *Değerlendirme süreci sona erdi.*\n\n"
+                            f"Sonuçları yukarıdaki mesajdan veya ana kanaldan takip edebilirsiniz.\n\n"
+                            f"⏳ *Önemli:* Bu kanal saat *{close_time}*'de (1 saat sonra) otomatik olarak arşivlenecektir. Bu süre zarfında mesajları kontrol edebilirsiniz. 👋"
+                        )
+                    }
+                }
+            ]
+        )
 
-        except Exception as e:
-            logger.error(f"[X] Değerlendirme finalize hatası: {e}", exc_info=True)
+        # Kanalı 1 saat sonra arşivlemek üzere planla
+        delay_hours = 1
+        self.cron.add_once_job(
+            func=self._archive_channel_delayed,
+            delay_minutes=delay_hours * 60,
+            job_id=f"archive_evaluation_{evaluation_id}",
+            args=[evaluation_id, eval_channel_id]
+        )
 
     def _archive_channel_delayed(self, evaluation_id: str, channel_id: str):
         """Kanalı gecikmeli olarak arşivler (Cron tarafından çağrılır)."""
@@ -1526,13 +1753,10 @@ class ChallengeEvaluationService:
         """
         try:
             # Yetki kontrolü
-            settings = get_settings()
-            ADMIN_USER_ID = settings.admin_slack_id
-            
-            if admin_user_id != ADMIN_USER_ID:
+            if admin_user_id != self._admin_id:
                 return {"success": False, "message": "❌ Yetkisiz işlem."}
 
-            evaluation = self.evaluation_repo.get(evaluation_id)
+            evaluation = await self._db(self.evaluation_repo.get, evaluation_id)
             if not evaluation:
                 return {"success": False, "message": "❌ Değerlendirme bulunamadı."}
 
@@ -1546,45 +1770,24 @@ class ChallengeEvaluationService:
             else:
                 result_message = "❌ *Challenge Başarısız* (Yönetici Kararı)"
 
-            # DB güncelle
-            self.evaluation_repo.update(evaluation_id, {
-                "status": "completed",
-                "final_result": final_result,
-                "completed_at": datetime.now().isoformat()
-            })
-
-            self.hub_repo.update(
-                challenge_id,
-                {
-                    "status": "completed",
-                    "completed_at": datetime.now().isoformat(),
-                },
+            # DB güncelle (değerlendirme, challenge ve başarıda puanlar tek transaction'da)
+            now = datetime.now()
+            challenge, awarded_user_ids = await self._db(
+                self.evaluation_repo.complete,
+                evaluation_id, challenge_id, final_result,
+                award_points=POINTS_PER_SUCCESS if final_result == "success" else 0,
+                completed_at=now.isoformat()
             )
-
-            # Başarı durumunda istatistikleri ve puanları güncelle (Force Complete için de)
-            if final_result == "success":
-                try:
-                    POINTS_PER_SUCCESS = 100
-                    challenge = self.hub_repo.get(challenge_id)
-                    participants = self.participant_repo.get_team_members(challenge_id)
-                    participant_ids = [p["user_id"] for p in participants]
-                    creator_id = challenge.get("creator_id") if challenge else None
-                    if creator_id and creator_id not in participant_ids:
-                        participant_ids.append(creator_id)
-
-                    for user_id in participant_ids:
-                        self.stats_repo.add_points(user_id, POINTS_PER_SUCCESS)
-                        self.stats_repo.increment_completed(user_id)
-                        logger.info(f"[+] Force success: Puan ve başarı güncellendi: {user_id}")
-                except Exception as e:
-                    logger.error(f"[X] Force success istatistikleri güncellenirken hata: {e}")
+            await self._db(self.hub_repo.invalidate, challenge_id)
+            if awarded_user_ids:
+                logger.info(f"[+] Force success: Puan ve başarı güncellendi: {', '.join(awarded_user_ids)}")
 
             # Bildirim gönder (hem evaluation hem challenge kanallarına)
             eval_channel_id = evaluation.get("evaluation_channel_id")
             if eval_channel_id:
                 try:
                     # Kapanma saatini hesapla
-                    close_time = (datetime.now() + timedelta(hours=1)).strftime("%H:%M")
+                    close_time = (now + timedelta(hours=1)).strftime("%H:%M")
                     
                     self.chat.post_message(
                         channel=eval_channel_id,
@@ -1616,13 +1819,12 @@ class ChallengeEvaluationService:
                     logger.warning(f"[!] Force complete mesaj/arşiv planlama hatası: {e}")
             
             # Challenge kanalına da bilgilendirme mesajı gönder
-            challenge = self.hub_repo.get(challenge_id)
             if challenge:
                 challenge_channel_id = challenge.get("challenge_channel_id")
                 if challenge_channel_id:
                     try:
                         # Challenge kanalı kapanma zamanı (3 saat sonra)
-                        challenge_close_time = (datetime.now() + timedelta(hours=3)).strftime("%d/%m/%Y %H:%M")
+                        challenge_close_time = (now + timedelta(hours=3)).strftime("%d/%m/%Y %H:%M")
                         
                         self.chat.post_message(
                             channel=challenge_channel_id,
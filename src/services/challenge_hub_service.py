@@ -2,13 +2,16 @@
 Challenge Hub yönetim servisi.
 """
 
+import asyncio
 import json
 import uuid
 import random
+import threading
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 from src.core.logger import logger
 from src.core.exceptions import CemilBotError
+from src.core.ttl_cache import TTLCache
 from src.commands import ChatManager, ConversationManager, UserManager
 from src.repositories import (
     ChallengeHubRepository,
@@ -22,6 +25,10 @@ from src.clients import GroqClient, CronClient
 from src.core.settings import get_settings
 from src.services import ChallengeEnhancementService
 
+# Yetkili kanal katılımı kararlarının önbellek ayarları
+AUTHORIZED_CACHE_SIZE = 10_000
+AUTHORIZED_CACHE_TTL_SECONDS = 60
+
 
 class ChallengeHubService:
     """
@@ -59,6 +66,13 @@ class ChallengeHubService:
         self.cron = cron_client
         self.db_client = db_client
         self.evaluation_service = evaluation_service
+        # Kanal üyeliği anlık görüntüleri (monitor_challenge_channels için): channel_id -> üye kümesi
+        self._last_members: Dict[str, frozenset] = {}
+        # Cron thread'i ve _start_challenge (to_thread) kontrolü aynı anda tetikleyebilir
+        self._monitor_lock = threading.Lock()
+        self._service_user_ids: Optional[frozenset] = None
+        # Yetkili katılım kararları: (channel_id, user_id) -> sonuç (60 sn)
+        self._authorized_cache = TTLCache(maxsize=AUTHORIZED_CACHE_SIZE, ttl=AUTHORIZED_CACHE_TTL_SECONDS)
 
     async def start_challenge(
         self,
@@ -399,7 +413,6 @@ class ChallengeHubService:
 
             # 7. Katılımcı ekle
             self.participant_repo.create({
-                "id": str(uuid.uuid4()),
                 "challenge_hub_id": challenge_id,
                 "user_id": user_id,
                 "role": "member"
@@ -685,7 +698,6 @@ class ChallengeHubService:
             for uid in team_member_ids:
                 try:
                     self.participant_repo.create({
-                        "id": str(uuid.uuid4()),
                         "challenge_hub_id": challenge_id,
                         "user_id": uid,
                         "role": "member"
@@ -833,11 +845,8 @@ class ChallengeHubService:
                 logger.warning(f"[!] Kullanıcılar kanala davet edilirken hata (devam ediliyor): {e}")
 
             # 6. Kanal topic ve purpose'unu ayarla (kullanıcılar davet edildikten sonra - kanal hazır olacak)
+            # Davet çağrısı Slack yanıtı (ok) alınınca döndüğü için ayrıca zamanlayıcıyla beklenmez
             try:
-                import time
-                # Kısa bir gecikme ekle (kanalın tam olarak hazır olması için)
-                time.sleep(1)
-                
                 topic_text = f"Challenge: {project.get('name', 'Proje')} | Süre: {deadline_hours} saat | ⚠️ Lütfen kanala başka kişileri davet etmeyin"
                 purpose_text = f"Challenge kanalı - {theme_name} teması | Takım: {challenge['team_size'] + 1} kişi | Bu kanal sadece challenge takımı için oluşturulmuştur. Lütfen kanala başka kişileri davet etmeyin."
                 
@@ -903,9 +912,10 @@ class ChallengeHubService:
 
             # 10. Challenge başlatıldıktan sonra hemen yetkisiz kullanıcı kontrolü yap
             try:
-                import time
-                time.sleep(5)  # Kullanıcıların kanala eklenmesi ve Slack'in senkronize olması için bekleme
-                self.monitor_challenge_channels()
+                # Kullanıcıların kanala eklenmesi ve Slack'in senkronize olması için bekleme (event loop bloklanmaz)
+                await asyncio.sleep(5)
+                # Tarama senkron Slack çağrıları ve bekleme içerir; thread'de çalışır
+                await asyncio.to_thread(self.monitor_challenge_channels)
                 logger.info(f"[+] Challenge kanalı kontrol edildi: {challenge_channel_id}")
             except Exception as e:
                 logger.warning(f"[!] Challenge kanalı kontrol edilemedi: {e}")
@@ -1436,6 +1446,12 @@ class ChallengeHubService:
         Challenge kanalına yetkisiz kullanıcı katıldığında çağrılır.
         Kullanıcı yetkisiz ise kanaldan çıkarır ve uyarı gönderir.
         """
+        # Yakın zamanda yetkili bulunan kullanıcının tekrar katılımı DB'ye gitmeden yanıtlanır
+        cache_key = (channel_id, user_id)
+        cached = self._authorized_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             # 1. Bu kanal bir challenge kanalı mı?
             challenge = self.hub_repo.get_by_channel_id(channel_id)
@@ -1456,32 +1472,17 @@ class ChallengeHubService:
             for participant in participants:
                 authorized_users.add(participant["user_id"])
             
-            # 3. Bot'u da ekle (bot her zaman kanalda olmalı)
-            try:
-                bot_info = self.chat.client.auth_test()
-                if bot_info["ok"]:
-                    bot_user_id = bot_info["user_id"]
-                    authorized_users.add(bot_user_id)
-            except Exception as e:
-                logger.warning(f"[!] Bot user ID alınamadı: {e}")
-            
-            # 4. User token sahibini ekle (workspace admin - kanalı oluşturan)
-            # User token sahibi kendisini çıkaramaz (cant_kick_self hatası)
-            try:
-                if self.conv.user_client:
-                    user_token_info = self.conv.user_client.auth_test()
-                    if user_token_info["ok"]:
-                        user_token_owner_id = user_token_info["user_id"]
-                        authorized_users.add(user_token_owner_id)
-                        logger.debug(f"[i] User token sahibi yetkili kullanıcılara eklendi: {user_token_owner_id}")
-            except Exception as e:
-                logger.warning(f"[!] User token sahibi bilgisi alınamadı: {e}")
+            # 3-4. Bot'u ve user token sahibini ekle (bot her zaman kanalda olmalı,
+            # user token sahibi kendisini çıkaramaz - cant_kick_self hatası)
+            authorized_users.update(self._get_service_user_ids())
             
             # 5. Kullanıcı yetkili mi?
             if user_id in authorized_users:
-                # Yetkili kullanıcı, işlem yapma
+                # Yetkili kullanıcı, işlem yapma (sadece olumlu kararlar önbelleğe alınır)
                 logger.debug(f"[i] Yetkili kullanıcı kanala katıldı: {user_id} | Challenge: {challenge['id']}")
-                return {"is_challenge_channel": True, "is_authorized": True, "action": "none"}
+                result = {"is_challenge_channel": True, "is_authorized": True, "action": "none"}
+                self._authorized_cache.set(cache_key, result)
+                return result
             
             # 6. Yetkisiz kullanıcı - kanaldan çıkar
             logger.warning(f"[!] Yetkisiz kullanıcı challenge kanalına katılmaya çalıştı: {user_id} | Challenge: {challenge['id']} | Kanal: {channel_id}")
@@ -1622,11 +1623,51 @@ class ChallengeHubService:
             logger.error(f"[X] Yetkisiz kullanıcı kontrolü hatası: {e}", exc_info=True)
             return {"is_challenge_channel": False, "action": "error", "error": str(e)}
 
+    def _get_service_user_ids(self) -> frozenset:
+        """
+        Bot ve user token sahibinin Slack ID'lerini döndürür.
+        auth_test sonuçları süreç boyunca değişmediği için bir kez alınıp saklanır.
+        """
+        if self._service_user_ids is None:
+            ids = set()
+            # Yapılandırılmış tüm client'lar yanıt verdiyse önbelleğe alınır; kısmi sonuç (ör. geçici 429)
+            # kalıcı olursa token sahibi yetkisiz sayılır ve her kontrolde çıkarılmaya çalışılır
+            complete = True
+            try:
+                bot_info = self.chat.client.auth_test()
+                if bot_info["ok"]:
+                    ids.add(bot_info["user_id"])
+                else:
+                    complete = False
+            except Exception as e:
+                complete = False
+                logger.warning(f"[!] Bot user ID alınamadı: {e}")
+            try:
+                if self.conv.user_client:
+                    user_token_info = self.conv.user_client.auth_test()
+                    if user_token_info["ok"]:
+                        ids.add(user_token_info["user_id"])
+                    else:
+                        complete = False
+            except Exception as e:
+                complete = False
+                logger.warning(f"[!] User token sahibi bilgisi alınamadı: {e}")
+            if not complete:
+                # Alınabilenler bu çağrıda kullanılır, bir sonraki çağrıda tekrar denenir
+                return frozenset(ids)
+            self._service_user_ids = frozenset(ids)
+        return self._service_user_ids
+
     def monitor_challenge_channels(self):
         """
         Tüm aktif challenge kanallarını periyodik olarak kontrol eder.
         Yetkisiz kullanıcıları tespit edip çıkarır.
         """
+        # _last_members üzerindeki okuma-fark-yazma adımları iç içe geçmesin diye kontroller sıralanır
+        with self._monitor_lock:
+            self._monitor_challenge_channels()
+
+    def _monitor_challenge_channels(self):
         try:
             # Aktif challenge'ları al
             active_challenges = self.hub_repo.get_all_active()
@@ -1636,50 +1677,41 @@ class ChallengeHubService:
                 return
             
             logger.info(f"[>] Challenge kanalları kontrol ediliyor: {len(active_challenges)} aktif challenge")
-            
+
+            # Artık aktif olmayan kanalların anlık görüntülerini bırak
+            active_channels = {c.get("challenge_channel_id") for c in active_challenges}
+            for stale_channel in set(self._last_members) - active_channels:
+                self._last_members.pop(stale_channel, None)
+
             for challenge in active_challenges:
                 channel_id = challenge.get("challenge_channel_id")
                 if not channel_id:
                     continue
                 
                 try:
-                    # Kanal üyelerini al
-                    channel_members = set(self.conv.get_members(channel_id))
+                    # Kanal üyelerini al ve sadece son kontrolden beri gelenlere bak
+                    channel_members = frozenset(self.conv.get_members(channel_id))
+                    new_members = channel_members - self._last_members.get(channel_id, frozenset())
                     
-                    # Yetkili kullanıcıları belirle
-                    authorized_users = set()
+                    if not new_members:
+                        self._last_members[channel_id] = channel_members
+                        logger.debug(f"[i] Challenge kanalında yeni üye yok: {challenge['id']} | Kanal: {channel_id}")
+                        continue
                     
-                    # Creator'ı ekle
+                    # Yetkili kullanıcıları belirle (creator, participants, bot ve user token sahibi)
+                    authorized_users = set(self._get_service_user_ids())
                     creator_id = challenge.get("creator_id")
                     if creator_id:
                         authorized_users.add(creator_id)
-                    
-                    # Participants'ları ekle
                     participants = self.participant_repo.get_team_members(challenge["id"])
                     for participant in participants:
                         authorized_users.add(participant["user_id"])
                     
-                    # Bot'u ekle
-                    try:
-                        bot_info = self.chat.client.auth_test()
-                        if bot_info["ok"]:
-                            bot_user_id = bot_info["user_id"]
-                            authorized_users.add(bot_user_id)
-                    except Exception:
-                        pass
-                    
-                    # User token sahibini ekle
-                    try:
-                        if self.conv.user_client:
-                            user_token_info = self.conv.user_client.auth_test()
-                            if user_token_info["ok"]:
-                                user_token_owner_id = user_token_info["user_id"]
-                                authorized_users.add(user_token_owner_id)
-                    except Exception:
-                        pass
+                    # Yetkisiz kullanıcıları bul (sadece yeni üyeler arasında)
+                    unauthorized_users = new_members - authorized_users
                     
-                    # Yetkisiz kullanıcıları bul
-                    unauthorized_users = channel_members - authorized_users
+                    # Çıkarılamayan kullanıcılar bir sonraki kontrolde tekrar denensin diye snapshot'a eklenmez
+                    self._last_members[channel_id] = channel_members - unauthorized_users
                     
                     if unauthorized_users:
                         logger.warning(f"[!] Yetkisiz kullanıcılar tespit edildi: {len(unauthorized_users)} kişi | Challenge: {challenge['id']} | Kanal: {channel_id}")
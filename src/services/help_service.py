@@ -110,7 +110,8 @@ class HelpService:
             logger.info(f"[>] Yardım isteği oluşturuldu | Kullanıcı: {requester_name} ({requester_id}) | Konu: {topic}")
             
             # 3. Yeni yardım kanalı oluştur
-            channel_name = f"yardim-{help_id[:8]}"
+            # ID'nin başı zaman damgasıdır (aynı dakikadaki istekler çakışır); rastgele son kısım kullanılır
+            channel_name = f"yardim-{help_id[-8:]}"
             try:
                 help_channel = self.conv.create_channel(
                     name=channel_name,
@@ -161,7 +162,7 @@ class HelpService:
                         "elements": [
                             {
                                 "type": "mrkdwn",
-                                "text": f"🆔 Yardım ID: `{help_id[:8]}...` | ⏰ Kanal 10 dakika sonra kapanacak"
+                                "text": f"🆔 Yardım ID: `...{help_id[-8:]}` | ⏰ Kanal 10 dakika sonra kapanacak"
                             }
                         ]
                     }
@@ -243,7 +244,7 @@ class HelpService:
                     "elements": [
                         {
                             "type": "mrkdwn",
-                            "text": f"🆔 ID: `{help_id[:8]}...` | 📅 {datetime.now().strftime('%d.%m.%Y %H:%M')} | ⏰ 10 dakika sonra kapanacak"
+                            "text": f"🆔 ID: `...{help_id[-8:]}` | 📅 {datetime.now().strftime('%d.%m.%Y %H:%M')} | ⏰ 10 dakika sonra kapanacak"
                         }
                     ]
                 }
@@ -453,7 +454,7 @@ class HelpService:
                 admin_msg = (
                     f"[!] *YARDIM KANALI ÖZETİ RAPORU*\n"
                     f"== Kanal: {help_channel_id}\n"
-                    f"== Yardım ID: {help_id[:8]}...\n"
+                    f"== Yardım ID: ...{help_id[-8:]}\n"
                     f"== Konu: {help_request['topic']}\n"
                     f"== İstek Sahibi: <@{help_request['requester_id']}>\n"
                 )
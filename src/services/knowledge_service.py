@@ -1,9 +1,7 @@
+import asyncio
 import os
-import pandas as pd
-from docx import Document
 from typing import List, Dict, Any
 from langchain_text_splitters import RecursiveCharacterTextSplitter
-from pypdf import PdfReader
 from src.core.logger import logger
 from src.clients import VectorClient, GroqClient
 
@@ -21,64 +19,81 @@ class KnowledgeService:
             chunk_overlap=200  # Overlap de artırıldı
         )
 
-    async def process_knowledge_base(self, folder_path: str = "knowledge_base"):
-        """Belirtilen klasördeki dökümanları okur ve indekse ekler."""
+    async def process_knowledge_base(self, folder_path: str = "knowledge_base", concurrency: int = 4):
+        """
+        Belirtilen klasördeki dökümanları okur ve indekse ekler.
+        Dosyalar en fazla `concurrency` kadar paralel thread'de okunur; embedding tek toplu çağrıda yapılır.
+        """
         if not os.path.exists(folder_path):
             os.makedirs(folder_path)
             logger.warning(f"[!] {folder_path} bulunamadı, boş bir tane oluşturuldu.")
             return
 
-        all_texts = []
-        all_metadata = []
+        semaphore = asyncio.Semaphore(max(1, concurrency))
 
-        for filename in os.listdir(folder_path):
-            file_path = os.path.join(folder_path, filename)
-            text = ""
-            
-            try:
-                # PDF İşleme
-                if filename.endswith(".pdf"):
-                    reader = PdfReader(file_path)
-                    for page in reader.pages:
-                        text += page.extract_text() + "\n"
-                
-                # TXT ve Markdown İşleme
-                elif filename.endswith((".txt", ".md")):
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        text = f.read()
-
-                # DOCX (Word) İşleme
-                elif filename.endswith(".docx"):
-                    doc = Document(file_path)
-                    text = "\n".join([para.text for para in doc.paragraphs])
-
-                # Excel ve CSV İşleme (Tablosal)
-                elif filename.endswith((".csv", ".xlsx", ".xls")):
-                    if filename.endswith(".csv"):
-                        df = pd.read_csv(file_path)
-                    else:
-                        df = pd.read_excel(file_path)
-                    
-                    # Her satırı bir metin parçasına dönüştür
-                    rows_text = []
-                    for idx, row in df.iterrows():
-                        row_str = ", ".join([f"{col}: {row[col]}" for col in df.columns])
-                        rows_text.append(row_str)
-                    text = "\n".join(rows_text)
-                
-                if text.strip():
-                    chunks = self.splitter.split_text(text)
-                    all_texts.extend(chunks)
-                    all_metadata.extend([{"source": filename}] * len(chunks))
-                    logger.info(f"[+] İşlendi: {filename} ({len(chunks)} parça)")
+        async def _read(filename: str) -> str:
+            async with semaphore:
+                return await asyncio.to_thread(self._extract_text, os.path.join(folder_path, filename), filename)
 
-            except Exception as e:
-                logger.error(f"[X] {filename} işlenirken hata: {e}")
+        filenames = os.listdir(folder_path)
+        # gather sonuçları dosya sırasını korur
+        texts = await asyncio.gather(*(_read(filename) for filename in filenames))
+
+        all_texts = []
+        all_metadata = []
+        for filename, text in zip(filenames, texts):
+            if text.strip():
+                chunks = self.splitter.split_text(text)
+                all_texts.extend(chunks)
+                all_metadata.extend([{"source": filename}] * len(chunks))
+                logger.info(f"[+] İşlendi: {filename} ({len(chunks)} parça)")
 
         if all_texts:
             self.vector.add_texts(all_texts, all_metadata)
             logger.info(f"[!] {len(all_texts)} parça ile Bilgi Küpü güncellendi.")
 
+    def _extract_text(self, file_path: str, filename: str) -> str:
+        """Tek bir dökümandan düz metin çıkarır; desteklenmeyen veya okunamayan dosyalar için boş döner."""
+        text = ""
+        try:
+            # PDF İşleme
+            if filename.endswith(".pdf"):
+                from pypdf import PdfReader
+                reader = PdfReader(file_path)
+                for page in reader.pages:
+                    text += page.extract_text() + "\n"
+            
+            # TXT ve Markdown İşleme
+            elif filename.endswith((".txt", ".md")):
+                with open(file_path, "r", encoding="utf-8") as f:
+                    text = f.read()
+
+            # DOCX (Word) İşleme
+            elif filename.endswith(".docx"):
+                from docx import Document
+                doc = Document(file_path)
+                text = "\n".join([para.text for para in doc.paragraphs])
+
+            # Excel ve CSV İşleme (Tablosal)
+            elif filename.endswith((".csv", ".xlsx", ".xls")):
+                import pandas as pd
+                if filename.endswith(".csv"):
+                    df = pd.read_csv(file_path)
+                else:
+                    df = pd.read_excel(file_path)
+                
+                # Her satırı bir metin parçasına dönüştür
+                rows_text = []
+                for idx, row in df.iterrows():
+                    row_str = ", ".join([f"{col}: {row[col]}" for col in df.columns])
+                    rows_text.append(row_str)
+                text = "\n".join(rows_text)
+
+        except Exception as e:
+            logger.error(f"[X] {filename} işlenirken hata: {e}")
+            return ""
+        return text
+
     async def ask_question(self, question: str, user_id: str = "unknown") -> str:
         """Kullanıcının sorusunu dökümanlara göre yanıtlar."""
         try:
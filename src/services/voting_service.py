@@ -131,8 +131,7 @@ class VotingService:
                         logger.info(f"[i] ÖNCEKİ OYLAR TEMİZLENDİ | Kullanıcı: {user_id} | Oylama: {poll_id} | Silinen: {deleted_count} oy")
 
                 # 3. Yeni oyu kaydet
-                import uuid
-                vote_id = str(uuid.uuid4())
+                vote_id = self.vote_repo.db_client.new_id()
                 cursor.execute(
                     "INSERT INTO votes (id, poll_id, user_id, option_index) VALUES (?, ?, ?, ?)",
                     (vote_id, poll_id, user_id, option_index)
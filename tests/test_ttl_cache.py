@@ -0,0 +1,45 @@
+"""
+TTL cache testleri.
+"""
+
+import time
+from src.core.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+    """TTLCache testleri."""
+
+    def test_get_set(self):
+        """Saklanan değer geri okunabilmeli."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set(("C1", "U1"), {"is_authorized": True})
+        assert cache.get(("C1", "U1")) == {"is_authorized": True}
+        assert cache.get(("C1", "U2")) is None
+
+    def test_expiry(self):
+        """Süresi dolan kayıt döndürülmemeli."""
+        cache = TTLCache(maxsize=10, ttl=0.05)
+        cache.set("key", "value")
+        time.sleep(0.1)
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_maxsize_evicts_oldest(self):
+        """Kapasite dolunca en eski kayıt çıkarılmalı."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        assert len(cache) == 2
+        assert cache.get("a") is None
+        assert cache.get("c") == 3
+
+    def test_pop_and_clear(self):
+        """Silme işlemleri."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.pop("a")
+        assert cache.get("a") is None
+        cache.clear()
+        assert len(cache) == 0